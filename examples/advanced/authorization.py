@@ -27,7 +27,6 @@ Reference:
 from __future__ import annotations
 
 import asyncio
-import logging
 import time
 from typing import Any
 
@@ -38,11 +37,11 @@ from dedalus_mcp.server.authorization import (
     AuthorizationError,
     AuthorizationProvider,
 )
+from dedalus_mcp.utils import quiet_third_party
 
 
 # Suppress SDK and server logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
 
 
 class TokenIntrospectionProvider(AuthorizationProvider):
@@ -32,11 +32,11 @@ from typing import Any, ClassVar, cast
 from pydantic import BaseModel
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 from dedalus_mcp.utils.logger import ColoredFormatter, Dedalus MCPHandler, get_logger, setup_logger
 
 # Suppress SDK and server logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
 
 try:
     import orjson  # type: ignore[import-not-found]
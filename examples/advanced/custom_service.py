@@ -27,17 +27,18 @@ Reference:
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from dataclasses import dataclass
-import logging
+import time
 from typing import Any
 
 from dedalus_mcp import MCPServer, tool
 from dedalus_mcp.types import CallToolResult
+from dedalus_mcp.utils import quiet_third_party
 
 
 # Suppress SDK and server logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
 
 
 @dataclass
@@ -53,14 +54,14 @@ class MetricsService:
     """Custom capability service for server metrics collection."""
 
     def __init__(self) -> None:
-        self._tool_calls: dict[str, int] = {}
+        self._tool_calls: Counter[str] = Counter()
         self._total_latency_ms: float = 0.0
         self._request_count: int = 0
         self._error_count: int = 0
 
     def record_tool_call(self, tool_name: str, latency_ms: float, error: bool = False) -> None:
         """Record a tool invocation."""
-        self._tool_calls[tool_name] = self._tool_calls.get(tool_name, 0) + 1
+        self._tool_calls[tool_name] += 1
         self._total_latency_ms += latency_ms
         self._request_count += 1
         if error:
@@ -70,9 +71,7 @@ class MetricsService:
         """Return current metrics snapshot."""
         avg_latency = self._total_latency_ms / self._request_count if self._request_count > 0 else 0.0
         error_rate = self._error_count / self._request_count if self._request_count > 0 else 0.0
-        return MetricsSnapshot(
-            tools_called=sum(self._tool_calls.values()), average_latency_ms=avg_latency, error_rate=error_rate
-        )
+        return MetricsSnapshot(tools_called=self._request_count, average_latency_ms=avg_latency, error_rate=error_rate)
 
     def reset(self) -> None:
         """Reset all counters (useful for windowed metrics)."""
@@ -82,6 +81,16 @@ class MetricsService:
         self._error_count = 0
 
 
+def _fib(n: int) -> int:
+    """Return F(n) by fast doubling: O(log n) big-int steps instead of n additions."""
+    a, b = 0, 1  # F(k), F(k + 1), with k built from n's bits high to low
+    for bit in f"{n:b}":
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b  # F(2k + 1)
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a
+
+
 class ExtendedMCPServer(MCPServer):
     """MCPServer with injected metrics capability."""
 
@@ -94,8 +103,6 @@ class ExtendedMCPServer(MCPServer):
 
         async def wrapped_call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
             """Intercept tool calls for metrics collection."""
-            import time
-
             start_ms = time.perf_counter() * 1000
             error = False
             try:
@@ -124,10 +131,7 @@ async def main() -> None:
             """Fibonacci computation (intentionally synchronous for demo)."""
             if n <= 1:
                 return n
-            a, b = 0, 1
-            for _ in range(2, n + 1):
-                a, b = b, a + b
-            return b
+            return _fib(n)
 
         @tool(description="Get current metrics")
         async def get_metrics() -> dict[str, Any]:
@@ -27,19 +27,23 @@ from __future__ import annotations
 
 import asyncio
 import json
-import logging
 from pathlib import Path
 from typing import Any
 
 import anyio
+from anyio.streams.buffered import BufferedByteReceiveStream
 
 from dedalus_mcp import MCPServer, tool
 from dedalus_mcp.server.transports.base import BaseTransport
+from dedalus_mcp.utils import quiet_third_party
 
 
 # Suppress SDK and server logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
+
+# Upper bound on a single newline-delimited message; larger frames close the connection.
+MAX_MESSAGE_BYTES = 1 << 20
+FRAME_DELIMITER = b"\n"
 
 
 class UnixSocketTransport(BaseTransport):
@@ -65,22 +69,31 @@ class UnixSocketTransport(BaseTransport):
         async def handle_connection(stream: anyio.abc.SocketStream) -> None:
             """Handle a single client connection."""
             async with stream:
-                # Wrap the raw socket stream for JSON-RPC
-                reader = anyio.wrap_file(stream)  # type: ignore
-                writer = anyio.wrap_file(stream)  # type: ignore
+                # Buffer partial reads: one message may span many socket reads
+                buffered = BufferedByteReceiveStream(stream)
 
                 # Minimal JSON-RPC framing: newline-delimited JSON
-                async for line in reader:
+                while True:
+                    try:
+                        line = await buffered.receive_until(FRAME_DELIMITER, MAX_MESSAGE_BYTES)
+                    except (anyio.EndOfStream, anyio.IncompleteRead):
+                        return
+                    except anyio.DelimiterNotFound:
+                        self._server._logger.warning(f"Message exceeds {MAX_MESSAGE_BYTES} bytes; closing connection")
+                        return
+
+                    # json.loads takes the raw bytes; no intermediate str decode
                     try:
                         message = json.loads(line)
-                        # In a real implementation, dispatch to server._handle_request
-                        # For this stub, echo back
-                        response = {"jsonrpc": "2.0", "id": message.get("id"), "result": "stub"}
-                        await writer.write(json.dumps(response) + "\n")
                     except json.JSONDecodeError:
-                        self._server._logger.warning(f"Invalid JSON received: {line}")
+                        self._server._logger.warning(f"Invalid JSON received: {line!r}")
                         continue
 
+                    # In a real implementation, dispatch to server._handle_request
+                    # For this stub, echo back
+                    response = {"jsonrpc": "2.0", "id": message.get("id"), "result": "stub"}
+                    await stream.send(json.dumps(response, separators=(",", ":")).encode() + FRAME_DELIMITER)
+
         listener = await anyio.create_unix_listener(socket_path)
         async with listener:
             self._server._logger.info(f"Listening on {socket_path}")
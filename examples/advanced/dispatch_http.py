@@ -154,15 +154,15 @@ if __name__ == "__main__":
 
     print("1. Single-connection server (GitHub):")
     gh = create_github_server()
-    print(f"   connections: {list(gh.connections.keys())}")
-    print(f"   tools: {gh.tool_names}\n")
+    print(f"   connections: {', '.join(gh.connections)}")
+    print(f"   tools: {', '.join(gh.tool_names)}\n")
 
     print("2. Multi-connection server:")
     multi = create_multi_api_server()
-    print(f"   connections: {list(multi.connections.keys())}")
-    print(f"   tools: {multi.tool_names}\n")
+    print(f"   connections: {', '.join(multi.connections)}")
+    print(f"   tools: {', '.join(multi.tool_names)}\n")
 
     print("3. Robust error handling:")
     robust = create_robust_server()
-    print(f"   connections: {list(robust.connections.keys())}")
-    print(f"   tools: {robust.tool_names}")
+    print(f"   connections: {', '.join(robust.connections)}")
+    print(f"   tools: {', '.join(robust.tool_names)}")
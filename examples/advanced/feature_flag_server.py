@@ -6,8 +6,8 @@ notifications/tools/list_changed after each mutation.
 
 Pattern:
 1. Create server with allow_dynamic_tools=True
-2. Use server.binding() to register/unregister tools
-3. Call server.notify_tools_list_changed() after mutations
+2. Decorate every tool once at import and collect() them at bootstrap
+3. Toggle exposure with server.allow_tools(); call server.notify_tools_list_changed() after
 4. Clients receive tools/list_changed notifications
 
 When to use this pattern:
@@ -24,48 +24,61 @@ Reference:
 from __future__ import annotations
 
 import asyncio
-import logging
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
 # Suppress SDK and server logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
 
 
 server = MCPServer("feature-flagged", allow_dynamic_tools=True)
 _flag_enabled = False
+_notify_scheduled = False
 
+# Flag flips landing within this window share one tools/list_changed notification
+NOTIFY_DEBOUNCE = 0.1
 
-def bootstrap() -> MCPServer:
-    """Register the baseline tool set."""
-    with server.binding():
 
-        @tool(description="Ping the server")
-        def ping() -> str:
-            return "pong"
+BASELINE_TOOLS = ("ping",)
 
-    return server
 
+@tool(description="Ping the server")
+def ping() -> str:
+    return "pong"
 
-async def set_feature(*, enabled: bool = False) -> None:
-    """Toggle the experimental search tool at runtime."""
-    global _flag_enabled
-    _flag_enabled = enabled
 
-    with server.binding():
+@tool(description="Experimental semantic search")
+async def search(query: str) -> str:
+    return f"results for {query}"
 
-        @tool(description="Ping the server")
-        def ping() -> str:
-            return "pong"
 
-        if _flag_enabled:
+def bootstrap() -> MCPServer:
+    """Register every tool once; the flag only decides which ones are exposed."""
+    server.collect(ping, search)
+    server.allow_tools(BASELINE_TOOLS)
+    return server
+
+
+async def set_feature(*, enabled: bool = False) -> None:
+    """Toggle the experimental search tool at runtime.
+
+    The first toggle in a burst waits out NOTIFY_DEBOUNCE and then notifies once
+    for the final state; toggles arriving meanwhile only update the allow-list.
+    """
+    global _flag_enabled, _notify_scheduled
+    _flag_enabled = enabled
 
-            @tool(description="Experimental semantic search")
-            async def search(query: str) -> str:
-                return f"results for {query}"
+    server.allow_tools((*BASELINE_TOOLS, "search") if _flag_enabled else BASELINE_TOOLS)
+    if _notify_scheduled:
+        return
 
+    _notify_scheduled = True
+    try:
+        await asyncio.sleep(NOTIFY_DEBOUNCE)
+    finally:
+        _notify_scheduled = False
     await server.notify_tools_list_changed()
 
 
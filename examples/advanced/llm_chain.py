@@ -50,7 +50,6 @@ Requires: pip install fastapi httpx-sse (or uv pip install)
 
 import asyncio
 import json
-import logging
 
 import anyio
 import httpx
@@ -62,11 +61,10 @@ import uvicorn
 
 from dedalus_mcp import MCPServer, get_context, tool
 from dedalus_mcp.client import MCPClient
+from dedalus_mcp.utils import quiet_third_party
 
 
-# Suppress noise
-for name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 
 # ============================================================================
@@ -119,6 +117,9 @@ llm_app = Starlette(routes=[Route("/v1/completions", llm_endpoint, methods=["POS
 
 server_a = MCPServer("llm-wrapper", instructions="I wrap an LLM streaming endpoint")
 
+# Shared keep-alive pool to the LLM endpoint (initialized at startup)
+llm_http: httpx.AsyncClient | None = None
+
 
 @tool(description="Generate text using the LLM")
 async def generate(prompt: str, max_tokens: int = 100) -> dict:
@@ -126,20 +127,22 @@ async def generate(prompt: str, max_tokens: int = 100) -> dict:
     ctx = get_context()
     await ctx.info(f"Calling LLM with prompt: {prompt[:50]}...")
 
+    if llm_http is None:
+        return {"error": "LLM endpoint client not started"}
+
     full_response = ""
 
-    async with httpx.AsyncClient() as client:
-        async with client.stream("POST", "http://127.0.0.1:8002/v1/completions", json={"prompt": prompt}) as response:
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    data = line[6:]
-                    if data == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data)
-                        full_response += chunk.get("text", "")
-                    except json.JSONDecodeError:
-                        pass
+    async with llm_http.stream("POST", "http://127.0.0.1:8002/v1/completions", json={"prompt": prompt}) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                    full_response += chunk.get("text", "")
+                except json.JSONDecodeError:
+                    pass
 
     await ctx.info(f"LLM response: {len(full_response)} chars")
     return {"response": full_response, "tokens_used": len(full_response.split())}
@@ -224,7 +227,12 @@ async def start_llm_service() -> None:
 
 async def start_server_a() -> None:
     """Start MCP Server A (LLM wrapper) on :8000."""
-    await server_a.serve(port=8000)
+    global llm_http
+
+    # One pooled client for every generate call: bursts reuse warm sockets
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(10.0, connect=2.0)) as llm_http:
+        await server_a.serve(port=8000)
 
 
 async def start_server_b() -> None:
@@ -27,14 +27,13 @@ Reference:
 from __future__ import annotations
 
 import asyncio
-import logging
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
 # Suppress SDK and server logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
 
 
 # Shared tool function that will be registered on multiple servers
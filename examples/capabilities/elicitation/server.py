@@ -20,14 +20,13 @@ Usage:
 """
 
 import asyncio
-import logging
 
 from dedalus_mcp import MCPServer, get_context, tool
 from dedalus_mcp.types import ElicitRequestParams
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("elicitation-demo", instructions="I may ask for user confirmation")
 
@@ -13,14 +13,13 @@ Usage:
 
 import asyncio
 from datetime import datetime
-import logging
 
 from dedalus_mcp import MCPServer, prompt
 from dedalus_mcp.types import PromptMessage, TextContent
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("prompts-demo")
 
@@ -44,21 +43,29 @@ Be constructive and explain your reasoning.""",
     ]
 
 
+# Messages that never change can be built once and returned on every request;
+# the server passes PromptMessage instances through without copying them.
+_DEBUG_SYSTEM_MESSAGE = PromptMessage(
+    role="assistant",
+    content=TextContent(
+        type="text",
+        text="""You are a debugging expert. Analyze errors systematically:
+1. Identify the root cause
+2. Explain why it happened
+3. Provide a fix
+4. Suggest how to prevent it in the future""",
+    ),
+)
+
+
 # Prompt with user context
 @prompt(name="debug-helper", description="Help debug an error")
-def debug_helper_prompt(args: dict) -> list[dict]:
+def debug_helper_prompt(args: dict) -> list:
     error = args.get("error", "Unknown error")
     context = args.get("context", "No additional context")
 
     return [
-        {
-            "role": "assistant",
-            "content": """You are a debugging expert. Analyze errors systematically:
-1. Identify the root cause
-2. Explain why it happened
-3. Provide a fix
-4. Suggest how to prevent it in the future""",
-        },
+        _DEBUG_SYSTEM_MESSAGE,
         {"role": "user", "content": f"I'm getting this error:\n\n```\n{error}\n```\n\nContext: {context}"},
     ]
 
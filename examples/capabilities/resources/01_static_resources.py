@@ -11,13 +11,13 @@ Usage:
 """
 
 import asyncio
-import logging
+import json
 
 from dedalus_mcp import MCPServer, resource
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("static-resources")
 
@@ -37,22 +37,21 @@ Available resources:
 """
 
 
-# JSON resource
-@resource(uri="config://app/settings", name="App Settings", mime_type="application/json")
-def app_settings() -> dict:
-    return {
+# These payloads never change while the server runs, so they are encoded to
+# compact JSON once here. Returning a dict would re-serialize it on every read.
+_APP_SETTINGS_JSON = json.dumps(
+    {
         "app_name": "Example App",
         "version": "1.0.0",
         "debug": False,
         "features": {"analytics": True, "notifications": True, "dark_mode": False},
         "limits": {"max_requests": 1000, "timeout_seconds": 30},
-    }
+    },
+    separators=(",", ":"),
+)
 
-
-# Schema definition
-@resource(uri="schema://user", name="User Schema", mime_type="application/json")
-def user_schema() -> dict:
-    return {
+_USER_SCHEMA_JSON = json.dumps(
+    {
         "$schema": "http://json-schema.org/draft-07/schema#",
         "type": "object",
         "properties": {
@@ -62,7 +61,21 @@ def user_schema() -> dict:
             "role": {"type": "string", "enum": ["user", "admin", "moderator"]},
         },
         "required": ["id", "name", "email"],
-    }
+    },
+    separators=(",", ":"),
+)
+
+
+# JSON resource
+@resource(uri="config://app/settings", name="App Settings", mime_type="application/json")
+def app_settings() -> str:
+    return _APP_SETTINGS_JSON
+
+
+# Schema definition
+@resource(uri="schema://user", name="User Schema", mime_type="application/json")
+def user_schema() -> str:
+    return _USER_SCHEMA_JSON
 
 
 # Markdown documentation
@@ -91,81 +104,17 @@ Update application settings.
 """
 
 
+# Minimal 1x1 transparent PNG, built once at import instead of on every read
+_LOGO_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000a49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+)
+
+
 # Binary resource (base64 encoded in MCP)
 @resource(uri="assets://logo.png", name="Logo", mime_type="image/png")
 def logo() -> bytes:
-    # Minimal 1x1 transparent PNG
-    return bytes(
-        [
-            0x89,
-            0x50,
-            0x4E,
-            0x47,
-            0x0D,
-            0x0A,
-            0x1A,
-            0x0A,
-            0x00,
-            0x00,
-            0x00,
-            0x0D,
-            0x49,
-            0x48,
-            0x44,
-            0x52,
-            0x00,
-            0x00,
-            0x00,
-            0x01,
-            0x00,
-            0x00,
-            0x00,
-            0x01,
-            0x08,
-            0x06,
-            0x00,
-            0x00,
-            0x00,
-            0x1F,
-            0x15,
-            0xC4,
-            0x89,
-            0x00,
-            0x00,
-            0x00,
-            0x0A,
-            0x49,
-            0x44,
-            0x41,
-            0x54,
-            0x78,
-            0x9C,
-            0x63,
-            0x00,
-            0x01,
-            0x00,
-            0x00,
-            0x05,
-            0x00,
-            0x01,
-            0x0D,
-            0x0A,
-            0x2D,
-            0xB4,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-            0x49,
-            0x45,
-            0x4E,
-            0x44,
-            0xAE,
-            0x42,
-            0x60,
-            0x82,
-        ]
-    )
+    return _LOGO_PNG
 
 
 server.collect(readme, app_settings, user_schema, api_docs, logo)
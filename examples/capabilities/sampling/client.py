@@ -20,14 +20,13 @@ Usage:
 """
 
 import asyncio
-import logging
 
 from dedalus_mcp.client import ClientCapabilitiesConfig, MCPClient
 from dedalus_mcp.types import CreateMessageResult, TextContent
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 
 # ============================================================================
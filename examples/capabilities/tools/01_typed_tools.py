@@ -16,16 +16,15 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-import logging
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("typed-tools")
 
@@ -12,13 +12,12 @@ Usage:
 """
 
 import asyncio
-import logging
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("tagged-tools", allow_dynamic_tools=True)
 
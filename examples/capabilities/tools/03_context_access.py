@@ -11,16 +11,20 @@ Usage:
 """
 
 import asyncio
-import logging
+
+import anyio
 
 from dedalus_mcp import MCPServer, get_context, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("context-demo")
 
+# Seconds between progress updates while a tool waits on a single deadline
+PROGRESS_INTERVAL = 2.0
+
 
 @tool(description="Show current session info")
 async def whoami() -> dict:
@@ -85,12 +89,40 @@ async def batch_process(items: list[str]) -> dict:
     return {"processed": processed, "count": len(processed)}
 
 
-server.collect(whoami, process_with_logging, long_task, batch_process)
+@tool(description="Sleep with periodic progress")
+async def sleep(seconds: float) -> dict:
+    """Wait once for the full duration while a side task reports progress.
+
+    The wait itself is a single timer; only the reporter wakes up, every
+    PROGRESS_INTERVAL seconds, instead of the tool polling once per second.
+    """
+    ctx = get_context()
+
+    async with ctx.progress(total=seconds) as tracker:
+        start = anyio.current_time()
+
+        async def report() -> None:
+            while True:
+                await anyio.sleep(PROGRESS_INTERVAL)
+                elapsed = anyio.current_time() - start
+                await tracker.set(min(elapsed, seconds), message=f"{elapsed:.0f}s / {seconds:.0f}s")
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(report)
+            await anyio.sleep(seconds)
+            tg.cancel_scope.cancel()
+
+        await tracker.set(seconds, message="Done")
+
+    return {"slept": seconds}
+
+
+server.collect(whoami, process_with_logging, long_task, batch_process, sleep)
 
 if __name__ == "__main__":
     print("Context demo server: http://127.0.0.1:8000/mcp")
     print("\nContext features demonstrated:")
     print("  - Request/session metadata (whoami)")
     print("  - Structured logging (process_with_logging)")
-    print("  - Progress tracking (long_task, batch_process)")
+    print("  - Progress tracking (long_task, batch_process, sleep)")
     asyncio.run(server.serve())
@@ -11,6 +11,7 @@ Pattern:
 - MCPClient.connect() returns an already-initialized client
 - Use client methods directly (list_tools, call_tool, etc.)
 - Call close() when done, or use async with for automatic cleanup
+- Pass http_client= to reuse one connection pool across connects
 
 When to use:
 - Scripts that need MCP functionality
@@ -29,7 +30,7 @@ from __future__ import annotations
 
 import asyncio
 
-from dedalus_mcp.client import MCPClient
+from dedalus_mcp.client import MCPClient, create_http_client
 
 
 SERVER_URL = "http://127.0.0.1:8000/mcp"
@@ -64,5 +65,19 @@ async def main_with_context() -> None:
         print(f"Tools: {[t.name for t in tools.tools]}")
 
 
+async def main_with_shared_pool() -> None:
+    """Alternative: reuse one httpx connection pool across sequential connects.
+
+    MCPClient never closes a caller-supplied http_client, so later connects
+    skip the TCP (and TLS) handshake by picking up pooled keep-alive sockets.
+    """
+    async with create_http_client() as http_client:
+        for a, b in [(1, 2), (5, 3)]:
+            async with await MCPClient.connect(SERVER_URL, http_client=http_client) as client:
+                result = await client.call_tool("add", {"a": a, "b": b})
+                print(f"add({a}, {b}) = {result.content}")
+
+
 if __name__ == "__main__":
     asyncio.run(main())
+    asyncio.run(main_with_shared_pool())
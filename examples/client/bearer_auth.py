@@ -27,7 +27,7 @@ Usage:
 
 from __future__ import annotations
 
-from dedalus_mcp.client import BearerAuth, MCPClient
+from dedalus_mcp.client import BearerAuth, MCPClient, create_http_client
 
 
 # In production: obtain from authorization server
@@ -73,6 +73,19 @@ async def with_token_refresh() -> None:
         await client.close()
 
 
+async def with_shared_pool() -> None:
+    """Reuse one pooled HTTP client across sequential connects.
+
+    Auth lives on the shared client, so every connect reuses the warm
+    keep-alive sockets instead of paying a fresh TLS handshake.
+    """
+    auth = BearerAuth(access_token=ACCESS_TOKEN)
+    async with create_http_client(auth=auth) as http_client:
+        for _ in range(2):
+            async with await MCPClient.connect(SERVER_URL, http_client=http_client) as client:
+                await client.list_tools()
+
+
 async def refresh_token() -> str:
     """Placeholder: implement your OAuth refresh flow."""
     return "refreshed_token"
@@ -16,7 +16,7 @@ from __future__ import annotations
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import ec
 
-from dedalus_mcp.client import DPoPAuth, MCPClient
+from dedalus_mcp.client import DPoPAuth, MCPClient, create_http_client
 
 
 # In production: load from secure storage
@@ -86,6 +86,19 @@ async def with_server_nonce() -> None:
         await client.close()
 
 
+async def with_shared_pool() -> None:
+    """Reuse one pooled HTTP client across sequential connects.
+
+    Each request still carries a freshly signed proof; only the TCP+TLS
+    handshake is amortized.
+    """
+    auth = DPoPAuth(access_token=ACCESS_TOKEN, dpop_key=DPOP_KEY)
+    async with create_http_client(auth=auth) as http_client:
+        for _ in range(2):
+            async with await MCPClient.connect(SERVER_URL, http_client=http_client) as client:
+                await client.list_tools()
+
+
 async def refresh_token_from_as() -> str:
     """Placeholder: implement your OAuth refresh flow."""
     return "refreshed_token"
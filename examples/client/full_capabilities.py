@@ -10,62 +10,45 @@ Pattern: Combine multiple capability handlers in ClientCapabilitiesConfig.
 
 Spec: https://modelcontextprotocol.io/specification/2025-06-18/
 
+Sampling and shutdown handling are imported from sampling_handler.py, so its
+Anthropic settings (ANTHROPIC_RPM / ANTHROPIC_TPM pacing) apply here too.
+
 Run: export ANTHROPIC_API_KEY=your-key && uv run python examples/client/full_capabilities.py
 """
 
 from __future__ import annotations
 
-import os
+import logging
 from pathlib import Path
+import sys
+from typing import Any
 
-import anthropic
 import anyio
+from sampling_handler import sampling_handler, wait_for_shutdown
 
 from dedalus_mcp.client import ClientCapabilitiesConfig, open_connection
-from dedalus_mcp.types import (
-    ClientRequest,
-    CreateMessageRequestParams,
-    CreateMessageResult,
-    ElicitRequestParams,
-    ElicitResult,
-    ErrorData,
-    ListToolsRequest,
-    ListToolsResult,
-    LoggingMessageNotificationParams,
-    Role,
-    Root,
-    StopReason,
-    TextContent,
-)
+from dedalus_mcp.types import ElicitRequestParams, ElicitResult, ErrorData, LoggingMessageNotificationParams, Root
 
 
-SERVER_URL = "http://127.0.0.1:8000/mcp"
+# Shared example helpers live in examples/patterns/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from patterns.tool_cache import list_tools_cached
 
 
-async def sampling_handler(_context: object, params: CreateMessageRequestParams) -> CreateMessageResult | ErrorData:
-    """Handle sampling requests with Anthropic API."""
-    try:
-        client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+SERVER_URL = "http://127.0.0.1:8000/mcp"
+CWD_URI = Path.cwd().as_uri()
+TMP_URI = Path("/tmp").as_uri()
 
-        messages = [
-            {"role": msg.role, "content": msg.content.text if hasattr(msg.content, "text") else str(msg.content)}
-            for msg in params.messages
-        ]
 
-        model = "claude-3-5-sonnet-20241022"
-        if params.modelPreferences and params.modelPreferences.hints:
-            model = params.modelPreferences.hints[0].name
+_DEMO_VALUES: dict[str, object] = {"boolean": True, "integer": 42, "number": 42}
 
-        response = await client.messages.create(model=model, messages=messages, max_tokens=params.maxTokens or 1024)
 
-        return CreateMessageResult(
-            model=response.model,
-            content=TextContent(type="text", text=response.content[0].text),
-            role=Role.assistant,
-            stopReason=StopReason.endTurn,
-        )
-    except Exception as e:
-        return ErrorData(code=-32603, message=f"Sampling failed: {e}")
+def _demo_value(field_schema: dict[str, Any]) -> object:
+    """Pick a demo answer for one field; ``type`` may be a list such as ``["integer", "null"]``."""
+    field_type = field_schema.get("type", "string")
+    if isinstance(field_type, list):
+        field_type = next((t for t in field_type if t != "null"), "string")
+    return _DEMO_VALUES.get(field_type, "demo-value")
 
 
 async def elicitation_handler(_context: object, params: ElicitRequestParams) -> ElicitResult | ErrorData:
@@ -73,29 +56,39 @@ async def elicitation_handler(_context: object, params: ElicitRequestParams) ->
     try:
         print(f"\n{'=' * 60}\nServer requests: {params.message}\n{'=' * 60}\n")
         properties = params.requestedSchema.get("properties", {})
-        content: dict[str, object] = {}
-        for field_name, field_schema in properties.items():
-            field_type = field_schema.get("type", "string")
-            content[field_name] = (
-                True if field_type == "boolean" else 42 if field_type in ("integer", "number") else "demo-value"
-            )
+        content = {field_name: _demo_value(field_schema) for field_name, field_schema in properties.items()}
         return ElicitResult(action="accept", content=content)
     except Exception as e:
         return ErrorData(code=-32603, message=f"Elicitation failed: {e}")
 
 
+_server_log = logging.getLogger("full_capabilities.server")
+
+# MCP uses syslog severities; fold the extras onto stdlib levels
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "notice": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "alert": logging.CRITICAL,
+    "emergency": logging.CRITICAL,
+}
+
+
 def logging_handler(params: LoggingMessageNotificationParams) -> None:
-    """Handle logging notifications from server."""
-    level = params.level.upper() if params.level else "INFO"
-    print(f"[SERVER {level}] {params.data or params.logger}")
+    """Handle logging notifications from server.
+
+    Lazy %-formatting means filtered-out levels never build a string.
+    """
+    _server_log.log(_LEVELS.get(params.level, logging.INFO), "%s", params.data or params.logger)
 
 
 async def main() -> None:
     """Connect with all client capabilities enabled."""
-    initial_roots = [
-        Root(uri=Path.cwd().as_uri(), name="Working Directory"),
-        Root(uri=Path("/tmp").as_uri(), name="Temp"),
-    ]
+    logging.basicConfig(level=logging.INFO, format="[SERVER %(levelname)s] %(message)s")
+    initial_roots = [Root(uri=CWD_URI, name="Working Directory"), Root(uri=TMP_URI, name="Temp")]
     capabilities = ClientCapabilitiesConfig(
         sampling=sampling_handler,
         elicitation=elicitation_handler,
@@ -120,13 +113,14 @@ async def main() -> None:
             for root in await client.list_roots():
                 print(f"    - {root.name}: {root.uri}")
 
-        tools = (await client.send_request(ClientRequest(ListToolsRequest()), ListToolsResult)).tools
+        tools = (await list_tools_cached(client, SERVER_URL)).tools
         print(f"\nAvailable tools: {len(tools)}")
         for tool in tools[:5]:
             print(f"  - {tool.name}: {tool.description or 'no description'}")
 
         print("\nClient ready. Server can now use all advertised capabilities.")
-        await anyio.sleep(30)
+        print("Press Ctrl+C to disconnect.")
+        await wait_for_shutdown(client)
 
 
 if __name__ == "__main__":
@@ -38,16 +38,15 @@ from dedalus_mcp.types import Root
 
 SERVER_URL = "http://127.0.0.1:8000/mcp"
 
+# Root URIs don't change between connections; resolve and percent-encode them once
+PROJECT_URI = Path.cwd().as_uri()
+TEMP_URI = Path("/tmp").as_uri()
+HOME_URI = Path.home().as_uri()
+
 
 async def main() -> None:
     """Connect to a server with filesystem roots configured."""
-    project_root = Path.cwd()
-    temp_dir = Path("/tmp")
-
-    initial_roots = [
-        Root(uri=project_root.as_uri(), name="Project Directory"),
-        Root(uri=temp_dir.as_uri(), name="Temporary Files"),
-    ]
+    initial_roots = [Root(uri=PROJECT_URI, name="Project Directory"), Root(uri=TEMP_URI, name="Temporary Files")]
 
     capabilities = ClientCapabilitiesConfig(enable_roots=True, initial_roots=initial_roots)
 
@@ -62,7 +61,7 @@ async def main() -> None:
         await anyio.sleep(2)
         print("\nAdding new root...")
 
-        new_roots = initial_roots + [Root(uri=Path.home().as_uri(), name="Home Directory")]
+        new_roots = initial_roots + [Root(uri=HOME_URI, name="Home Directory")]
         await client.update_roots(new_roots, notify=True)
 
         print("Updated roots:")
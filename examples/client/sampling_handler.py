@@ -13,6 +13,9 @@ Pattern:
 3. Respect model preferences from params
 4. Return CreateMessageResult or ErrorData
 
+Direct Messages calls are paced to 80% of ANTHROPIC_RPM / ANTHROPIC_TPM
+(defaults 40 / 16000) so bursts queue locally instead of tripping 429s.
+
 When to use this pattern:
 - Servers need LLM completions during tool execution
 - Multi-step reasoning workflows requiring delegation
@@ -29,46 +32,150 @@ Run with:
 
 from __future__ import annotations
 
+import functools
 import os
+import signal
+import sys
+import time
+from typing import Any
 
 import anthropic
 import anyio
+import httpx
 
-from dedalus_mcp.client import ClientCapabilitiesConfig, open_connection
-from dedalus_mcp.types import CreateMessageRequestParams, CreateMessageResult, ErrorData, Role, StopReason, TextContent
+from dedalus_mcp.client import ClientCapabilitiesConfig, MCPClient, open_connection
+from dedalus_mcp.types import CreateMessageRequestParams, CreateMessageResult, ErrorData, SamplingMessage, TextContent
 
 
 SERVER_URL = "http://127.0.0.1:8000/mcp"
+DEFAULT_MODEL = sys.intern("claude-3-5-sonnet-20241022")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> anthropic.AsyncAnthropic:
+    """Build the Anthropic client once so sampling calls share its keep-alive pool."""
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    return anthropic.AsyncAnthropic(
+        api_key=os.environ["ANTHROPIC_API_KEY"], http_client=httpx.AsyncClient(limits=limits)
+    )
+
+
+class RateGovernor:
+    """Token bucket pacing Messages calls to a fraction of the account's RPM/TPM limits.
+
+    Waiting here up front replaces a burst of 429s and client-side retry backoff
+    with a steady request rate.
+    """
+
+    def __init__(self, *, rpm: int, tpm: int, headroom: float = 0.8) -> None:
+        self._rpm_cap = rpm * headroom
+        self._tpm_cap = tpm * headroom
+        self._requests = self._rpm_cap
+        self._tokens = self._tpm_cap
+        self._updated = time.monotonic()
+        self._lock = anyio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        tokens = min(tokens, self._tpm_cap)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed, self._updated = now - self._updated, now
+                self._requests = min(self._rpm_cap, self._requests + elapsed * self._rpm_cap / 60)
+                self._tokens = min(self._tpm_cap, self._tokens + elapsed * self._tpm_cap / 60)
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                await anyio.sleep(
+                    max((1 - self._requests) * 60 / self._rpm_cap, (tokens - self._tokens) * 60 / self._tpm_cap)
+                )
+
+
+_governor = RateGovernor(
+    rpm=int(os.environ.get("ANTHROPIC_RPM", "40")), tpm=int(os.environ.get("ANTHROPIC_TPM", "16000"))
+)
+
+
+async def _create_message(**request: Any) -> anthropic.types.Message:
+    """Stream a Messages call once the governor admits the estimated token cost.
+
+    Streaming reads the reply as it is generated, so long completions neither
+    hit the non-streaming request timeout nor hold one big body in flight.
+    """
+    text = request.get("system", "") + "".join(m["content"] for m in request["messages"])
+    await _governor.acquire(len(text) // 4 + request["max_tokens"])
+    async with _get_client().messages.stream(**request) as stream:
+        return await stream.get_final_message()
+
+
+def _to_anthropic_messages(messages: list[SamplingMessage]) -> list[dict[str, str]]:
+    """Convert MCP sampling messages to Anthropic's role/content dicts."""
+    return [
+        {"role": msg.role, "content": msg.content.text if isinstance(msg.content, TextContent) else str(msg.content)}
+        for msg in messages
+    ]
 
 
 async def sampling_handler(_context: object, params: CreateMessageRequestParams) -> CreateMessageResult | ErrorData:
     """Handle sampling/createMessage requests by invoking Anthropic API."""
     try:
-        client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-
-        messages = [
-            {"role": msg.role, "content": msg.content.text if hasattr(msg.content, "text") else str(msg.content)}
-            for msg in params.messages
-        ]
+        messages = _to_anthropic_messages(params.messages)
 
-        model = "claude-3-5-sonnet-20241022"
-        if params.modelPreferences and params.modelPreferences.hints:
-            model = params.modelPreferences.hints[0].name
+        hints = params.modelPreferences.hints if params.modelPreferences else None
+        model = hints[0].name if hints else DEFAULT_MODEL
 
-        response = await client.messages.create(model=model, messages=messages, max_tokens=params.maxTokens or 1024)
+        max_tokens = params.maxTokens or 1024
+        request = {"model": model, "messages": messages, "max_tokens": max_tokens}
+        if params.systemPrompt:
+            request["system"] = params.systemPrompt
+        response = await _create_message(**request)
 
         text_content = response.content[0].text if response.content else ""
-        return CreateMessageResult(
+        # The SDK already produced validated strings; skip a second pydantic pass
+        return CreateMessageResult.model_construct(
             model=response.model,
-            content=TextContent(type="text", text=text_content),
-            role=Role.assistant,
-            stopReason=(StopReason.endTurn if response.stop_reason == "end_turn" else StopReason.maxTokens),
+            content=TextContent.model_construct(type="text", text=text_content),
+            role="assistant",
+            stopReason="endTurn" if response.stop_reason == "end_turn" else "maxTokens",
         )
 
     except Exception as e:
         return ErrorData(code=-32603, message=f"Sampling failed: {e}")
 
 
+PING_INTERVAL = 15.0
+
+
+async def wait_for_shutdown(client: MCPClient) -> None:
+    """Block until SIGINT/SIGTERM, or until the server stops answering pings."""
+    async with anyio.create_task_group() as tg:
+
+        async def until_signal() -> None:
+            try:
+                with anyio.open_signal_receiver(signal.SIGINT, signal.SIGTERM) as signals:
+                    async for _ in signals:
+                        break
+            except NotImplementedError:
+                # No loop signal handlers on Windows; Ctrl+C arrives as KeyboardInterrupt instead
+                await anyio.sleep_forever()
+            tg.cancel_scope.cancel()
+
+        async def until_session_closes() -> None:
+            while True:
+                await anyio.sleep(PING_INTERVAL)
+                try:
+                    with anyio.fail_after(PING_INTERVAL):
+                        await client.ping()
+                except Exception:
+                    print("Server closed the session.")
+                    break
+            tg.cancel_scope.cancel()
+
+        tg.start_soon(until_signal)
+        tg.start_soon(until_session_closes)
+
+
 async def main() -> None:
     """Connect to a server that uses sampling and handle its requests."""
     capabilities = ClientCapabilitiesConfig(sampling=sampling_handler)
@@ -76,7 +183,8 @@ async def main() -> None:
     async with open_connection(url=SERVER_URL, transport="streamable-http", capabilities=capabilities) as client:
         print("Connected with sampling capability enabled")
         print(f"Server info: {client.initialize_result.serverInfo.name}")
-        await anyio.sleep(60)
+        print("Press Ctrl+C to disconnect.")
+        await wait_for_shutdown(client)
 
 
 if __name__ == "__main__":
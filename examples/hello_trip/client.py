@@ -16,16 +16,26 @@ Run after starting ``server.py`` in another shell::
     uv run python examples/hello_trip/client.py
 
 Expected output: connection info, tool list, tool result, resource content, and prompt template.
+
+The tool list is cached on disk for five minutes by ``examples/patterns/tool_cache.py``,
+so repeat runs skip the tools/list round-trip.
 """
 
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
+import sys
 
 from dedalus_mcp import MCPClient
 from dedalus_mcp.client import lambda_http_client
 
 
+# Shared example helpers live in examples/patterns/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from patterns.tool_cache import list_tools_cached
+
+
 SERVER_URL = "http://127.0.0.1:8000/mcp"
 
 
@@ -38,20 +48,22 @@ async def main() -> None:
         # Protocol handshake per lifecycle-phases.md
         print("Connected. Protocol version:", client.initialize_result.protocolVersion)
 
-        # List tools (tools/list per tools-list.md)
-        tools = await client.session.list_tools()
+        # Discovery: tools/list, resources/list and prompts/list are independent,
+        # so issue them together and pay one round-trip instead of three.
+        tools, resources, prompts = await asyncio.gather(
+            list_tools_cached(client, SERVER_URL), client.session.list_resources(), client.session.list_prompts()
+        )
         print("Tools:", [tool.name for tool in tools.tools])
         for tool_def in tools.tools:
             print("Tool schema:", tool_def.outputSchema)
+        print("Resources:", [res.uri for res in resources.resources])
+        print("Prompts:", [prompt.name for prompt in prompts.prompts])
 
         # Call tool (tools/call per tools-call.md)
         result = await client.session.call_tool("plan_trip", {"destination": "Barcelona", "days": 5, "budget": 2500})
         print("plan_trip result:", result.structuredContent or result.content)
 
-        # List and read resources (resources-list.md, resources-read.md)
-        resources = await client.session.list_resources()
-        print("Resources:", [res.uri for res in resources.resources])
-
+        # Read resource (resources-read.md)
         resource_uri = str(resources.resources[0].uri) if resources.resources else None
         resource = await client.session.read_resource(resource_uri) if resource_uri else None
         if resource and resource.contents:
@@ -0,0 +1,195 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Keep one MCP session open across CLI invocations.
+
+``client.py`` pays for a TCP connection and the MCP initialize handshake on
+every run. For shell loops that call tools repeatedly, this script runs a small
+daemon (like an ``ssh -M`` control master) that holds a single initialized
+``MCPClient`` and relays requests to it over a Unix socket.
+
+The first ``list`` or ``call`` starts the daemon in the background if its socket
+is missing; later invocations reuse the already-initialized session and its
+HTTP connection pool. A lock file makes concurrent first invocations share one
+daemon, and the daemon's stderr goes to a log file next to the socket, so a
+failed start reports its error instead of a bare timeout. All three live in a
+per-user directory with mode 0700, so other local users cannot claim the
+socket name or plant links there.
+
+Usage::
+
+    uv run python examples/hello_trip/server.py                 # Terminal 1
+    uv run python examples/hello_trip/client_daemon.py list     # Terminal 2
+    uv run python examples/hello_trip/client_daemon.py call plan_trip \\
+        '{"destination": "Barcelona", "days": 5, "budget": 2500}'
+    uv run python examples/hello_trip/client_daemon.py stop
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from pathlib import Path
+import signal
+import stat
+import subprocess
+import sys
+import tempfile
+from typing import Any
+
+import anyio
+from anyio.streams.buffered import BufferedByteReceiveStream
+
+from dedalus_mcp import MCPClient
+from dedalus_mcp.client import lambda_http_client
+
+
+SERVER_URL = "http://127.0.0.1:8000/mcp"
+RUNTIME_DIR = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / f"dedalus-mcp-{os.getuid()}"
+SOCKET_PATH = RUNTIME_DIR / "daemon.sock"
+LOCK_PATH = RUNTIME_DIR / "daemon.lock"
+LOG_PATH = RUNTIME_DIR / "daemon.log"
+MAX_MESSAGE_BYTES = 1 << 20
+FRAME_DELIMITER = b"\n"
+STARTUP_TIMEOUT = 10.0
+
+
+def _private_dir() -> None:
+    """Create RUNTIME_DIR if needed; refuse it unless it is a real 0700 directory owned by this user."""
+    RUNTIME_DIR.mkdir(mode=0o700, exist_ok=True)
+    info = RUNTIME_DIR.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"{RUNTIME_DIR} must be a directory owned by you with mode 0700")
+
+
+async def _handle(client: MCPClient, method: str, params: dict[str, Any]) -> Any:
+    if method == "tools/list":
+        return await client.session.list_tools()
+    if method == "tools/call":
+        return await client.session.call_tool(params["name"], params.get("arguments") or {})
+    raise ValueError(f"unsupported method {method!r}")
+
+
+async def serve() -> None:
+    """Hold one MCP session open and relay newline-delimited requests to it."""
+    _private_dir()
+    SOCKET_PATH.unlink(missing_ok=True)
+
+    async with (
+        lambda_http_client(SERVER_URL, terminate_on_close=True) as (read_stream, write_stream, _),
+        MCPClient(read_stream, write_stream) as client,
+        await anyio.create_unix_listener(SOCKET_PATH) as listener,
+        anyio.create_task_group() as tg,
+    ):
+        os.chmod(SOCKET_PATH, 0o600)
+
+        async def relay(stream: anyio.abc.SocketStream) -> None:
+            async with stream:
+                buffered = BufferedByteReceiveStream(stream)
+                try:
+                    line = await buffered.receive_until(FRAME_DELIMITER, MAX_MESSAGE_BYTES)
+                except (anyio.EndOfStream, anyio.IncompleteRead, anyio.DelimiterNotFound):
+                    return
+
+                try:
+                    request = json.loads(line)
+                    if request.get("method") == "shutdown":
+                        tg.cancel_scope.cancel()
+                        return
+                    result = await _handle(client, request.get("method", ""), request.get("params") or {})
+                    reply = {"result": result.model_dump(mode="json", by_alias=True, exclude_none=True)}
+                except Exception as exc:
+                    reply = {"error": str(exc)}
+                await stream.send(json.dumps(reply, separators=(",", ":")).encode() + FRAME_DELIMITER)
+
+        async def stop_on_signal() -> None:
+            with anyio.open_signal_receiver(signal.SIGINT, signal.SIGTERM) as signals:
+                async for _ in signals:
+                    tg.cancel_scope.cancel()
+                    return
+
+        tg.start_soon(stop_on_signal)
+        await listener.serve(relay, task_group=tg)
+
+    SOCKET_PATH.unlink(missing_ok=True)
+
+
+async def _connect(spawn: bool) -> anyio.abc.SocketStream | None:
+    _private_dir()
+    try:
+        return await anyio.connect_unix(SOCKET_PATH)
+    except (FileNotFoundError, ConnectionRefusedError):
+        if not spawn:
+            return None
+
+    # Only one invocation spawns; the rest wait on the lock, then find its socket.
+    with os.fdopen(os.open(LOCK_PATH, os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600), "w") as lock:
+        await anyio.to_thread.run_sync(fcntl.flock, lock, fcntl.LOCK_EX)
+        try:
+            return await anyio.connect_unix(SOCKET_PATH)
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+        return await _spawn()
+
+
+async def _spawn() -> anyio.abc.SocketStream:
+    """Start a daemon detached from this shell and wait for its socket."""
+    LOG_PATH.unlink(missing_ok=True)
+    log_fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
+    with os.fdopen(log_fd, "wb") as log:
+        daemon = subprocess.Popen(
+            [sys.executable, __file__, "serve"], start_new_session=True, stdout=subprocess.DEVNULL, stderr=log
+        )
+    with anyio.move_on_after(STARTUP_TIMEOUT):
+        while daemon.poll() is None:
+            try:
+                return await anyio.connect_unix(SOCKET_PATH)
+            except (FileNotFoundError, ConnectionRefusedError):
+                await anyio.sleep(0.05)
+
+    status = "is not listening" if daemon.returncode is None else f"exited with status {daemon.returncode}"
+    log_tail = "\n".join(LOG_PATH.read_text(errors="replace").splitlines()[-20:])
+    raise RuntimeError(f"MCP daemon {status}; {LOG_PATH}:\n{log_tail}")
+
+
+async def request(method: str, params: dict[str, Any] | None = None, *, spawn: bool = True) -> Any:
+    """Send one request to the daemon, starting it first if needed."""
+    stream = await _connect(spawn)
+    if stream is None:
+        return None
+
+    async with stream:
+        message = {"method": method, "params": params or {}}
+        await stream.send(json.dumps(message, separators=(",", ":")).encode() + FRAME_DELIMITER)
+        if method == "shutdown":
+            return None
+        buffered = BufferedByteReceiveStream(stream)
+        reply = json.loads(await buffered.receive_until(FRAME_DELIMITER, MAX_MESSAGE_BYTES))
+
+    if "error" in reply:
+        raise RuntimeError(reply["error"])
+    return reply["result"]
+
+
+async def main(argv: list[str]) -> None:
+    command = argv[0] if argv else "list"
+
+    if command == "serve":
+        await serve()
+    elif command == "stop":
+        await request("shutdown", spawn=False)
+    elif command == "list":
+        result = await request("tools/list")
+        print("Tools:", [tool["name"] for tool in result["tools"]])
+    elif command == "call":
+        name = argv[1]
+        arguments = json.loads(argv[2]) if len(argv) > 2 else {}
+        result = await request("tools/call", {"name": name, "arguments": arguments})
+        print(json.dumps(result.get("structuredContent") or result.get("content"), indent=2))
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    anyio.run(main, sys.argv[1:])
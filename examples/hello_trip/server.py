@@ -28,15 +28,15 @@ Try it alongside ``client.py`` to see the full flow.
 from __future__ import annotations
 
 import asyncio
-import logging
 from typing import Any
 
 from dedalus_mcp import MCPServer, get_context, prompt, resource, tool
+from dedalus_mcp.types import PromptMessage, TextContent
+from dedalus_mcp.utils import quiet_third_party
 
 
 # Suppress logs for cleaner demo output
-for logger_name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+quiet_third_party("CRITICAL")
 
 
 @tool(
@@ -53,10 +53,9 @@ async def plan_trip(destination: str, days: int, budget: float) -> dict[str, Any
     await ctx.info("planning trip", data={"destination": destination, "days": days, "budget": budget})
 
     async with ctx.progress(total=3) as tracker:
+        # The tracker coalesces updates and flushes on its own schedule; no manual yields needed.
         await tracker.advance(1, message="Gathering highlights")
-        await asyncio.sleep(0)
         await tracker.advance(1, message="Estimating costs")
-        await asyncio.sleep(0)
         await tracker.advance(1, message="Summarising itinerary")
 
     summary = f"Plan: {days} days in {destination} with budget ${budget:.2f}."
@@ -65,21 +64,25 @@ async def plan_trip(destination: str, days: int, budget: float) -> dict[str, Any
     return result
 
 
+# Content that never changes is built once at import; handlers only fill in the variable part.
+BARCELONA_TIPS = "Visit Sagrada Família, explore the Gothic Quarter, and enjoy tapas on La Rambla."
+PLANNER_MESSAGE = PromptMessage(
+    role="assistant",
+    content=TextContent(
+        type="text", text="You are a helpful travel planner. Summarize the itinerary and call tools if needed."
+    ),
+)
+
+
 @resource(uri="travel://tips/barcelona", name="Barcelona Tips", mime_type="text/plain")
 def barcelona_tips() -> str:
-    return "Visit Sagrada Família, explore the Gothic Quarter, and enjoy tapas on La Rambla."
+    return BARCELONA_TIPS
 
 
 @prompt(name="plan-vacation", description="Guide the model through planning a trip")
-def plan_vacation_prompt(args: dict[str, str]) -> list[dict[str, str]]:
+def plan_vacation_prompt(args: dict[str, str]) -> list[PromptMessage | dict[str, str]]:
     destination = args.get("destination", "unknown destination")
-    return [
-        {
-            "role": "assistant",
-            "content": "You are a helpful travel planner. Summarize the itinerary and call tools if needed.",
-        },
-        {"role": "user", "content": f"Plan a vacation to {destination}."},
-    ]
+    return [PLANNER_MESSAGE, {"role": "user", "content": f"Plan a vacation to {destination}."}]
 
 
 server = MCPServer("hello-trip")
@@ -90,6 +93,8 @@ async def main(transport: str = "streamable-http") -> None:
     """Serve the hello-trip MCP server on the specified transport."""
     kwargs = {"transport": transport}
     if transport == "streamable-http":
+        # Importing dedalus_mcp already switched asyncio.run to uvloop (winloop on Windows) when the
+        # ``opt`` extra is installed, and uvicorn serves on that running loop; nothing to pass here.
         kwargs.update({"verbose": False, "log_level": "critical", "uvicorn_options": {"access_log": False}})
     await server.serve(**kwargs)
 
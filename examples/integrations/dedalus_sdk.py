@@ -13,18 +13,17 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
 import asyncio
+from collections.abc import Callable
+import functools
+import json
 import os
-
-from dotenv import load_dotenv
+import time
+from typing import Any
 
 from dedalus_mcp import MCPServer, tool
 
 
-load_dotenv()
-
-
 # --- Dedalus MCP Server ----------------------------------------------------------
 
 
@@ -38,7 +37,34 @@ def multiply(a: int, b: int) -> int:
     return a * b
 
 
+def ttl_cache(seconds: float, maxsize: int = 1024) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize a tool's results per argument tuple for *seconds*."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        entries: dict[tuple[Any, ...], tuple[float, Any]] = {}
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (*args, *sorted(kwargs.items()))
+            now = time.monotonic()
+            hit = entries.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            value = fn(*args, **kwargs)
+            if len(entries) >= maxsize:
+                entries.pop(next(iter(entries)))
+            entries[key] = (now + seconds, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# Weather is backed by a remote service and stays valid for minutes; cache it per city.
+# add/multiply are cheaper to recompute than to look up, so they are left uncached.
 @tool(description="Get the current weather for a city")
+@ttl_cache(seconds=300)
 def get_weather(city: str) -> dict:
     return {"city": city, "temperature": 72, "unit": "fahrenheit", "conditions": "sunny"}
 
@@ -154,8 +180,6 @@ def demonstrate_wire_format():
 
     No extra metadata needed in the wire format.
     """
-    import json
-
     from dedalus_labs.lib.runner.mcp_wire import MCPServerWireSpec, serialize_mcp_servers
 
     print("\n" + "=" * 60)
@@ -200,6 +224,13 @@ def demonstrate_wire_format():
 
 
 def main():
+    # Only the CLI needs flag parsing and .env values such as DEDALUS_API_KEY.
+    import argparse
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     parser = argparse.ArgumentParser(description="Dedalus MCP + Dedalus SDK Integration")
     parser.add_argument("--server", action="store_true", help="Run as MCP server")
     parser.add_argument("--client", action="store_true", help="Run as SDK client")
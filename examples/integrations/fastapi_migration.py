@@ -14,17 +14,19 @@ Usage:
 """
 
 import asyncio
+from collections import defaultdict
 from datetime import datetime
-import logging
+from itertools import islice
+import time
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 
 # ============================================================================
@@ -32,9 +34,16 @@ for name in ("mcp", "httpx", "uvicorn"):
 # ============================================================================
 
 
+EMAIL_PATTERN = r"^[\w\.-]+@[\w\.-]+\.\w+$"
+
+
 class UserCreate(BaseModel):
+    # Rust's regex crate matches in linear time (no backtracking), which keeps
+    # bulk ingest cheap. It is pydantic's default; pinned here so it stays that way.
+    model_config = ConfigDict(regex_engine="rust-regex")
+
     name: str = Field(..., min_length=1, max_length=100)
-    email: str = Field(..., pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$")
+    email: str = Field(..., pattern=EMAIL_PATTERN)
     role: Literal["user", "admin"] = "user"
 
 
@@ -68,41 +77,65 @@ class Task(BaseModel):
 # ============================================================================
 
 # Simulated database
+PAGE_SIZE = 100  # upper bound on rows per listing, so result size stays flat as the tables grow
 _users: dict[int, User] = {}
 _tasks: dict[int, Task] = {}
+# Secondary index on status so filtered listings skip the full scan
+_tasks_by_status: defaultdict[str, dict[int, Task]] = defaultdict(dict)
 _next_user_id = 1
 _next_task_id = 1
 
+# Wall clock read at most once per millisecond; see _now()
+_clock: tuple[int, datetime] = (0, datetime.now())
+
+
+def _now() -> datetime:
+    # Rows created in a burst share one timestamp instead of reading the clock per row
+    global _clock
+    now_ns = time.monotonic_ns()
+    if now_ns - _clock[0] > 1_000_000:
+        _clock = (now_ns, datetime.now())
+    return _clock[1]
+
 
 def create_user_service(data: UserCreate) -> User:
     global _next_user_id
-    user = User(id=_next_user_id, **data.model_dump(), created_at=datetime.now())
+    user = User(id=_next_user_id, **dict(data), created_at=_now())
     _users[user.id] = user
     _next_user_id += 1
     return user
 
 
+def bulk_create_users_service(items: list[UserCreate]) -> list[User]:
+    # One id range, one timestamp and one dict update for the whole batch
+    global _next_user_id
+    created_at = _now()
+    users = [User(id=i, **dict(data), created_at=created_at) for i, data in enumerate(items, start=_next_user_id)]
+    _users.update((user.id, user) for user in users)
+    _next_user_id += len(users)
+    return users
+
+
 def get_user_service(user_id: int) -> User | None:
     return _users.get(user_id)
 
 
-def list_users_service() -> list[User]:
-    return list(_users.values())
+def list_users_service(offset: int = 0, limit: int = PAGE_SIZE) -> list[User]:
+    return list(islice(_users.values(), offset, offset + limit))
 
 
 def create_task_service(data: TaskCreate) -> Task:
     global _next_task_id
-    task = Task(id=_next_task_id, **data.model_dump(), status="todo", created_at=datetime.now())
+    task = Task(id=_next_task_id, **dict(data), status="todo", created_at=_now())
     _tasks[task.id] = task
+    _tasks_by_status[task.status][task.id] = task
     _next_task_id += 1
     return task
 
 
-def list_tasks_service(status: str | None = None) -> list[Task]:
-    tasks = list(_tasks.values())
-    if status:
-        tasks = [t for t in tasks if t.status == status]
-    return tasks
+def list_tasks_service(status: str | None = None, offset: int = 0, limit: int = PAGE_SIZE) -> list[Task]:
+    tasks = _tasks_by_status.get(status, {}) if status else _tasks
+    return list(islice(tasks.values(), offset, offset + limit))
 
 
 # ============================================================================
@@ -116,6 +149,10 @@ def list_tasks_service(status: str | None = None) -> list[Task]:
 # def create_user(data: UserCreate):
 #     return create_user_service(data)
 #
+# @app.post("/users/bulk", response_model=list[User])
+# def create_users(items: list[UserCreate]):
+#     return bulk_create_users_service(items)
+#
 # @app.get("/users/{user_id}", response_model=User)
 # def get_user(user_id: int):
 #     user = get_user_service(user_id)
@@ -124,16 +161,16 @@ def list_tasks_service(status: str | None = None) -> list[Task]:
 #     return user
 #
 # @app.get("/users", response_model=list[User])
-# def list_users():
-#     return list_users_service()
+# def list_users(offset: int = 0, limit: int = PAGE_SIZE):
+#     return list_users_service(offset, limit)
 #
 # @app.post("/tasks", response_model=Task)
 # def create_task(data: TaskCreate):
 #     return create_task_service(data)
 #
 # @app.get("/tasks", response_model=list[Task])
-# def list_tasks(status: str | None = None):
-#     return list_tasks_service(status)
+# def list_tasks(status: str | None = None, offset: int = 0, limit: int = PAGE_SIZE):
+#     return list_tasks_service(status, offset, limit)
 
 
 # ============================================================================
@@ -142,11 +179,20 @@ def list_tasks_service(status: str | None = None) -> list[Task]:
 
 server = MCPServer("fastapi-migration", instructions="Migrated from FastAPI endpoints")
 
+# Tools receive plain JSON arguments; validate a whole batch in one pydantic-core call
+_user_batch = TypeAdapter(list[UserCreate])
+
 
 @tool(description="Create a new user", tags={"users", "write"})
 def create_user(data: UserCreate) -> User:
     """POST /users → MCP tool"""
-    return create_user_service(data)
+    return create_user_service(UserCreate.model_validate(data))
+
+
+@tool(description="Create many users in one call", tags={"users", "write"})
+def create_users(items: list[UserCreate]) -> list[User]:
+    """POST /users/bulk → MCP tool"""
+    return bulk_create_users_service(_user_batch.validate_python(items))
 
 
 @tool(description="Get user by ID", tags={"users", "read"})
@@ -158,25 +204,28 @@ def get_user(user_id: int) -> User | dict:
     return user
 
 
-@tool(description="List all users", tags={"users", "read"})
-def list_users() -> list[User]:
+@tool(description="List users, one page at a time", tags={"users", "read"})
+def list_users(offset: int = 0, limit: int = PAGE_SIZE) -> list[User]:
     """GET /users → MCP tool"""
-    return list_users_service()
+    # islice rejects negative bounds, so clamp rather than fail the call
+    return list_users_service(max(offset, 0), max(min(limit, PAGE_SIZE), 0))
 
 
 @tool(description="Create a new task", tags={"tasks", "write"})
 def create_task(data: TaskCreate) -> Task:
     """POST /tasks → MCP tool"""
-    return create_task_service(data)
+    return create_task_service(TaskCreate.model_validate(data))
 
 
-@tool(description="List tasks with optional status filter", tags={"tasks", "read"})
-def list_tasks(status: Literal["todo", "in_progress", "done"] | None = None) -> list[Task]:
+@tool(description="List tasks with optional status filter, one page at a time", tags={"tasks", "read"})
+def list_tasks(
+    status: Literal["todo", "in_progress", "done"] | None = None, offset: int = 0, limit: int = PAGE_SIZE
+) -> list[Task]:
     """GET /tasks → MCP tool"""
-    return list_tasks_service(status)
+    return list_tasks_service(status, max(offset, 0), max(min(limit, PAGE_SIZE), 0))
 
 
-server.collect(create_user, get_user, list_users, create_task, list_tasks)
+server.collect(create_user, create_users, get_user, list_users, create_task, list_tasks)
 
 # ============================================================================
 # Run both FastAPI and MCP (if FastAPI is available)
@@ -189,6 +238,7 @@ async def main() -> None:
     print("\nMCP Server: http://127.0.0.1:8000/mcp")
     print("\nMigrated endpoints:")
     print("  POST /users      → create_user tool")
+    print("  POST /users/bulk → create_users tool")
     print("  GET /users/{id}  → get_user tool")
     print("  GET /users       → list_users tool")
     print("  POST /tasks      → create_task tool")
@@ -14,7 +14,7 @@ from __future__ import annotations
 import asyncio
 import os
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
 
 from dedalus_mcp import HttpMethod, HttpRequest, MCPServer, get_context, tool
 from dedalus_mcp.auth import Connection, Credential, Credentials
@@ -34,7 +34,7 @@ class Repository(BaseModel):
     """GitHub repository summary."""
 
     name: str
-    stars: int
+    stars: int = Field(validation_alias=AliasChoices("stars", "stargazers_count"))
 
 
 class ErrorResponse(BaseModel):
@@ -43,6 +43,11 @@ class ErrorResponse(BaseModel):
     msg: str
 
 
+# Validators are built once here and reused to parse every GitHub response body.
+_USER_ADAPTER = TypeAdapter(UserProfile)
+_REPO_LIST_ADAPTER = TypeAdapter(list[Repository])
+
+
 # --- Define connections (what credentials are needed) ------------------------
 
 github = Connection("github", credentials=Credentials(token="GITHUB_TOKEN"), base_url="https://api.github.com")
@@ -51,6 +56,8 @@ github = Connection("github", credentials=Credentials(token="GITHUB_TOKEN"), bas
 
 server = MCPServer(name="github-tools", connections=[github])
 
+GITHUB_MAX_PAGE_SIZE = 100
+
 
 @tool(description="Get authenticated user profile")
 async def whoami() -> UserProfile | ErrorResponse:
@@ -60,8 +67,7 @@ async def whoami() -> UserProfile | ErrorResponse:
     response = await ctx.dispatch(request=request)
 
     if response.success:
-        u = response.response.body
-        return UserProfile(login=u.get("login", ""), name=u.get("name"))
+        return _USER_ADAPTER.validate_python(response.response.body)
 
     msg = response.error.message if response.error else "Unknown error"
     return ErrorResponse(msg=msg)
@@ -71,13 +77,21 @@ async def whoami() -> UserProfile | ErrorResponse:
 async def list_repos(per_page: int = 5) -> list[Repository]:
     ctx = get_context()
 
-    request = HttpRequest(method=HttpMethod.GET, path=f"/user/repos?per_page={per_page}&sort=updated")
-    response = await ctx.dispatch(request=request)
-
-    if response.success:
-        return [Repository(name=r.get("name", ""), stars=r.get("stargazers_count", 0)) for r in response.response.body]
+    # GitHub caps a page at 100 repos; when more are asked for, fetch every
+    # page at once so the wall time is one round-trip rather than one per page.
+    page_size = max(1, min(per_page, GITHUB_MAX_PAGE_SIZE))
+    pages = -(-per_page // page_size)
+    requests = [
+        HttpRequest(method=HttpMethod.GET, path=f"/user/repos?per_page={page_size}&page={page}&sort=updated")
+        for page in range(1, pages + 1)
+    ]
+    responses = await ctx.dispatch_many(requests)
 
-    return []
+    repos: list[Repository] = []
+    for response in responses:
+        if response.success:
+            repos.extend(_REPO_LIST_ADAPTER.validate_python(response.response.body))
+    return repos[:per_page]
 
 
 server.collect(whoami, list_repos)
@@ -95,8 +109,8 @@ async def main() -> None:
     github_cred = Credential(github, token=token)
 
     print(f"Server: {server.name}")
-    print(f"Tools: {server.tool_names}")
-    print(f"Connections: {list(server.connections.keys())}")
+    print(f"Tools: {', '.join(server.tool_names)}")
+    print(f"Connections: {', '.join(server.connections)}")
 
     # ---------------------------------------------------------------------------
     # Full flow (when AS/Enclave are running):
@@ -20,7 +20,17 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import json
 import os
+import time
+from typing import Any
+from urllib.parse import quote
+import uuid
+
+import httpx
+from patterns.coalescing import coalesce
+from patterns.postgrest import content_range_total, encode_query, pg_quote
 
 from dedalus_mcp import HttpMethod, HttpRequest, MCPServer, get_context, tool
 from dedalus_mcp.auth import Connection, Credential, Credentials
@@ -46,7 +56,34 @@ openai = Connection(
 # 2. Define server
 # ---------------------------------------------------------------------------
 
-server = MCPServer(name="combined-tools", connections=[supabase, openai])
+# One pooled client for every dispatch, so Supabase and OpenAI calls reuse warm
+# TCP/TLS connections. HTTP/2 (via httpx[http2]) lets concurrent OpenAI calls share
+# a single connection. The dispatch backend swaps in a cookie jar that stores
+# nothing, so no caller's session leaks into another's request.
+http_client = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    timeout=httpx.Timeout(30.0, connect=3.0),
+)
+
+server = MCPServer(name="combined-tools", connections=[supabase, openai], http_client=http_client)
+
+
+# Requests that never vary per call are built (and validated) once at import.
+_PUBLIC_REPOS_REQUEST = HttpRequest(
+    method=HttpMethod.GET,
+    path="/rest/v1/mcp_repositories?select=repo_id&visibility=eq.public",
+    headers={"Prefer": "count=exact", "Range-Unit": "items", "Range": "0-0"},
+)
+# Server-side SUM needs PostgREST aggregates (db-aggregates-enabled); _UPVOTES_REQUEST is the fallback.
+_UPVOTE_TOTAL_REQUEST = HttpRequest(
+    method=HttpMethod.GET, path="/rest/v1/mcp_repositories?select=total:upvote_count.sum()"
+)
+_UPVOTES_REQUEST = HttpRequest(method=HttpMethod.GET, path="/rest/v1/mcp_repositories?select=upvote_count")
+_RECENT_ORGS_REQUEST = HttpRequest(
+    method=HttpMethod.GET, path="/rest/v1/organizations?select=name,verified,created_at&limit=10"
+)
+
 
 # ---------------------------------------------------------------------------
 # 3. Supabase Tools
@@ -57,12 +94,11 @@ server = MCPServer(name="combined-tools", connections=[supabase, openai])
 async def get_organizations(limit: int = 5) -> list[dict]:
     """List organizations from the database."""
     ctx = get_context()
+    query = encode_query(
+        [("select", "org_id,name,verified,created_at"), ("limit", str(limit)), ("order", "created_at.desc")]
+    )
     response = await ctx.dispatch(
-        target=supabase,
-        request=HttpRequest(
-            method=HttpMethod.GET,
-            path=f"/rest/v1/organizations?select=org_id,name,verified,created_at&limit={limit}&order=created_at.desc",
-        ),
+        target=supabase, request=HttpRequest(method=HttpMethod.GET, path=f"/rest/v1/organizations?{query}")
     )
     if response.success:
         return response.response.body
@@ -74,27 +110,20 @@ async def get_repo_stats() -> dict:
     """Get statistics about MCP repositories."""
     ctx = get_context()
 
-    # Query public repos count
-    response = await ctx.dispatch(
-        target=supabase,
-        request=HttpRequest(
-            method=HttpMethod.GET,
-            path="/rest/v1/mcp_repositories?select=repo_id&visibility=eq.public",
-            headers={"Prefer": "count=exact"},
-        ),
-    )
-
-    public_count = len(response.response.body) if response.success else 0
+    # The two queries are independent, so issue them together: one round-trip of wall time, not two.
+    public_repos, upvotes = await ctx.dispatch_many([_PUBLIC_REPOS_REQUEST, _UPVOTE_TOTAL_REQUEST], target=supabase)
 
-    # Query total upvotes
-    response2 = await ctx.dispatch(
-        target=supabase,
-        request=HttpRequest(method=HttpMethod.GET, path="/rest/v1/mcp_repositories?select=upvote_count"),
-    )
+    # Each result is checked on its own so one failed query doesn't discard the other.
+    public_count = content_range_total(public_repos) or 0
 
     total_upvotes = 0
-    if response2.success:
-        total_upvotes = sum(r.get("upvote_count", 0) or 0 for r in response2.response.body)
+    if upvotes.success and upvotes.response.status < 400:
+        total_upvotes = (upvotes.response.body[0].get("total") or 0) if upvotes.response.body else 0
+    elif upvotes.success:
+        # Aggregates are disabled on this project: fetch the column and sum it here.
+        rows = await ctx.dispatch(supabase, _UPVOTES_REQUEST)
+        if rows.success:
+            total_upvotes = sum(r.get("upvote_count", 0) or 0 for r in rows.response.body)
 
     return {"public_repositories": public_count, "total_upvotes": total_upvotes}
 
@@ -105,6 +134,7 @@ async def get_repo_stats() -> dict:
 
 
 @tool(description="Generate AI response")
+@coalesce
 async def ask_ai(question: str) -> dict:
     """Ask GPT-4o-mini a question."""
     ctx = get_context()
@@ -129,33 +159,31 @@ async def ask_ai(question: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+ANALYSIS_NAME_LIMIT = 20
+
+
 @tool(description="Analyze organization data with AI")
 async def analyze_org_data() -> dict:
     """Fetch org data from Supabase and analyze with OpenAI."""
     ctx = get_context()
 
     # Step 1: Get organizations from Supabase
-    db_response = await ctx.dispatch(
-        target=supabase,
-        request=HttpRequest(
-            method=HttpMethod.GET, path="/rest/v1/organizations?select=name,verified,created_at&limit=10"
-        ),
-    )
+    db_response = await ctx.dispatch(target=supabase, request=_RECENT_ORGS_REQUEST)
 
     if not db_response.success:
         return {"error": "Failed to fetch organizations"}
 
     orgs = db_response.response.body
 
-    # Step 2: Send to OpenAI for analysis
-    analysis_prompt = f"""Analyze these organizations and provide insights:
-{orgs}
-
-Provide:
-1. Total count
-2. Verified vs unverified ratio
-3. Any patterns in naming
-4. Brief summary"""
+    # Step 2: Summarize in Python and send only the scalars, so prompt size (and
+    # billed tokens) stays flat no matter how many rows the query returns.
+    verified = sum(1 for o in orgs if o.get("verified"))
+    names = [o.get("name") for o in orgs]
+    analysis_prompt = (
+        f"Organizations: {len(orgs)} total, {verified} verified, {len(orgs) - verified} unverified.\n"
+        f"Names (first {ANALYSIS_NAME_LIMIT}): {', '.join(map(str, names[:ANALYSIS_NAME_LIMIT]))}\n\n"
+        'Respond with a JSON object with keys "naming_patterns" (list of strings) and "summary" (one sentence).'
+    )
 
     ai_response = await ctx.dispatch(
         target=openai,
@@ -165,7 +193,8 @@ Provide:
             body={
                 "model": "gpt-4o-mini",
                 "messages": [{"role": "user", "content": analysis_prompt}],
-                "max_tokens": 300,
+                "max_tokens": 200,
+                "response_format": {"type": "json_object"},
             },
         ),
     )
@@ -173,14 +202,137 @@ Provide:
     if not ai_response.success:
         return {"orgs": orgs, "analysis_error": "AI analysis failed"}
 
-    return {
-        "org_count": len(orgs),
-        "organizations": [o.get("name") for o in orgs],
-        "analysis": ai_response.response.body["choices"][0]["message"]["content"],
-    }
+    content = ai_response.response.body["choices"][0]["message"]["content"]
+    try:
+        analysis = json.loads(content)
+    except json.JSONDecodeError:
+        analysis = {"raw_response": content}
+
+    return {"org_count": len(orgs), "verified_count": verified, "organizations": names, "analysis": analysis}
+
+
+# OpenAI's Batch API runs requests asynchronously (within 24h) at half price. That
+# suits bulk analysis, not interactive calls, so it backs a dedicated bulk tool.
+_BATCH_DONE = frozenset({"completed", "failed", "expired", "cancelled"})
+
 
+def _multipart_jsonl(jsonl: str, *, purpose: str) -> tuple[str, dict[str, str]]:
+    """Encode a JSONL upload for POST /files; dispatch bodies are JSON or plain strings."""
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="purpose"\r\n\r\n{purpose}\r\n'
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="batch.jsonl"\r\n'
+        f"Content-Type: application/jsonl\r\n\r\n{jsonl}\r\n--{boundary}--\r\n"
+    )
+    return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+async def _batch_results(batch: dict[str, Any]) -> dict[str, str]:
+    """Download a finished batch's output file and map custom_id to the reply text."""
+    ctx = get_context()
+    response = await ctx.dispatch(
+        openai, HttpRequest(method=HttpMethod.GET, path=f"/files/{batch['output_file_id']}/content")
+    )
+    if not response.success or not isinstance(response.response.body, str):
+        return {}
+    results = {}
+    for line in response.response.body.splitlines():
+        if line:
+            entry = json.loads(line)
+            choices = (entry.get("response") or {}).get("body", {}).get("choices") or [{}]
+            results[entry["custom_id"]] = choices[0].get("message", {}).get("content")
+    return results
+
+
+def _org_batch_line(name: str, record: dict[str, Any]) -> str:
+    """One Batch API request line; custom_id carries the org name back with the result."""
+    prompt = f"Give a two-sentence profile of this organization: {record}"
+    body = {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": prompt}], "max_tokens": 120}
+    return json.dumps({"custom_id": name, "method": "POST", "url": "/v1/chat/completions", "body": body})
+
+
+@tool(description="Analyze many organizations in one OpenAI batch job")
+async def analyze_orgs_bulk(org_names: list[str], wait_seconds: float = 60.0) -> dict:
+    """Profile each named organization via OpenAI's Batch API.
+
+    Args:
+        org_names: Organization names to analyze (one batch line each)
+        wait_seconds: How long to poll for completion before returning the batch id
+    """
+    ctx = get_context()
+    names = list(dict.fromkeys(org_names))
+    query = encode_query(
+        [("name", f"in.({','.join(pg_quote(n) for n in names)})"), ("select", "name,verified,created_at")]
+    )
+    db_response = await ctx.dispatch(
+        supabase, HttpRequest(method=HttpMethod.GET, path=f"/rest/v1/organizations?{query}")
+    )
+    if not db_response.success:
+        return {"error": "Failed to fetch organizations"}
+    records = {org["name"]: org for org in db_response.response.body}
+
+    jsonl = "\n".join(_org_batch_line(name, records.get(name, {"name": name})) for name in names)
+    body, headers = _multipart_jsonl(jsonl, purpose="batch")
+    upload = await ctx.dispatch(openai, HttpRequest(method=HttpMethod.POST, path="/files", body=body, headers=headers))
+    if not upload.success or upload.response.status >= 400:
+        return {"error": "Batch upload failed"}
+
+    created = await ctx.dispatch(
+        openai,
+        HttpRequest(
+            method=HttpMethod.POST,
+            path="/batches",
+            body={
+                "input_file_id": upload.response.body["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+        ),
+    )
+    if not created.success or created.response.status >= 400:
+        return {"error": "Batch creation failed"}
+    batch = created.response.body
+
+    # Poll with exponential backoff, capped so slow batches return a handle instead of blocking.
+    deadline = time.monotonic() + wait_seconds
+    delay = 1.0
+    while batch.get("status") not in _BATCH_DONE and time.monotonic() + delay < deadline:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 30.0)
+        polled = await ctx.dispatch(openai, HttpRequest(method=HttpMethod.GET, path=f"/batches/{batch['id']}"))
+        if polled.success and polled.response.status < 400:
+            batch = polled.response.body
+
+    if batch.get("status") != "completed":
+        return {"batch_id": batch["id"], "status": batch.get("status")}
+    if not batch.get("output_file_id"):
+        # Every line failed, so there is no output file; the errors are in error_file_id.
+        return {
+            "batch_id": batch["id"],
+            "error": "Every batch request failed",
+            "error_file_id": batch.get("error_file_id"),
+        }
 
-server.collect(get_organizations, get_repo_stats, ask_ai, analyze_org_data)
+    results = await _batch_results(batch)
+    return {"batch_id": batch["id"], "analyses": [{"name": name, "analysis": results.get(name)} for name in names]}
+
+
+@tool(description="Fetch results of an organization batch job")
+async def get_org_batch_results(batch_id: str) -> dict:
+    """Return per-organization analyses once a batch from analyze_orgs_bulk completes."""
+    ctx = get_context()
+    response = await ctx.dispatch(
+        openai, HttpRequest(method=HttpMethod.GET, path=f"/batches/{quote(batch_id, safe='')}")
+    )
+    if not response.success or response.response.status >= 400:
+        return {"error": "Batch lookup failed"}
+    batch = response.response.body
+    if batch.get("status") != "completed":
+        return {"batch_id": batch_id, "status": batch.get("status")}
+    return {"batch_id": batch_id, "analyses": await _batch_results(batch)}
+
+
+server.collect(get_organizations, get_repo_stats, ask_ai, analyze_org_data, analyze_orgs_bulk, get_org_batch_results)
 
 # ---------------------------------------------------------------------------
 # 6. Main entry point
@@ -209,8 +361,8 @@ async def main():
     credentials = [Credential(supabase, apikey=supabase_key), Credential(openai, api_key=openai_key)]
 
     print(f"Server: {server.name}")
-    print(f"Tools: {server.tool_names}")
-    print(f"Connections: {list(server.connections.keys())}")
+    print(f"Tools: {', '.join(server.tool_names)}")
+    print(f"Connections: {', '.join(server.connections)}")
     print(f"Supabase: {supabase_url}")
     print(f"OpenAI: {openai.base_url}")
 
@@ -247,5 +399,11 @@ async def main():
     print("\nServer ready!")
 
 
+async def run() -> None:
+    # The server doesn't own http_client, so close its pool here on exit
+    async with http_client:
+        await main()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())
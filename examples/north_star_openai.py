@@ -17,7 +17,12 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import json
+from operator import itemgetter
 import os
+from typing import Any
+
+from patterns.coalescing import coalesce
 
 from dedalus_mcp import HttpMethod, HttpRequest, MCPServer, get_context, tool
 from dedalus_mcp.auth import Connection, Credential, Credentials
@@ -39,8 +44,51 @@ openai = Connection(
 
 server = MCPServer(name="openai-tools", connections=[openai])
 
+# Static system prompts, built once rather than on every call.
+_SENTIMENT_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a sentiment analysis assistant. Respond with JSON containing: sentiment (positive/negative/neutral), confidence (0-1), and brief explanation.",
+}
+_SUMMARY_SYSTEM_MSGS = {
+    style: {"role": "system", "content": f"You are a summarization assistant. {instruction}"}
+    for style, instruction in {
+        "brief": "Provide a 1-2 sentence summary.",
+        "detailed": "Provide a detailed paragraph summary.",
+        "bullets": "Provide a bullet-point summary with 3-5 key points.",
+    }.items()
+}
+
+# Sentiment and summary requests have a fixed shape, so their JSON bodies are
+# serialized once with a slot for the user's text and filled with str.replace.
+_TEXT_SLOT = "__TEXT__"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _chat_body_template(system_msg: dict[str, str], user_content: str, **params: Any) -> str:
+    messages = [system_msg, {"role": "user", "content": user_content}]
+    return json.dumps({"model": "gpt-4o-mini", "messages": messages, **params}, separators=(",", ":"))
+
+
+def _fill(template: str, text: str) -> str:
+    # json.dumps escapes quotes, newlines and non-ASCII; [1:-1] drops its surrounding quotes.
+    return template.replace(_TEXT_SLOT, json.dumps(text)[1:-1], 1)
+
+
+_SENTIMENT_BODY = _chat_body_template(
+    _SENTIMENT_SYSTEM_MSG,
+    f"Analyze sentiment: {_TEXT_SLOT}",
+    max_tokens=150,
+    temperature=0,
+    response_format={"type": "json_object"},
+)
+_SUMMARY_BODIES = {
+    style: _chat_body_template(msg, f"Summarize this text:\n\n{_TEXT_SLOT}", max_tokens=300, temperature=0.3)
+    for style, msg in _SUMMARY_SYSTEM_MSGS.items()
+}
+
 
 @tool(description="Generate text using GPT-4o-mini")
+@coalesce
 async def generate_text(prompt: str, max_tokens: int = 500, temperature: float = 0.7) -> dict:
     """Generate text completion using OpenAI GPT-4o-mini.
 
@@ -73,6 +121,7 @@ async def generate_text(prompt: str, max_tokens: int = 500, temperature: float =
 
 
 @tool(description="Generate embeddings for text")
+@coalesce
 async def generate_embeddings(text: str) -> dict:
     """Generate vector embeddings using text-embedding-3-small.
 
@@ -103,13 +152,12 @@ async def list_models() -> list[dict]:
     if response.success:
         models = response.response.body.get("data", [])
         # Return simplified model info, sorted by ID
-        return sorted(
-            [{"id": m["id"], "owned_by": m.get("owned_by", "unknown")} for m in models], key=lambda x: x["id"]
-        )
+        return sorted(({"id": m["id"], "owned_by": m.get("owned_by", "unknown")} for m in models), key=itemgetter("id"))
     return [{"error": response.error.message if response.error else "List failed"}]
 
 
 @tool(description="Analyze sentiment of text")
+@coalesce
 async def analyze_sentiment(text: str) -> dict:
     """Analyze sentiment using GPT-4o-mini.
 
@@ -119,26 +167,10 @@ async def analyze_sentiment(text: str) -> dict:
     ctx = get_context()
     response = await ctx.dispatch(
         HttpRequest(
-            method=HttpMethod.POST,
-            path="/chat/completions",
-            body={
-                "model": "gpt-4o-mini",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a sentiment analysis assistant. Respond with JSON containing: sentiment (positive/negative/neutral), confidence (0-1), and brief explanation.",
-                    },
-                    {"role": "user", "content": f"Analyze sentiment: {text}"},
-                ],
-                "max_tokens": 150,
-                "temperature": 0,
-                "response_format": {"type": "json_object"},
-            },
+            method=HttpMethod.POST, path="/chat/completions", body=_fill(_SENTIMENT_BODY, text), headers=_JSON_HEADERS
         )
     )
     if response.success:
-        import json
-
         content = response.response.body["choices"][0]["message"]["content"]
         try:
             return json.loads(content)
@@ -148,6 +180,7 @@ async def analyze_sentiment(text: str) -> dict:
 
 
 @tool(description="Summarize long text")
+@coalesce
 async def summarize(text: str, style: str = "brief") -> dict:
     """Summarize text using GPT-4o-mini.
 
@@ -155,29 +188,13 @@ async def summarize(text: str, style: str = "brief") -> dict:
         text: Text to summarize
         style: 'brief' (1-2 sentences), 'detailed' (paragraph), or 'bullets'
     """
-    style_prompts = {
-        "brief": "Provide a 1-2 sentence summary.",
-        "detailed": "Provide a detailed paragraph summary.",
-        "bullets": "Provide a bullet-point summary with 3-5 key points.",
-    }
-
     ctx = get_context()
     response = await ctx.dispatch(
         HttpRequest(
             method=HttpMethod.POST,
             path="/chat/completions",
-            body={
-                "model": "gpt-4o-mini",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": f"You are a summarization assistant. {style_prompts.get(style, style_prompts['brief'])}",
-                    },
-                    {"role": "user", "content": f"Summarize this text:\n\n{text}"},
-                ],
-                "max_tokens": 300,
-                "temperature": 0.3,
-            },
+            body=_fill(_SUMMARY_BODIES.get(style, _SUMMARY_BODIES["brief"]), text),
+            headers=_JSON_HEADERS,
         )
     )
     if response.success:
@@ -207,8 +224,8 @@ async def main():
     openai_cred = Credential(openai, api_key=api_key)
 
     print(f"Server: {server.name}")
-    print(f"Tools: {server.tool_names}")
-    print(f"Connections: {list(server.connections.keys())}")
+    print(f"Tools: {', '.join(server.tool_names)}")
+    print(f"Connections: {', '.join(server.connections)}")
     print(f"Base URL: {openai.base_url}")
 
     # ---------------------------------------------------------------------------
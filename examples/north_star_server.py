@@ -5,16 +5,11 @@
 
 from __future__ import annotations
 
-import argparse
 import asyncio
 
-from dotenv import load_dotenv
-
 from dedalus_mcp import MCPServer, tool
 
 
-load_dotenv()
-
 # --- Tools -------------------------------------------------------------------
 
 
@@ -50,6 +45,13 @@ async def run_server():
 
 
 def main():
+    # Deferred so importing this module (tests, embedding) skips .env reads and argparse setup.
+    import argparse
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     parser = argparse.ArgumentParser(description="Run the Dedalus MCP server")
     parser.add_argument("--server", action="store_true", help="Start server")
     args = parser.parse_args()
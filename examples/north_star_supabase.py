@@ -18,9 +18,18 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+import contextvars
+import functools
 import os
+import time
+from typing import Any
+from urllib.parse import quote
 
-from dedalus_mcp import HttpMethod, HttpRequest, MCPServer, get_context, tool
+from patterns.postgrest import content_range_total, encode_query, pg_quote
+
+from dedalus_mcp import DispatchResponse, HttpMethod, HttpRequest, MCPServer, get_context, tool
 from dedalus_mcp.auth import Connection, Credential, Credentials
 
 
@@ -41,13 +50,72 @@ supabase = Connection(
 
 server = MCPServer(name="supabase-tools", connections=[supabase])
 
+# Shared header sets. HttpRequest validation copies headers into each request,
+# so these are never mutated by a call.
+_REPRESENTATION_HEADERS = {"Prefer": "return=representation"}
+# Ask for an exact count but only the first row; the total comes back in Content-Range.
+_COUNT_EXACT_HEADERS = {"Prefer": "count=exact", "Range-Unit": "items", "Range": "0-0"}
+
+# ---------------------------------------------------------------------------
+# Short-lived cache for idempotent reads
+# ---------------------------------------------------------------------------
+
+CACHE_TTL = 30.0
+CACHE_MAXSIZE = 500
+_cache: OrderedDict[tuple[Any, ...], tuple[float, DispatchResponse]] = OrderedDict()
+_inflight: dict[tuple[Any, ...], asyncio.Task[DispatchResponse]] = {}
+
+
+async def cached_dispatch(request: HttpRequest, *, ttl: float = CACHE_TTL) -> DispatchResponse:
+    """Dispatch a GET through an LRU cache whose entries live for *ttl* seconds.
+
+    Entries are keyed per caller (auth subject), so one user's rows are never
+    served to another. Concurrent misses for the same key share one request.
+    Writes and exact counts always go to Supabase.
+    """
+    ctx = get_context()
+    headers = request.headers or {}
+    if request.method is not HttpMethod.GET or headers.get("Prefer") == "count=exact":
+        return await ctx.dispatch(request)
+
+    key = (getattr(ctx.auth_context, "subject", None), request.path, tuple(sorted(headers.items())))
+    hit = _cache.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        _cache.move_to_end(key)
+        return hit[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        # Every waiter gets this task's outcome, failures included, so a failed
+        # fetch is not retried once per waiter. The task copies the current
+        # context, so get_context() still works inside it.
+        task = asyncio.ensure_future(_fetch_into_cache(key, request, ttl))
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_fetch_finished, key))
+    return await asyncio.shield(task)
+
+
+def _fetch_finished(key: tuple[Any, ...], task: asyncio.Task[DispatchResponse]) -> None:
+    del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # Mark retrieved even if every caller left; each waiter re-raises it itself.
+
+
+async def _fetch_into_cache(key: tuple[Any, ...], request: HttpRequest, ttl: float) -> DispatchResponse:
+    response = await get_context().dispatch(request)
+    if response.success:
+        _cache[key] = (time.monotonic() + ttl, response)
+        _cache.move_to_end(key)
+        if len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+    return response
+
 
 @tool(description="List all tables in the public schema")
 async def list_tables() -> list[dict]:
     """Query pg_tables via PostgREST to list available tables."""
-    ctx = get_context()
-    response = await ctx.dispatch(
-        HttpRequest(method=HttpMethod.GET, path="/rest/v1/rpc/get_tables", headers={"Prefer": "return=representation"})
+    response = await cached_dispatch(
+        HttpRequest(method=HttpMethod.GET, path="/rest/v1/rpc/get_tables", headers=_REPRESENTATION_HEADERS)
     )
     if response.success:
         return response.response.body
@@ -68,16 +136,12 @@ async def query_table(
         filter_column: Optional column to filter on
         filter_value: Optional value to filter by (uses eq)
     """
-    ctx = get_context()
-
-    # Build query path
-    path = f"/rest/v1/{table}?select={select}&limit={limit}"
+    params = [("select", select), ("limit", str(limit))]
     if filter_column and filter_value:
-        path += f"&{filter_column}=eq.{filter_value}"
+        params.append((filter_column, f"eq.{filter_value}"))
+    path = f"/rest/v1/{quote(table, safe='')}?{encode_query(params)}"
 
-    response = await ctx.dispatch(
-        HttpRequest(method=HttpMethod.GET, path=path, headers={"Prefer": "return=representation"})
-    )
+    response = await cached_dispatch(HttpRequest(method=HttpMethod.GET, path=path, headers=_REPRESENTATION_HEADERS))
     if response.success:
         return response.response.body
     return [{"error": response.error.message if response.error else "Query failed"}]
@@ -86,40 +150,104 @@ async def query_table(
 @tool(description="Count rows in a table")
 async def count_rows(table: str) -> dict:
     """Get row count for a table."""
-    ctx = get_context()
-    response = await ctx.dispatch(
-        HttpRequest(method=HttpMethod.GET, path=f"/rest/v1/{table}?select=count", headers={"Prefer": "count=exact"})
+    response = await cached_dispatch(
+        HttpRequest(
+            method=HttpMethod.GET, path=f"/rest/v1/{quote(table, safe='')}?select=*", headers=_COUNT_EXACT_HEADERS
+        )
     )
-    if response.success:
-        # PostgREST returns count in content-range header
-        return {"table": table, "count": len(response.response.body)}
+    count = content_range_total(response)
+    if count is not None:
+        return {"table": table, "count": count}
     return {"error": response.error.message if response.error else "Count failed"}
 
 
+# ---------------------------------------------------------------------------
+# Batched per-row lookups
+# ---------------------------------------------------------------------------
+
+
+class DataLoader:
+    """Coalesce ``load(key)`` calls made in the same event-loop tick into one batch call.
+
+    ``batch_load_fn`` receives unique keys and returns a ``{key: value}`` dict;
+    keys it omits resolve to ``None``. Queues are kept per caller (auth
+    subject) and each batch runs in that caller's context, so one user's
+    lookups never go out under another user's credentials.
+    """
+
+    def __init__(
+        self, batch_load_fn: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]], *, max_batch_size: int = 100
+    ) -> None:
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._queues: dict[Any, tuple[contextvars.Context, dict[Hashable, list[asyncio.Future[Any]]]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        loop = asyncio.get_running_loop()
+        if not self._queues:
+            loop.call_soon(self._flush)
+        subject = getattr(get_context().auth_context, "subject", None)
+        if subject not in self._queues:
+            self._queues[subject] = (contextvars.copy_context(), {})
+        future = loop.create_future()
+        self._queues[subject][1].setdefault(key, []).append(future)
+        return await future
+
+    def _flush(self) -> None:
+        queues, self._queues = self._queues, {}
+        for context, waiters in queues.values():
+            keys = list(waiters)
+            for start in range(0, len(keys), self._max_batch_size):
+                batch = {key: waiters[key] for key in keys[start : start + self._max_batch_size]}
+                task = asyncio.get_running_loop().create_task(self._run(batch), context=context)
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[Hashable, list[asyncio.Future[Any]]]) -> None:
+        try:
+            results = await self._batch_load_fn(list(batch))
+        except Exception as exc:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for key, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results.get(key))
+
+
+async def _batch_get_orgs(names: list[Hashable]) -> dict[Hashable, Any]:
+    """Fetch many organizations with one ``name=in.(...)`` query."""
+    in_list = ",".join(pg_quote(name) for name in names)  # double-quoted, so commas in names are safe
+    query = encode_query([("name", f"in.({in_list})"), ("select", "org_id,name,verified,created_at")])
+    response = await cached_dispatch(HttpRequest(method=HttpMethod.GET, path=f"/rest/v1/organizations?{query}"))
+    if not response.success or not isinstance(response.response.body, list):
+        return {}
+    return {org["name"]: org for org in response.response.body}
+
+
+org_loader = DataLoader(_batch_get_orgs, max_batch_size=100)
+
+
 @tool(description="Get organization details by name")
 async def get_organization(name: str) -> dict:
     """Look up an organization by name."""
-    ctx = get_context()
-    response = await ctx.dispatch(
-        HttpRequest(
-            method=HttpMethod.GET, path=f"/rest/v1/organizations?name=eq.{name}&select=org_id,name,verified,created_at"
-        )
-    )
-    if response.success and response.response.body:
-        return response.response.body[0]
+    org = await org_loader.load(name)
+    if org is not None:
+        return org
     return {"error": "Organization not found"}
 
 
 @tool(description="List recent API key events")
 async def list_api_key_events(limit: int = 5) -> list[dict]:
     """Get recent API key events for audit."""
-    ctx = get_context()
-    response = await ctx.dispatch(
-        HttpRequest(
-            method=HttpMethod.GET,
-            path=f"/rest/v1/api_key_events?select=event_type,created_at,old_status,new_status&order=created_at.desc&limit={limit}",
-        )
+    query = encode_query(
+        [("select", "event_type,created_at,old_status,new_status"), ("order", "created_at.desc"), ("limit", str(limit))]
     )
+    response = await cached_dispatch(HttpRequest(method=HttpMethod.GET, path=f"/rest/v1/api_key_events?{query}"))
     if response.success:
         return response.response.body
     return [{"error": response.error.message if response.error else "Query failed"}]
@@ -144,8 +272,8 @@ async def main():
     supabase_cred = Credential(supabase, apikey=key)
 
     print(f"Server: {server.name}")
-    print(f"Tools: {server.tool_names}")
-    print(f"Connections: {list(server.connections.keys())}")
+    print(f"Tools: {', '.join(server.tool_names)}")
+    print(f"Connections: {', '.join(server.connections)}")
     print(f"Supabase URL: {url}")
 
     # ---------------------------------------------------------------------------
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Fan out many tool calls without flooding the server.
+
+``asyncio.gather`` over a large batch starts every call at once. Against a
+server whose tools front a rate-limited API (Supabase allows ~60 req/s), that
+burst mostly buys 429s and retries. This pattern caps in-flight calls with a
+semaphore and backs off exponentially when the server answers 429.
+
+- ``run_tools_concurrently`` runs ``(name, arguments)`` specs in an
+  ``asyncio.TaskGroup``, at most ``max_concurrency`` at a time, and returns
+  results in spec order. If one call fails, the rest are cancelled.
+- ``RetryOn429Transport`` retries a single HTTP request on 429, honoring
+  ``Retry-After`` when the server sends it. The retry has to live at the HTTP
+  layer: the MCP transport raises HTTP errors inside its own task group and
+  tears the session down, so a try/except around ``call_tool`` never sees them.
+
+Usage:
+    # Start a server first:
+    uv run python examples/showcase/01_minimal.py
+
+    # Then run this:
+    uv run python examples/patterns/bounded_concurrency.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import random
+from typing import Any
+
+import httpx
+from mcp.types import CallToolResult
+
+from dedalus_mcp.client import MCPClient
+from dedalus_mcp.utils import quiet_third_party
+
+
+quiet_third_party()
+
+SERVER_URL = "http://127.0.0.1:8000/mcp"
+MAX_CONCURRENCY = 64
+MAX_ATTEMPTS = 5
+BASE_DELAY = 0.5  # seconds; doubles per retry
+
+
+class RetryOn429Transport(httpx.AsyncBaseTransport):
+    """Wrap a transport and retry requests answered with HTTP 429, using jittered exponential backoff."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport | None = None) -> None:
+        self._inner = inner or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 1
+        while True:
+            response = await self._inner.handle_async_request(request)
+            if response.status_code != httpx.codes.TOO_MANY_REQUESTS or attempt >= MAX_ATTEMPTS:
+                return response
+            retry_after = response.headers.get("retry-after", "")
+            await response.aclose()
+            delay = float(retry_after) if retry_after.isdigit() else BASE_DELAY * 2 ** (attempt - 1)
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def retrying_http_client() -> httpx.AsyncClient:
+    """An httpx client with the MCP SDK's defaults plus 429 retries."""
+    return httpx.AsyncClient(
+        transport=RetryOn429Transport(), follow_redirects=True, timeout=httpx.Timeout(30, read=300)
+    )
+
+
+async def run_tools_concurrently(
+    client: MCPClient, specs: Iterable[tuple[str, dict[str, Any]]], *, max_concurrency: int = MAX_CONCURRENCY
+) -> list[CallToolResult]:
+    """Run tool calls with at most *max_concurrency* in flight; results keep spec order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(name: str, arguments: dict[str, Any]) -> CallToolResult:
+        async with semaphore:
+            return await client.call_tool(name, arguments)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(bounded(name, arguments)) for name, arguments in specs]
+    return [task.result() for task in tasks]
+
+
+async def main() -> None:
+    async with retrying_http_client() as http_client:
+        async with await MCPClient.connect(SERVER_URL, http_client=http_client) as client:
+            specs = [("add", {"a": i, "b": i}) for i in range(200)]
+            results = await run_tools_concurrently(client, specs, max_concurrency=16)
+            print(f"Ran {len(results)} calls; last result: {results[-1].content[0].text}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
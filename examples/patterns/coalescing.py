@@ -0,0 +1,52 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Share one in-flight tool call among concurrent identical callers.
+
+A burst of the same prompt against a paid API (OpenAI, Anthropic) otherwise
+costs one request per caller. ``coalesce`` runs the first call as its own task
+and has every caller, the first included, await it through ``asyncio.shield``:
+cancelling any one caller abandons only that caller's wait, so the others still
+get the result.
+
+Keys include the caller's auth subject so results never cross users.
+
+Usage (from a server script under examples/):
+    from patterns.coalescing import coalesce
+
+    @tool(description="Ask the model")
+    @coalesce
+    async def ask(question: str) -> dict: ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import functools
+from typing import Any
+
+from dedalus_mcp import get_context
+
+
+def coalesce(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Share one in-flight call among concurrent callers with identical arguments."""
+    inflight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+
+    def _finished(key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+        del inflight[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller left; each waiter re-raises it itself.
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = (getattr(get_context().auth_context, "subject", None), *args, *sorted(kwargs.items()))
+        task = inflight.get(key)
+        if task is None:
+            # The task copies the current context, so get_context() still works inside fn.
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            inflight[key] = task
+            task.add_done_callback(functools.partial(_finished, key))
+        return await asyncio.shield(task)
+
+    return wrapper
@@ -26,13 +26,12 @@ Usage:
 """
 
 import asyncio
-import logging
 
 from dedalus_mcp.client import MCPClient
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 SERVER_URL = "http://127.0.0.1:8000/mcp"
 
@@ -17,15 +17,15 @@ Usage:
 """
 
 import asyncio
-import logging
+import functools
 
 import anyio
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
-for name in ("mcp", "httpx", "uvicorn"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 
 # ============================================================================
@@ -107,10 +107,19 @@ def create_admin_server() -> MCPServer:
 # ============================================================================
 
 
+def prepare(server: MCPServer) -> MCPServer:
+    """Validate and build tool schemas now, so serve() only has to bind its socket.
+
+    This is CPU work, so it runs up front rather than inside the task group;
+    the socket binds below then overlap across servers.
+    """
+    server.validate()
+    server.tools.definitions  # noqa: B018 - builds and caches tool schemas
+    return server
+
+
 async def main() -> None:
-    public = create_public_server()
-    internal = create_internal_server()
-    admin = create_admin_server()
+    public, internal, admin = map(prepare, (create_public_server(), create_internal_server(), create_admin_server()))
 
     print("=" * 60)
     print("Multi-Server Demo: Same tools, different configurations")
@@ -124,9 +133,8 @@ async def main() -> None:
     print("\n" + "=" * 60)
 
     async with anyio.create_task_group() as tg:
-        tg.start_soon(public.serve, "streamable-http", 8000)
-        tg.start_soon(internal.serve, "streamable-http", 8001)
-        tg.start_soon(admin.serve, "streamable-http", 8002)
+        for server, port in ((public, 8000), (internal, 8001), (admin, 8002)):
+            tg.start_soon(functools.partial(server.serve, transport="streamable-http", port=port, validate=False))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Small helpers for talking to PostgREST (Supabase's REST layer) via dispatch.
+
+- ``encode_query`` percent-encodes params but keeps PostgREST's ``,.*`` syntax readable.
+- ``pg_quote`` double-quotes one value for an ``in.(...)`` filter, so commas
+  and parentheses inside names stay part of the value.
+- ``content_range_total`` reads the row total from a ``Prefer: count=exact``
+  response without fetching the rows.
+
+Usage (from a script in examples/):
+    from patterns.postgrest import content_range_total, encode_query, pg_quote
+
+    names = ",".join(pg_quote(n) for n in org_names)
+    path = f"/rest/v1/organizations?{encode_query([('name', f'in.({names})')])}"
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import quote, urlencode
+
+
+if TYPE_CHECKING:
+    from dedalus_mcp import DispatchResponse
+
+
+def encode_query(params: list[tuple[str, str]]) -> str:
+    """Percent-encode PostgREST query params, keeping its `,.*` syntax readable."""
+    return urlencode(params, quote_via=quote, safe=",.*")
+
+
+def pg_quote(value: object) -> str:
+    """Double-quote a value for a PostgREST ``in.(...)`` list; only ``\\`` and ``"`` need escaping."""
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def content_range_total(response: DispatchResponse) -> int | None:
+    """Read the row total PostgREST puts in ``Content-Range: 0-0/12345``."""
+    if not response.success or response.response is None:
+        return None
+    for name, value in response.response.headers.items():
+        if name.lower() == "content-range":
+            total = value.rsplit("/", 1)[-1]
+            return int(total) if total.isdigit() else None
+    return None
@@ -160,7 +160,7 @@ async def running_server(server: MCPServer):
     @asynccontextmanager
     async def serve_background():
         task = asyncio.create_task(server.serve(port=18765))
-        await asyncio.sleep(0.5)  # Wait for startup
+        await server.wait_until_ready()
         try:
             yield server
         finally:
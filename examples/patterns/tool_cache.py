@@ -0,0 +1,84 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Reuse a server's tools/list result across connects and runs.
+
+Tool schemas rarely change between server releases, yet a client that
+reconnects (a CLI run, an agent loop) pays a tools/list round-trip every
+time. ``list_tools_cached`` keeps results in a small JSON file under
+``$XDG_CACHE_HOME/dedalus-mcp/`` for ``ttl`` seconds.
+
+- Entries are keyed by server URL and negotiated protocol version, so two
+  servers never share a listing and a protocol bump forces a refetch.
+- Any unreadable, partial, or stale entry is a cache miss, never an error.
+- MCPClient does not surface ``notifications/tools/list_changed``, so the
+  TTL bounds staleness; delete the file to force a refetch.
+
+Usage (client scripts in sibling directories put examples/ on sys.path first):
+    from patterns.tool_cache import list_tools_cached
+
+    tools = await list_tools_cached(client, SERVER_URL)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+from dedalus_mcp.types import ListToolsResult
+
+
+if TYPE_CHECKING:
+    from dedalus_mcp.client import MCPClient
+
+
+CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dedalus-mcp" / "tools.json"
+DEFAULT_TTL = 300.0
+
+
+def _load(path: Path) -> dict[str, Any]:
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _hit(entry: Any) -> ListToolsResult | None:
+    try:
+        if entry["expires_at"] > time.time():
+            return ListToolsResult.model_validate(entry["result"])
+    except (KeyError, TypeError, ValueError):  # pydantic's ValidationError is a ValueError
+        pass
+    return None
+
+
+async def list_tools_cached(
+    client: MCPClient, server_url: str, *, ttl: float = DEFAULT_TTL, path: Path = CACHE_PATH
+) -> ListToolsResult:
+    """Return tools/list for *server_url*, fetching only on a miss or expiry."""
+    key = hashlib.sha256(f"{server_url}|{client.initialize_result.protocolVersion}".encode()).hexdigest()
+    cache = _load(path)
+    cached = _hit(cache.get(key))
+    if cached is not None:
+        return cached
+
+    result = await client.list_tools()
+    cache[key] = {
+        "expires_at": time.time() + ttl,
+        "result": result.model_dump(mode="json", by_alias=True, exclude_none=True),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write a sibling file and rename it over the cache, so readers never see half a file
+        with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as tmp:
+            json.dump(cache, tmp)
+        Path(tmp.name).replace(path)
+    except OSError:
+        pass  # An unwritable cache only costs the next run a round-trip
+    return result
@@ -14,14 +14,12 @@ Usage:
 """
 
 import asyncio
-import logging
 
 from dedalus_mcp.client import MCPClient
+from dedalus_mcp.utils import quiet_third_party
 
 
-# Suppress log noise for clean output
-for name in ("mcp", "httpx"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 
 async def main() -> None:
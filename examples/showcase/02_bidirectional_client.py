@@ -16,37 +16,39 @@ Usage:
 """
 
 import asyncio
-import logging
+from functools import lru_cache
 
 from dedalus_mcp.client import ClientCapabilitiesConfig, MCPClient
-from dedalus_mcp.types import CreateMessageResult, TextContent
+from dedalus_mcp.types import CreateMessageResult, SamplingMessage, TextContent
+from dedalus_mcp.utils import quiet_third_party
 
 
-# Suppress log noise
-for name in ("mcp", "httpx"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
+# Keyword -> canned reply, checked in order; first match wins
+_ROUTES = (
+    ("sentiment", "positive"),
+    ("summarize", "A brief overview of the key concepts."),
+    ("facts", "1. Interesting fact one.\n2. Interesting fact two.\n3. Interesting fact three."),
+)
+_DEFAULT_REPLY = "I understand your request."
 
-async def mock_llm(messages: list, max_tokens: int) -> str:
-    """Mock LLM that returns canned responses. Replace with real provider."""
-    content = ""
-    if messages:
-        msg = messages[-1]
-        if hasattr(msg, "content"):
-            c = msg.content
-            content = c.text if hasattr(c, "text") else str(c)
-        elif isinstance(msg, dict):
-            content = msg.get("content", "")
 
+@lru_cache(maxsize=256)
+def _classify(content: str) -> str:
     content_lower = content.lower()
+    for keyword, reply in _ROUTES:
+        if keyword in content_lower:
+            return reply
+    return _DEFAULT_REPLY
+
 
-    if "sentiment" in content_lower:
-        return "positive"
-    if "summarize" in content_lower:
-        return "A brief overview of the key concepts."
-    if "facts" in content_lower:
-        return "1. Interesting fact one.\n2. Interesting fact two.\n3. Interesting fact three."
-    return "I understand your request."
+async def mock_llm(messages: list[SamplingMessage], max_tokens: int) -> str:
+    """Mock LLM that returns canned responses. Replace with real provider."""
+    if not messages:
+        return _DEFAULT_REPLY
+    content = messages[-1].content
+    return _classify(content.text if isinstance(content, TextContent) else str(content))
 
 
 async def sampling_handler(context, params) -> CreateMessageResult:
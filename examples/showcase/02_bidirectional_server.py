@@ -17,18 +17,25 @@ Usage:
 """
 
 import asyncio
-import logging
 
 from dedalus_mcp import MCPServer, get_context, tool
 from dedalus_mcp.types import CreateMessageRequestParams, SamplingMessage, TextContent
+from dedalus_mcp.utils import quiet_third_party
 
 
-# Suppress log noise
-for name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer("bidirectional", instructions="I can ask you for LLM help mid-tool")
 
+_SENTIMENT_PROMPT = "Analyze the sentiment of this text. Reply with just: positive, negative, or neutral.\n\nText: "
+
+
+def _ask(prompt: str, max_tokens: int) -> CreateMessageRequestParams:
+    # Every field here is a plain str/int we built ourselves, so skip pydantic validation
+    content = TextContent.model_construct(type="text", text=prompt)
+    message = SamplingMessage.model_construct(role="user", content=content)
+    return CreateMessageRequestParams.model_construct(messages=[message], maxTokens=max_tokens)
+
 
 @tool(description="Analyze text sentiment using the connected LLM")
 async def analyze_sentiment(text: str) -> dict:
@@ -42,18 +49,7 @@ async def analyze_sentiment(text: str) -> dict:
     await ctx.info(f"Analyzing: {text[:50]}...")
 
     # Server requests LLM completion from client via sampling
-    params = CreateMessageRequestParams(
-        messages=[
-            SamplingMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"Analyze the sentiment of this text. Reply with just: positive, negative, or neutral.\n\nText: {text}",
-                ),
-            )
-        ],
-        maxTokens=10,
-    )
+    params = _ask(_SENTIMENT_PROMPT + text, max_tokens=10)
 
     response = await mcp_server.request_sampling(params)
     sentiment = response.content.text.strip().lower()
@@ -70,28 +66,14 @@ async def summarize_and_expand(topic: str) -> dict:
 
     # Step 1: Get summary
     await ctx.info("Step 1: Summarizing...")
-    params1 = CreateMessageRequestParams(
-        messages=[
-            SamplingMessage(role="user", content=TextContent(type="text", text=f"Summarize '{topic}' in one sentence."))
-        ],
-        maxTokens=100,
-    )
+    params1 = _ask(f"Summarize '{topic}' in one sentence.", max_tokens=100)
     summary_response = await mcp_server.request_sampling(params1)
     summary = summary_response.content.text
 
     # Step 2: Expand based on summary
     await ctx.info("Step 2: Expanding...")
-    params2 = CreateMessageRequestParams(
-        messages=[
-            SamplingMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=f"Given this summary: '{summary}'\n\nNow provide three interesting facts about {topic}.",
-                ),
-            )
-        ],
-        maxTokens=300,
+    params2 = _ask(
+        f"Given this summary: '{summary}'\n\nNow provide three interesting facts about {topic}.", max_tokens=300
     )
     expansion_response = await mcp_server.request_sampling(params2)
     expansion = expansion_response.content.text
@@ -22,30 +22,28 @@ Usage:
 """
 
 import asyncio
-import logging
 
 import httpx
 
 from dedalus_mcp.client import MCPClient
+from dedalus_mcp.utils import quiet_third_party
 
 
-# Suppress log noise
-for name in ("mcp", "httpx"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
+CONTROL_API_URL = "http://127.0.0.1:8001"
 
-async def add_tool_via_api(name: str, description: str) -> None:
+
+async def add_tool_via_api(api: httpx.AsyncClient, name: str, description: str) -> None:
     """Add a tool via the control API."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post("http://127.0.0.1:8001/tools", json={"name": name, "description": description})
-        print(f"API Response: {resp.json()}")
+    resp = await api.post("/tools", json={"name": name, "description": description})
+    print(f"API Response: {resp.json()}")
 
 
-async def remove_tool_via_api(name: str) -> None:
+async def remove_tool_via_api(api: httpx.AsyncClient, name: str) -> None:
     """Remove a tool via the control API."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.delete(f"http://127.0.0.1:8001/tools/{name}")
-        print(f"API Response: {resp.json()}")
+    resp = await api.delete(f"/tools/{name}")
+    print(f"API Response: {resp.json()}")
 
 
 async def main() -> None:
@@ -60,9 +58,13 @@ async def main() -> None:
 
     print("--- Demo: Adding and removing tools at runtime ---\n")
 
+    # One pooled client for every control-API call, so each add/remove reuses
+    # the same keep-alive connection instead of opening a new one.
+    api = httpx.AsyncClient(base_url=CONTROL_API_URL)
+
     # Add a tool
     print("Adding 'calculator' tool via control API...")
-    await add_tool_via_api("calculator", "Perform calculations")
+    await add_tool_via_api(api, "calculator", "Perform calculations")
 
     # Give server time to notify
     await asyncio.sleep(0.5)
@@ -77,7 +79,7 @@ async def main() -> None:
 
     # Add another
     print("Adding 'translate' tool via control API...")
-    await add_tool_via_api("translate", "Translate text between languages")
+    await add_tool_via_api(api, "translate", "Translate text between languages")
 
     await asyncio.sleep(0.5)
     tools = await client.list_tools()
@@ -85,12 +87,13 @@ async def main() -> None:
 
     # Remove a tool
     print("Removing 'calculator' tool via control API...")
-    await remove_tool_via_api("calculator")
+    await remove_tool_via_api(api, "calculator")
 
     await asyncio.sleep(0.5)
     tools = await client.list_tools()
     print(f"Tools after remove: {[t.name for t in tools.tools]}\n")
 
+    await api.aclose()
     await client.close()
     print("Demo complete!")
 
@@ -22,7 +22,6 @@ Usage:
 """
 
 import asyncio
-import logging
 from typing import Any
 
 import anyio
@@ -30,14 +29,14 @@ from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.routing import Route
+from timestamps import iso_now
 import uvicorn
 
 from dedalus_mcp import MCPServer, tool
+from dedalus_mcp.utils import quiet_third_party
 
 
-# Suppress log noise
-for name in ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error"):
-    logging.getLogger(name).setLevel(logging.WARNING)
+quiet_third_party()
 
 server = MCPServer(
     "realtime",
@@ -54,9 +53,8 @@ def health() -> str:
 
 @tool(description="Get server time")
 def server_time() -> str:
-    from datetime import datetime
-
-    return datetime.now().isoformat()
+    # Watchdogs poll this in a tight loop; one formatted string per second serves them all
+    return iso_now()
 
 
 server.collect(health, server_time)
@@ -96,11 +94,9 @@ async def remove_tool_handler(request: Request) -> JSONResponse:
     """DELETE /tools/{name} - Remove a tool at runtime."""
     name = request.path_params["name"]
 
-    if name in dynamic_tools:
-        # Remove from allow list (effectively hides it)
-        current = server.tools.tool_names
-        server.tools.allow_tools([n for n in current if n != name])
-        del dynamic_tools[name]
+    # pop() rather than del so two concurrent DELETEs for the same tool can't KeyError
+    if dynamic_tools.pop(name, None) is not None:
+        server.remove_tool(name)
 
         await server.notify_tools_list_changed()
         return JSONResponse({"status": "removed", "name": name})
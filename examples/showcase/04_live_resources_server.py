@@ -14,28 +14,35 @@ Usage:
 """
 
 import asyncio
-from datetime import datetime
 import random
 
+from timestamps import iso_now
+
 from dedalus_mcp import MCPServer, get_context, resource, tool
 
 
 server = MCPServer("live-resources", instructions="Subscribe to live data feeds")
 
 
-# Simulated live data
+# Simulated live data. simulate_market publishes fresh dicts instead of
+# mutating these in place, so readers can hand them out without copying.
 stock_prices = {"AAPL": 175.50, "GOOGL": 140.25, "MSFT": 380.00}
 system_metrics = {"cpu": 45.0, "memory": 62.0, "requests_per_sec": 1250}
 
+PRICES_URI = "stocks://prices"
+METRICS_URI = "system://metrics"
+# Feeds refreshed on every simulate_market tick
+_LIVE_FEEDS = (PRICES_URI, METRICS_URI)
+
 
-@resource(uri="stocks://prices", description="Live stock prices")
+@resource(uri=PRICES_URI, description="Live stock prices")
 def get_stock_prices() -> dict:
-    return {"timestamp": datetime.now().isoformat(), "prices": stock_prices.copy()}
+    return {"timestamp": iso_now(), "prices": stock_prices}
 
 
-@resource(uri="system://metrics", description="Live system metrics")
+@resource(uri=METRICS_URI, description="Live system metrics")
 def get_system_metrics() -> dict:
-    return {"timestamp": datetime.now().isoformat(), "metrics": system_metrics.copy()}
+    return {"timestamp": iso_now(), "metrics": system_metrics}
 
 
 @resource(uri="stocks://price/{symbol}", description="Single stock price")
@@ -43,7 +50,7 @@ def get_stock_price(symbol: str) -> dict:
     price = stock_prices.get(symbol.upper())
     if price is None:
         return {"error": f"Unknown symbol: {symbol}"}
-    return {"symbol": symbol.upper(), "price": price, "timestamp": datetime.now().isoformat()}
+    return {"symbol": symbol.upper(), "price": price, "timestamp": iso_now()}
 
 
 @tool(description="Subscribe to a resource for live updates")
@@ -60,21 +67,22 @@ server.collect(get_stock_prices, get_system_metrics, get_stock_price, subscribe)
 
 async def simulate_market() -> None:
     """Simulate market movements and push updates."""
+    global stock_prices, system_metrics
     while True:
         await asyncio.sleep(2)
 
         # Random price movements
-        for symbol in stock_prices:
-            change = random.uniform(-2.0, 2.0)
-            stock_prices[symbol] = round(stock_prices[symbol] + change, 2)
+        stock_prices = {symbol: round(price + random.uniform(-2.0, 2.0), 2) for symbol, price in stock_prices.items()}
 
         # Random metric changes
-        system_metrics["cpu"] = round(random.uniform(20, 80), 1)
-        system_metrics["memory"] = round(random.uniform(50, 90), 1)
-        system_metrics["requests_per_sec"] = random.randint(800, 2000)
-
-        # Notify subscribers
-        await server.notify_resources_list_changed()
+        system_metrics = {
+            "cpu": round(random.uniform(20, 80), 1),
+            "memory": round(random.uniform(50, 90), 1),
+            "requests_per_sec": random.randint(800, 2000),
+        }
+
+        # One batched resources/updated per feed for the whole tick
+        await server.notify_resources_updated(_LIVE_FEEDS)
 
 
 async def main() -> None:
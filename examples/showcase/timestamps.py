@@ -0,0 +1,27 @@
+# Copyright (c) 2026 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Wall-clock timestamps shared by the showcase servers.
+
+Health polls and live-resource reads ask for the time far more often than the
+second changes. ``iso_now`` formats each second once and hands the same string
+to every caller within it.
+
+Usage (from a server script in this directory):
+    from timestamps import iso_now
+"""
+
+from datetime import datetime
+import time
+
+
+_cached: tuple[int, str] = (0, "")
+
+
+def iso_now() -> str:
+    """Current local time in ISO 8601, at one-second precision."""
+    global _cached
+    second = int(time.time())
+    if _cached[0] != second:
+        _cached = (second, datetime.fromtimestamp(second).isoformat())
+    return _cached[1]
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from dedalus_mcp.auth.dpop import BearerAuth, DPoPAuth, generate_dpop_proof
 
-from .connection import open_connection
+from .connection import create_http_client, open_connection
 from .core import ClientCapabilitiesConfig, MCPClient
 from .errors import (
     AuthRequiredError,
@@ -40,6 +40,7 @@ __all__ = [
     "DPoPAuth",
     "generate_dpop_proof",
     # Transports
+    "create_http_client",
     "lambda_http_client",
     # Errors
     "MCPConnectionError",
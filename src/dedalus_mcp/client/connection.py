@@ -22,13 +22,24 @@ StreamableHTTPNames = {"streamable-http", "streamable_http", "shttp", "http"}
 LambdaHTTPNames = {"lambda-http", "lambda_http"}
 
 
-def _build_http_client(
-    headers: Mapping[str, str] | None,
-    timeout: float | timedelta,
-    sse_read_timeout: float | timedelta,
-    auth: httpx.Auth | None,
+def create_http_client(
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: float | timedelta = 30,
+    sse_read_timeout: float | timedelta = 300,
+    auth: httpx.Auth | None = None,
 ) -> httpx.AsyncClient:
-    """Build an httpx.AsyncClient with MCP-appropriate settings."""
+    """Build an httpx.AsyncClient with MCP-appropriate settings.
+
+    Pass the result to ``MCPClient.connect(..., http_client=...)`` to share one
+    connection pool across connects. The caller owns and closes it.
+
+    Args:
+        headers: Optional HTTP headers, merged over the MCP protocol version header.
+        timeout: Total request timeout.
+        sse_read_timeout: Streaming read timeout for Server-Sent Events.
+        auth: Optional HTTPX authentication handler.
+    """
     # Build headers with MCP protocol version
     base_headers: dict[str, str] = {MCP_PROTOCOL_VERSION: LATEST_PROTOCOL_VERSION}
     if headers:
@@ -76,7 +87,7 @@ async def open_connection(
     selected = transport.lower()
 
     if selected in StreamableHTTPNames:
-        client = _build_http_client(headers, timeout, sse_read_timeout, auth)
+        client = create_http_client(headers=headers, timeout=timeout, sse_read_timeout=sse_read_timeout, auth=auth)
 
         async with client:
             async with (
@@ -97,7 +108,7 @@ async def open_connection(
         return
 
     if selected in LambdaHTTPNames:
-        client = _build_http_client(headers, timeout, sse_read_timeout, auth)
+        client = create_http_client(headers=headers, timeout=timeout, sse_read_timeout=sse_read_timeout, auth=auth)
 
         async with client:
             async with (
@@ -165,10 +165,11 @@ class MCPClient:
         transport: str = "streamable-http",
         capabilities: ClientCapabilitiesConfig | None = None,
         client_info: Implementation | None = None,
-        timeout: float = 30,
-        sse_read_timeout: float = 300,
+        timeout: float | None = None,
+        sse_read_timeout: float | None = None,
         headers: dict[str, str] | None = None,
         auth: httpx.Auth | None = None,
+        http_client: httpx.AsyncClient | None = None,
         _transport_override: Any = None,
     ) -> MCPClient:
         """Connect to an MCP server and return an initialized client.
@@ -182,11 +183,17 @@ class MCPClient:
             transport: Transport type ("streamable-http" or "lambda-http")
             capabilities: Optional client capability handlers
             client_info: Client implementation metadata
-            timeout: Request timeout in seconds
-            sse_read_timeout: SSE read timeout in seconds
+            timeout: Request timeout in seconds (default 30)
+            sse_read_timeout: SSE read timeout in seconds (default 300)
             headers: Optional HTTP headers
             auth: Optional httpx.Auth handler for authorization. Use
                 `dedalus_mcp.auth.dpop.DPoPAuth` for DPoP-bound tokens.
+            http_client: Optional caller-owned httpx.AsyncClient. Reusing one
+                client across sequential connects keeps its connection pool
+                (and TLS sessions) warm. The client is not closed by
+                `close()`; configure headers, auth, and timeouts on it
+                directly. Build it with `dedalus_mcp.client.create_http_client`
+                to keep the SDK's defaults.
             _transport_override: Internal use only (for testing)
 
         Returns:
@@ -218,9 +225,15 @@ class MCPClient:
             client.initialize_result = await _transport_override.initialize()
             return client
 
+        if http_client is not None and (
+            headers or auth is not None or timeout is not None or sse_read_timeout is not None
+        ):
+            msg = "headers, auth, and timeouts must be configured on http_client when one is supplied"
+            raise ValueError(msg)
+
         # Real implementation: use transport helpers
         from mcp.client.streamable_http import MCP_PROTOCOL_VERSION, streamable_http_client
-        from mcp.shared._httpx_utils import create_mcp_http_client
+        from mcp.shared._httpx_utils import MCP_DEFAULT_SSE_READ_TIMEOUT, MCP_DEFAULT_TIMEOUT, create_mcp_http_client
         from mcp.types import LATEST_PROTOCOL_VERSION
 
         from .transports import lambda_http_client
@@ -229,15 +242,18 @@ class MCPClient:
 
         try:
             try:
-                # Build httpx client with MCP-appropriate settings
-                base_headers: dict[str, str] = {MCP_PROTOCOL_VERSION: LATEST_PROTOCOL_VERSION}
-                if headers:
-                    base_headers.update(headers)
-
-                http_client = create_mcp_http_client(
-                    headers=base_headers, timeout=httpx.Timeout(timeout, read=sse_read_timeout), auth=auth
-                )
-                await exit_stack.enter_async_context(http_client)
+                if http_client is None:
+                    # Build httpx client with MCP-appropriate settings
+                    base_headers: dict[str, str] = {MCP_PROTOCOL_VERSION: LATEST_PROTOCOL_VERSION}
+                    if headers:
+                        base_headers.update(headers)
+
+                    http_timeout = httpx.Timeout(
+                        MCP_DEFAULT_TIMEOUT if timeout is None else timeout,
+                        read=MCP_DEFAULT_SSE_READ_TIMEOUT if sse_read_timeout is None else sse_read_timeout,
+                    )
+                    http_client = create_mcp_http_client(headers=base_headers, timeout=http_timeout, auth=auth)
+                    await exit_stack.enter_async_context(http_client)
 
                 transport_lower = transport.lower()
                 if transport_lower in {"streamable-http", "streamable_http", "shttp", "http"}:
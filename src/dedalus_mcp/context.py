@@ -9,17 +9,19 @@ Provides access to logging, progress, and session info within tool/resource hand
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator, Mapping
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
 import os
 from typing import TYPE_CHECKING, Any, cast
 
+import anyio
 from mcp.server.lowlevel.server import request_ctx
 from mcp.shared.context import RequestContext
 from mcp.types import LoggingLevel, ProgressToken
 
+from .dispatch import DispatchBackend, DispatchWireRequest, HttpRequest
 from .exceptions import ConnectionResolutionError
 from .progress import ProgressConfig, ProgressTelemetry, ProgressTracker
 from .progress import progress as progress_manager
@@ -162,10 +164,15 @@ class Context:
             message: Human-readable message describing the event.
             logger: Optional logger name for client-side routing.
             data: Optional structured payload merged into the log body.
+
+        Messages below the level the client set via ``logging/setLevel`` are
+        dropped before the payload is built or serialized.
         """
-        payload: dict[str, Any] = {"msg": message}
-        if data:
-            payload.update(dict(data))
+        server = self.server
+        if server is not None and not server.logging_service.accepts(self.session, level):
+            return
+
+        payload: dict[str, Any] = {"msg": message, **data} if data else {"msg": message}
 
         await self._request_context.session.send_log_message(level=level, data=payload, logger=logger)
 
@@ -253,10 +260,6 @@ class Context:
             >>> if response.success:
             ...     print(response.response.body)
         """
-        from .dispatch import DispatchBackend, DispatchWireRequest, HttpRequest
-        from .server.connectors import Connection
-        from .server.services.connection_gate import validate_handle_format
-
         # Handle overloaded signature: dispatch(HttpRequest) or dispatch(target, HttpRequest)
         if request is None:
             # Single arg: target is actually the request
@@ -272,7 +275,63 @@ class Context:
             http_request = request
             connection_target = target
 
-        # Get runtime config
+        backend, connection_handle, authorization_token = self._prepare_dispatch(connection_target)
+        wire_request = DispatchWireRequest(
+            connection_handle=connection_handle, request=http_request, authorization=authorization_token
+        )
+        return await backend.dispatch(wire_request)
+
+    async def dispatch_many(
+        self, requests: Iterable[HttpRequest], /, *, target: Connection | str | None = None
+    ) -> list[DispatchResponse]:
+        """Execute independent HTTP requests concurrently through the dispatch backend.
+
+        ``target`` accepts the same forms as in :meth:`dispatch` and is
+        resolved once, before any request is sent, so resolution failures
+        raise directly. Wall time is the slowest request rather than the sum,
+        and the backend's pooled client lets the requests share connections.
+
+        Example:
+            >>> user, repos = await ctx.dispatch_many(
+            ...     [
+            ...         HttpRequest(method=HttpMethod.GET, path="/user"),
+            ...         HttpRequest(method=HttpMethod.GET, path="/user/repos"),
+            ...     ],
+            ...     target="github",
+            ... )
+
+        Returns:
+            Responses in the same order as ``requests``.
+        """
+        pending = list(requests)
+        for request in pending:
+            if not isinstance(request, HttpRequest):
+                msg = f"expected HttpRequest, got {type(request).__name__}"
+                raise TypeError(msg)
+
+        backend, connection_handle, authorization_token = self._prepare_dispatch(target)
+        results: list[Any] = [None] * len(pending)
+
+        async def run(index: int, request: HttpRequest) -> None:
+            results[index] = await backend.dispatch(
+                DispatchWireRequest(
+                    connection_handle=connection_handle, request=request, authorization=authorization_token
+                )
+            )
+
+        async with anyio.create_task_group() as tg:
+            for index, request in enumerate(pending):
+                tg.start_soon(run, index, request)
+        return results
+
+    def _prepare_dispatch(self, connection_target: Connection | str | None) -> tuple[DispatchBackend, str, str | None]:
+        """Resolve the backend, connection handle, and caller JWT for a dispatch.
+
+        Raises the same errors as :meth:`dispatch`, before any request is sent.
+        """
+        from .server.connectors import Connection
+        from .server.services.connection_gate import validate_handle_format
+
         runtime = self.runtime
         if not isinstance(runtime, Mapping):
             raise RuntimeError("Dispatch backend not configured")
@@ -372,12 +431,7 @@ class Context:
         """
             raise RuntimeError(msg)
 
-        # Build and execute wire request
-        wire_request = DispatchWireRequest(
-            connection_handle=connection_handle, request=http_request, authorization=authorization_token
-        )
-
-        return await backend.dispatch(wire_request)
+        return backend, connection_handle, authorization_token
 
     # ------------------------------------------------------------------
     # Construction helpers
@@ -10,21 +10,48 @@ Backends:
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from enum import Enum, StrEnum
 import hashlib
 import hmac
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import json
+import re
 import time
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 from urllib.parse import quote
 
+import anyio
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .utils import get_logger
 
 
+if TYPE_CHECKING:
+    import httpx
+
 _logger = get_logger("dedalus_mcp.dispatch")
 
+try:
+    import orjson  # faster JSON for dispatch bodies (dedalus_mcp[opt])
+
+    def _json_dumps(obj: object) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:  # e.g. integers wider than 64 bits
+            return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads: Callable[[bytes | str], Any] = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+# A "%" that does not start a percent-escape
+_LONE_PERCENT = re.compile(r"%(?![0-9A-Fa-f]{2})")
+
 
 # =============================================================================
 # HTTP Types (New Dispatch Model)
@@ -77,7 +104,9 @@ class HttpRequest(BaseModel):
             path_part, query_part = v.split("?", 1)
             # Encode query while keeping structure chars (=&,.*) intact
             # This handles PostgREST operators like "NOT IN (...)" safely
-            encoded_query = quote(query_part, safe="=&,.*-_~:")
+            # Existing %XX escapes (e.g. from urlencode) are kept, not re-encoded
+            query_part = _LONE_PERCENT.sub("%25", query_part)
+            encoded_query = quote(query_part, safe="=&,.*-_~:%")
             return f"{path_part}?{encoded_query}"
         return v
 
@@ -231,6 +260,73 @@ class DispatchBackend(Protocol):
         ...
 
 
+def _stateless_cookie_jar() -> CookieJar:
+    """Cookie jar that stores nothing.
+
+    Pooled clients serve many callers; keeping Set-Cookie state would leak one
+    user's downstream session into another user's requests.
+    """
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+async def _send_without_jar(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str],
+    content: bytes | str | None,
+    timeout: float,
+) -> httpx.Response:
+    """Send through *client* without replaying cookies from its jar.
+
+    An injected client belongs to the caller, so its jar is left in place, but
+    it serves every user of the server, so a ``Set-Cookie`` one user's upstream
+    stored there must not ride along on another's request. A ``Cookie`` header
+    set explicitly on the request is kept.
+    """
+    request = client.build_request(method, url, headers=headers, content=content, timeout=timeout)
+    if not any(name.lower() == "cookie" for name in headers):
+        request.headers.pop("Cookie", None)
+    return await client.send(request)
+
+
+def _pooled_client(timeout: float = 5.0) -> httpx.AsyncClient:
+    """Create the pooled HTTP client a backend owns when none was injected."""
+    import httpx  # noqa: PLC0415
+
+    return httpx.AsyncClient(
+        timeout=timeout, limits=httpx.Limits(max_keepalive_connections=20), cookies=_stateless_cookie_jar()
+    )
+
+
+def _encode_body(body: dict[str, Any] | list[Any] | str | None, headers: dict[str, str]) -> bytes | str | None:
+    """Serialize JSON bodies ourselves so orjson is used when installed.
+
+    Adds ``Content-Type: application/json`` unless *headers* already set one.
+    Raises TypeError or ValueError if the body is not JSON-serializable.
+    """
+    if not isinstance(body, (dict, list)):
+        return body
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = "application/json"
+    return _json_dumps(body)
+
+
+async def _warm_pool(client: httpx.AsyncClient, urls: Iterable[str], timeout: float) -> None:
+    """HEAD each URL concurrently so the pool holds open connections; failures are logged and ignored."""
+
+    async def ping(url: str) -> None:
+        try:
+            await client.head(url, timeout=timeout)
+        except Exception as e:  # noqa: BLE001
+            _logger.debug("connection warm-up failed", extra={"event": "dispatch.warmup", "url": url, "error": str(e)})
+
+    async with anyio.create_task_group() as tg:
+        for url in dict.fromkeys(urls):
+            tg.start_soon(ping, url)
+
+
 # =============================================================================
 # Direct Dispatch Backend (OSS Mode)
 # =============================================================================
@@ -263,14 +359,41 @@ class DirectDispatchBackend:
         >>> response = await backend.dispatch(wire_request)
     """
 
-    def __init__(self, credential_resolver: CredentialResolver | None = None) -> None:
+    def __init__(
+        self, credential_resolver: CredentialResolver | None = None, *, http_client: httpx.AsyncClient | None = None
+    ) -> None:
         """Initialize direct dispatch backend.
 
         Args:
             credential_resolver: Function that resolves connection handle to
                 (base_url, header_name, header_value). If None, dispatch will fail.
+            http_client: Shared ``httpx.AsyncClient`` to send requests through.
+                The caller owns it; ``aclose()`` leaves it open. Cookies in its
+                jar are never sent with dispatched requests. If None, the
+                backend creates and closes its own pooled client.
         """
         self._resolver = credential_resolver
+        self._client = http_client
+        self._owns_client = http_client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = _pooled_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if this backend opened it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def warmup(self, base_urls: Iterable[str] = (), *, timeout: float = 5.0) -> None:
+        """Open pooled connections to *base_urls* before the first dispatch.
+
+        Pays DNS, TCP and TLS setup up front so the first tool call doesn't.
+        """
+        await _warm_pool(self._get_client(), base_urls, timeout)
 
     async def dispatch(self, request: DispatchWireRequest) -> DispatchResponse:
         """Execute HTTP request with resolved credentials.
@@ -310,25 +433,27 @@ class DirectDispatchBackend:
         if request.request.headers:
             headers.update(request.request.headers)
 
+        try:
+            content = _encode_body(request.request.body, headers)
+        except (TypeError, ValueError) as e:
+            return DispatchResponse.fail(
+                DispatchErrorCode.INVALID_REQUEST, f"Request body is not JSON-serializable: {e}"
+            )
+
         # Determine timeout
         timeout = (request.request.timeout_ms or 30_000) / 1000.0
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.request(
-                    method=request.request.method.value,
-                    url=url,
-                    headers=headers,
-                    json=request.request.body if isinstance(request.request.body, (dict, list)) else None,
-                    content=request.request.body if isinstance(request.request.body, str) else None,
-                )
+            response = await _send_without_jar(
+                self._get_client(), request.request.method.value, url, headers=headers, content=content, timeout=timeout
+            )
 
             # Parse response body
             body: dict[str, Any] | list[Any] | str | None = None
             content_type = response.headers.get("content-type", "")
             if "application/json" in content_type:
                 try:
-                    body = response.json()
+                    body = _json_loads(response.content)
                 except Exception:
                     body = response.text
             elif response.text:
@@ -414,6 +539,8 @@ class EnclaveDispatchBackend:
         deployment_id: str | None = None,
         auth_secret: bytes | None = None,
         timeout: float = 30.0,
+        *,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize enclave backend.
 
@@ -424,6 +551,9 @@ class EnclaveDispatchBackend:
             deployment_id: Deployment ID for HMAC auth (from DEDALUS_DEPLOYMENT_ID)
             auth_secret: 32-byte HMAC secret (from DEDALUS_AUTH_SECRET, base64)
             timeout: Request timeout in seconds
+            http_client: Shared ``httpx.AsyncClient`` to send requests through.
+                The caller owns it; ``aclose()`` leaves it open. Cookies in its
+                jar are never sent with dispatched requests.
         """
         self._enclave_url = enclave_url.rstrip("/")
         self._access_token = access_token
@@ -431,6 +561,28 @@ class EnclaveDispatchBackend:
         self._deployment_id = deployment_id
         self._auth_secret = auth_secret
         self._timeout = timeout
+        self._client = http_client
+        self._owns_client = http_client is None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = _pooled_client(self._timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if this backend opened it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def warmup(self, base_urls: Iterable[str] = (), *, timeout: float = 5.0) -> None:
+        """Open a pooled connection to the Dispatch Gateway.
+
+        Upstream APIs are reached through the gateway, so *base_urls* is ignored.
+        """
+        del base_urls
+        await _warm_pool(self._get_client(), (self._enclave_url,), timeout)
 
     async def dispatch(self, request: DispatchWireRequest) -> DispatchResponse:
         """Forward HTTP request to Enclave.
@@ -463,9 +615,12 @@ class EnclaveDispatchBackend:
         }
 
         # Serialize body for HMAC computation
-        import json
-
-        body_bytes = json.dumps(body, separators=(",", ":")).encode()
+        try:
+            body_bytes = _json_dumps(body)
+        except (TypeError, ValueError) as e:
+            return DispatchResponse.fail(
+                DispatchErrorCode.INVALID_REQUEST, f"Request body is not JSON-serializable: {e}"
+            )
 
         # Build headers
         headers = {"Content-Type": "application/json"}
@@ -492,8 +647,9 @@ class EnclaveDispatchBackend:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(dispatch_url, content=body_bytes, headers=headers)
+            response = await _send_without_jar(
+                self._get_client(), "POST", dispatch_url, headers=headers, content=body_bytes, timeout=self._timeout
+            )
 
             if response.status_code == 401:
                 return DispatchResponse.fail(
@@ -510,7 +666,7 @@ class EnclaveDispatchBackend:
                     DispatchErrorCode.DOWNSTREAM_UNREACHABLE, f"Enclave error ({response.status_code}): {response.text}"
                 )
 
-            data = response.json()
+            data = _json_loads(response.content)
 
             # Enclave returns canonical DispatchResponse format
             if data.get("success"):
@@ -592,7 +748,7 @@ class EnclaveDispatchBackend:
         return generate_dpop_proof(private_key=self._dpop_key, method=method, url=url, access_token=self._access_token)
 
 
-def create_dispatch_backend_from_env() -> DispatchBackend:
+def create_dispatch_backend_from_env(*, http_client: httpx.AsyncClient | None = None) -> DispatchBackend:
     """Create dispatch backend from environment variables.
 
     If DEDALUS_DISPATCH_URL is set, returns EnclaveDispatchBackend configured
@@ -604,6 +760,10 @@ def create_dispatch_backend_from_env() -> DispatchBackend:
         DEDALUS_AUTH_SECRET: Base64-encoded 32-byte HMAC secret
         DEDALUS_ACCESS_TOKEN: User's DPoP-bound access token (set per-request)
 
+    Args:
+        http_client: Optional shared ``httpx.AsyncClient`` for the backend to use
+            instead of creating its own.
+
     Returns:
         Configured dispatch backend
 
@@ -631,6 +791,7 @@ def create_dispatch_backend_from_env() -> DispatchBackend:
             access_token="",  # Set per-request via context
             deployment_id=deployment_id,
             auth_secret=auth_secret,
+            http_client=http_client,
         )
 
     # Detect managed deployment - missing DEDALUS_DISPATCH_URL is a config error
@@ -646,7 +807,7 @@ def create_dispatch_backend_from_env() -> DispatchBackend:
         )
 
     _logger.debug("dispatch backend configured", extra={"event": "dispatch.init", "backend": "direct"})
-    return DirectDispatchBackend()
+    return DirectDispatchBackend(http_client=http_client)
 
 
 __all__ = [
@@ -24,9 +24,15 @@ try:
     import uvloop
 
     uvloop.install()
-    _USING_UVLOOP = True
+    _LOOP_IMPL = "uvloop"
 except ImportError:
-    _USING_UVLOOP = False
+    try:
+        import winloop  # uvloop's Windows port
+
+        winloop.install()
+        _LOOP_IMPL = "winloop"
+    except ImportError:
+        _LOOP_IMPL = "asyncio"
 
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import NotificationOptions, Server, request_ctx
@@ -103,6 +109,7 @@ from ..utils import get_logger
 
 if TYPE_CHECKING:
     from anyio.abc import TaskGroup
+    import httpx
     from mcp.server.models import InitializationOptions
     from mcp.server.session import ServerSession
 
@@ -199,6 +206,8 @@ class MCPServer(Server[Any, Any]):
         connector_params: dict[str, type] | None = None,
         auth_methods: list[str] | None = None,
         connections: list[Connection] | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        warm_connections: bool = False,
     ) -> None:
         # Resolve config with param overrides taking precedence
         cfg = config or ServerConfig()
@@ -234,6 +243,7 @@ class MCPServer(Server[Any, Any]):
 
         # Dispatch backend (initialized in _build_runtime_payload)
         self._dispatch_backend: Any = None
+        self._http_client = http_client
         super().__init__(
             name,
             version=version,
@@ -247,8 +257,7 @@ class MCPServer(Server[Any, Any]):
         self._logger = get_logger(f"dedalus_mcp.server.{name}")
 
         # Log event loop implementation
-        loop_impl = "uvloop" if _USING_UVLOOP else "asyncio"
-        self._logger.debug("Event loop: %s", loop_impl)
+        self._logger.debug("Event loop: %s", _LOOP_IMPL)
 
         self._notification_sink: NotificationSink = resolved_notification_sink or DefaultNotificationSink()
 
@@ -290,6 +299,7 @@ class MCPServer(Server[Any, Any]):
 
         self._streamable_http_stateless = streamable_http_stateless
         self._allow_dynamic_tools = allow_dynamic_tools
+        self._warm_connections = warm_connections
         self._runtime_started = False
         self._tool_mutation_pending_notification = False
         self._binding_depth = 0
@@ -429,6 +439,11 @@ class MCPServer(Server[Any, Any]):
 
     @property
     def tool_names(self) -> list[str]:
+        """Sorted names of the attached tools.
+
+        Only changes when tools are collected, allow-listed, or removed, so
+        callers can read it once rather than re-deriving it per request.
+        """
         return self.tools.tool_names
 
     @property
@@ -472,7 +487,7 @@ class MCPServer(Server[Any, Any]):
             >>> server.collect(add)
             >>> print(server.url)  # None - not yet started
             >>> asyncio.create_task(server.serve(port=8000))
-            >>> await asyncio.sleep(0.5)  # Wait for startup
+            >>> await server.wait_until_ready()
             >>> print(server.url)  # "http://127.0.0.1:8000/mcp"
         """
         return self._serving_url
@@ -593,8 +608,10 @@ class MCPServer(Server[Any, Any]):
             server.collect(add)
 
         Raises:
-            ValueError: If a function lacks Dedalus MCP metadata.
+            ValueError: If a function lacks Dedalus MCP metadata. Nothing is
+                registered in that case.
         """
+        specs = []
         for fn in fns:
             spec = self._extract_spec(fn)
             if spec is None:
@@ -604,7 +621,8 @@ class MCPServer(Server[Any, Any]):
                     "Decorate with @tool, @resource, @prompt, @completion, or @resource_template."
                 )
                 raise ValueError(msg)
-            self._register_spec(spec)
+            specs.append(spec)
+        self._register_specs(specs)
 
     def collect_from(self, *modules: ModuleType) -> None:
         """Register all decorated callables from modules.
@@ -618,6 +636,7 @@ class MCPServer(Server[Any, Any]):
             server = MCPServer("my-server")
             server.collect_from(math, text)
         """
+        specs = []
         for module in modules:
             for name in dir(module):
                 if name.startswith("_"):
@@ -626,7 +645,8 @@ class MCPServer(Server[Any, Any]):
                 if callable(obj):
                     spec = self._extract_spec(obj)
                     if spec is not None:
-                        self._register_spec(spec)
+                        specs.append(spec)
+        self._register_specs(specs)
 
     def _extract_spec(
         self, fn: Callable[..., Any]
@@ -644,6 +664,19 @@ class MCPServer(Server[Any, Any]):
                 return spec
         return None
 
+    def _register_specs(
+        self, specs: Iterable[ToolSpec | ResourceSpec | PromptSpec | CompletionSpec | ResourceTemplateSpec]
+    ) -> None:
+        """Register specs in order, adding tools as one batch so the tool set refreshes once."""
+        tool_specs: list[ToolSpec] = []
+        for spec in specs:
+            if isinstance(spec, ToolSpec):
+                tool_specs.append(spec)
+            else:
+                self._register_spec(spec)
+        if tool_specs:
+            self.tools.register_many(tool_specs)
+
     def _register_spec(
         self, spec: ToolSpec | ResourceSpec | PromptSpec | CompletionSpec | ResourceTemplateSpec
     ) -> None:
@@ -666,6 +699,9 @@ class MCPServer(Server[Any, Any]):
     def register_tool(self, target: ToolSpec | Callable[..., Any]) -> ToolSpec:
         return self.tools.register(target)
 
+    def remove_tool(self, name: str) -> bool:
+        return self.tools.remove(name)
+
     def allow_tools(self, names: Iterable[str] | None) -> None:
         self.tools.allow_tools(names)
 
@@ -718,6 +754,10 @@ class MCPServer(Server[Any, Any]):
     async def notify_resource_updated(self, uri: str) -> None:
         await self.resources.notify_updated(uri)
 
+    async def notify_resources_updated(self, uris: Iterable[str]) -> None:
+        """Notify subscribers of several changed resources at once; repeated URIs are sent once."""
+        await self.resources.notify_updated_many(uris)
+
     async def notify_resources_list_changed(self) -> None:
         if self._notification_flags.resources_changed:
             await self.resources.notify_list_changed()
@@ -958,7 +998,26 @@ class MCPServer(Server[Any, Any]):
         """
         from ..dispatch import create_dispatch_backend_from_env
 
-        self._dispatch_backend = create_dispatch_backend_from_env()
+        self._dispatch_backend = create_dispatch_backend_from_env(http_client=self._http_client)
+
+    async def _warmup(self) -> None:
+        """Pre-open dispatch connections so the first tool call skips DNS/TCP/TLS setup.
+
+        Only runs when the server was built with ``warm_connections=True``, since it
+        delays serving by up to the backend's warm-up timeout and sends a HEAD to
+        every connection's upstream. Best effort: if the backend can't be created or
+        reached, calls connect lazily as they would without warm-up.
+        """
+        if not self._connections:
+            return
+        try:
+            if self._dispatch_backend is None:
+                self._initialize_dispatch_backend()
+            warmup = getattr(self._dispatch_backend, "warmup", None)
+            if warmup is not None:
+                await warmup([conn.base_url for conn in self._connections.values() if conn.base_url])
+        except Exception as exc:  # noqa: BLE001
+            self._logger.debug("Connection warm-up skipped: %s", exc)
 
     # TODO: Quality check on this impl.
     async def _handle_request(
@@ -1207,9 +1266,28 @@ class MCPServer(Server[Any, Any]):
     async def _run_transport(self, transport: BaseTransport, **kwargs: Any) -> None:
         self._active_transport = transport
         try:
+            if self._warm_connections:
+                await self._warmup()
             await transport.run(**kwargs)
         finally:
             self._active_transport = None
+            # Dispatch backends pool HTTP connections across tool calls; release them with the transport.
+            aclose = getattr(self._dispatch_backend, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def wait_until_ready(self, *, timeout: float = 10.0) -> None:
+        """Wait until the HTTP transport started by ``serve()`` accepts connections.
+
+        Use this instead of a fixed sleep after launching ``serve()`` in a
+        background task. Only HTTP transports report readiness.
+
+        Raises:
+            TimeoutError: If the server isn't ready within *timeout* seconds.
+        """
+        with anyio.fail_after(timeout):
+            while not getattr(self._active_transport, "started", False):
+                await anyio.sleep(0.01)
 
     async def shutdown(self) -> None:
         transport = self._active_transport
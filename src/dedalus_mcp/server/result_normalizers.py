@@ -9,6 +9,7 @@ import base64
 from collections.abc import Iterable
 from dataclasses import asdict, is_dataclass
 import json
+import math
 from typing import Any
 
 from pydantic import BaseModel
@@ -30,6 +31,59 @@ _CONTENT_CLASSES = (
 _JSONIFY_SENTINEL = object()
 
 
+def _finite(value: Any) -> Any:
+    """Copy *value* with NaN and infinities replaced by ``None``, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(sub) for key, sub in value.items()}
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _stdlib_dumps(value: object) -> str:
+    try:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:  # NaN/Infinity are not JSON; write null instead
+        return json.dumps(_finite(value), ensure_ascii=False, separators=(",", ":"))
+
+
+def _has_float(value: object) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            return True
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+
+try:
+    import orjson  # faster JSON for tool and resource text (dedalus_mcp[opt])
+
+    def _dumps_text(value: object) -> str:
+        # orjson spells some floats differently (1e-7 vs 1e-07), so payloads with
+        # floats take the stdlib path and the text never depends on the backend.
+        if not _has_float(value):
+            try:
+                return orjson.dumps(value).decode()
+            except orjson.JSONEncodeError:  # e.g. integers wider than 64 bits
+                pass
+        return _stdlib_dumps(value)
+
+except ImportError:
+    _dumps_text = _stdlib_dumps
+
+
+# Exact leaf types that are already JSON-ready. Matching on ``type()`` (not
+# isinstance) keeps subclasses on the slow path, where dataclass/model checks apply.
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def normalize_tool_result(value: Any) -> types.CallToolResult:
     """Coerce arbitrary tool handler output into ``CallToolResult``."""
     if isinstance(value, types.CallToolResult):
@@ -120,7 +174,7 @@ def _as_text_content(value: Any) -> types.TextContent:
     if json_ready is _JSONIFY_SENTINEL:
         text = str(value)
     else:
-        text = json.dumps(json_ready, ensure_ascii=False)
+        text = _dumps_text(json_ready)
     return types.TextContent(type="text", text=text)
 
 
@@ -142,7 +196,9 @@ def normalize_resource_payload(uri: str, declared_mime: str | None, payload: Any
     elif isinstance(payload, BaseModel) and not isinstance(payload, _CONTENT_CLASSES):
         payload = payload.model_dump(mode="json")
 
-    if isinstance(payload, dict):
+    # Only mappings carrying ``text`` or ``blob`` can be resource contents; plain data
+    # dicts skip straight to serialization instead of failing two model validations.
+    if isinstance(payload, dict) and ("text" in payload or "blob" in payload):
         try:
             content = types.TextResourceContents.model_validate({"uri": uri, **payload})
             return types.ReadResourceResult(contents=[content])
@@ -167,7 +223,7 @@ def normalize_resource_payload(uri: str, declared_mime: str | None, payload: Any
         if json_ready is _JSONIFY_SENTINEL:
             text = str(payload)
         else:
-            text = json.dumps(json_ready, ensure_ascii=False)
+            text = _dumps_text(json_ready)
     return types.ReadResourceResult(contents=[types.TextResourceContents(uri=uri, mimeType=mime, text=text)])
 
 
@@ -185,6 +241,9 @@ def _jsonify(value: Any, _depth: int = 0) -> Any:
     if _depth > 100:
         return _JSONIFY_SENTINEL
 
+    if type(value) in _JSON_SCALAR_TYPES:
+        return value
+
     if is_dataclass(value):
         value = asdict(value)
     elif isinstance(value, BaseModel) and not isinstance(value, _CONTENT_CLASSES):
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
+from itertools import islice
 from typing import Any
 
 from ... import types
@@ -78,11 +79,14 @@ class CompletionService:
         raise TypeError(f"Unsupported completion return type: {type(result)!r}")
 
     def _from_values(self, values: Iterable[Any], total: int | None, has_more: bool | None) -> types.Completion:
-        coerced = [str(value) for value in values]
+        # Stop one past the limit: that extra value is enough to know whether to set hasMore.
+        coerced = [str(value) for value in islice(values, self._limit + 1)]
         limited, limited_has_more = self._limit_values(coerced, has_more)
         return types.Completion(values=limited, total=total, hasMore=limited_has_more)
 
     def _limit_completion(self, completion: types.Completion) -> types.Completion:
+        if len(completion.values) <= self._limit:
+            return completion
         limited, has_more = self._limit_values(list(completion.values), completion.hasMore)
         return types.Completion(values=limited, total=completion.total, hasMore=has_more)
 
@@ -64,6 +64,17 @@ class LoggingService:
         async with self._acquire_lock():
             self._session_levels[context.session] = numeric
 
+    def accepts(self, session: ServerSession, level: str) -> bool:
+        """Return whether *session* wants messages at *level* per its logging/setLevel."""
+        threshold = self._session_levels.get(session)
+        if threshold is None:
+            return True
+        return _LOGGING_LEVEL_MAP.get(level, logging.CRITICAL) >= threshold
+
+    def wants_record(self, levelno: int) -> bool:
+        """Return whether any subscribed session would receive a record at *levelno*."""
+        return any(levelno >= threshold for threshold in self._session_levels.values())
+
     async def emit(self, level: types.LoggingLevel, data: Any, logger_name: str | None = None) -> None:
         numeric = self._resolve(level)
         await self._broadcast(level, numeric, data, logger_name)
@@ -180,12 +191,15 @@ class _NotificationHandler(logging.Handler):
             except RuntimeError:
                 token = None
             else:
-                token.spawn_system_task(self.service.handle_log_record, record)
+                if self.service.wants_record(record.levelno):
+                    token.spawn_system_task(self.service.handle_log_record, record)
                 return
 
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
             return
-        else:
+        # Checked on the loop thread so the session map isn't read mid-update, and
+        # before spawning so records nobody subscribed to don't cost a task each.
+        if self.service.wants_record(record.levelno):
             loop.create_task(self.service.handle_log_record(record))
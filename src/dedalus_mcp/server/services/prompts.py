@@ -87,8 +87,10 @@ class PromptsService:
 
     def _coerce_prompt_result(self, spec: PromptSpec, result: Any) -> types.GetPromptResult:
         if isinstance(result, types.GetPromptResult):
-            description = result.description or spec.description
-            return types.GetPromptResult(messages=result.messages, description=description)
+            # Renderers may return a prebuilt result; only copy it when the description needs filling in.
+            if result.description or not spec.description:
+                return result
+            return result.model_copy(update={"description": spec.description})
 
         if isinstance(result, dict):
             messages = result.get("messages")
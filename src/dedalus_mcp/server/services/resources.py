@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from ..notifications import NotificationSink, ObserverRegistry
@@ -103,21 +103,29 @@ class ResourcesService:
         await self._subscriptions.unsubscribe_current(uri)
 
     async def notify_updated(self, uri: str) -> None:
-        subscribers = await self._subscriptions.subscribers(uri)
-        if not subscribers:
-            return
-
-        notification = types.ServerNotification(
-            types.ResourceUpdatedNotification(params=types.ResourceUpdatedNotificationParams(uri=uri))
-        )
-
-        stale: list[Any] = []
-        for session in subscribers:
-            try:
-                await self._sink.send_notification(session, notification)
-            except Exception as exc:
-                self._logger.warning("Failed to notify subscriber %s: %s", getattr(session, "name", repr(session)), exc)
-                stale.append(session)
+        await self.notify_updated_many((uri,))
+
+    async def notify_updated_many(self, uris: Iterable[str]) -> None:
+        """Send one ``resources/updated`` per distinct URI, pruning failed sessions once at the end."""
+        stale: dict[Any, None] = {}
+        for uri in dict.fromkeys(uris):
+            subscribers = await self._subscriptions.subscribers(uri)
+            if not subscribers:
+                continue
+
+            notification = types.ServerNotification(
+                types.ResourceUpdatedNotification(params=types.ResourceUpdatedNotificationParams(uri=uri))
+            )
+            for session in subscribers:
+                if session in stale:
+                    continue
+                try:
+                    await self._sink.send_notification(session, notification)
+                except Exception as exc:
+                    self._logger.warning(
+                        "Failed to notify subscriber %s: %s", getattr(session, "name", repr(session)), exc
+                    )
+                    stale[session] = None
 
         for session in stale:
             await self._subscriptions.prune_session(session)
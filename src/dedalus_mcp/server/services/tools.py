@@ -53,8 +53,16 @@ class ToolsService:
         self._pagination_limit = pagination_limit
         self._tool_specs: dict[str, ToolSpec] = {}
         self._tool_defs: dict[str, types.Tool] = {}
+        # Built definitions keyed by name, reused while the same spec stays registered
+        # so schemas are derived once per registration rather than on every refresh.
+        self._built_defs: dict[str, tuple[ToolSpec, types.Tool]] = {}
+        # Per-tool parameter plans (which params are injected vs. taken from arguments),
+        # derived once so calls don't re-inspect signatures and resolve annotations.
+        self._call_plans: dict[str, tuple[ToolSpec, tuple[_ParamPlan, ...]]] = {}
         self._attached_names: set[str] = set()
-        self._allow: set[str] | None = None
+        # Sorted view of _attached_names, rebuilt lazily after each refresh.
+        self._sorted_names: tuple[str, ...] | None = None
+        self._allow: frozenset[str] | None = None
         self.observers = ObserverRegistry(notification_sink)
 
     # ------------------------------------------------------------------
@@ -63,30 +71,59 @@ class ToolsService:
 
     @property
     def tool_names(self) -> list[str]:
-        return sorted(self._tool_defs)
+        if self._sorted_names is None:
+            self._sorted_names = tuple(sorted(self._attached_names))
+        return list(self._sorted_names)
 
     @property
     def definitions(self) -> dict[str, types.Tool]:
         return self._tool_defs
 
     def register(self, target: ToolSpec | Callable[..., Any]) -> ToolSpec:
-        spec: ToolSpec | None
-        if isinstance(target, ToolSpec):
-            spec = target
-        else:
-            fn = target
-            spec = extract_tool_spec(fn)
-            if spec is None:
-                spec = ToolSpec(name=getattr(fn, "__name__", "anonymous"), fn=fn)
-
-        assert spec is not None  # narrow for type checker
-        self._tool_specs[spec.name] = spec
+        return self.register_many([target])[0]
+
+    def register_many(self, targets: Iterable[ToolSpec | Callable[..., Any]]) -> list[ToolSpec]:
+        """Register several tools with a single refresh of the attached set."""
+        specs: list[ToolSpec] = []
+        for target in targets:
+            spec: ToolSpec | None
+            if isinstance(target, ToolSpec):
+                spec = target
+            else:
+                fn = target
+                spec = extract_tool_spec(fn)
+                if spec is None:
+                    spec = ToolSpec(name=getattr(fn, "__name__", "anonymous"), fn=fn)
+            specs.append(spec)
+
+        if not specs:
+            return specs
+        # Build definitions before touching the registry so a bad schema fails here, not in tools/list.
+        for spec in specs:
+            self._tool_def(spec)
         self._server.record_tool_mutation(operation="register")
+        for spec in specs:
+            self._tool_specs[spec.name] = spec
         self._refresh_tools()
-        return spec
+        return specs
+
+    def remove(self, name: str) -> bool:
+        """Unregister *name* without rebuilding the other tools; False if it wasn't registered."""
+        if name not in self._tool_specs:
+            return False
+        self._server.record_tool_mutation(operation="remove")
+        del self._tool_specs[name]
+        self._built_defs.pop(name, None)
+        self._call_plans.pop(name, None)
+        if name in self._attached_names:
+            self._detach(name)
+            self._attached_names.discard(name)
+            self._sorted_names = None
+            del self._tool_defs[name]
+        return True
 
     def allow_tools(self, names: Iterable[str] | None) -> None:
-        self._allow = set(names) if names is not None else None
+        self._allow = frozenset(names) if names is not None else None
         self._server.record_tool_mutation(operation="allow_tools")
         self._refresh_tools()
 
@@ -108,12 +145,13 @@ class ToolsService:
 
             page, next_cursor = paginate_sequence(filtered, cursor, limit=self._pagination_limit)
             self.observers.remember_current_session()
-            return types.ListToolsResult(tools=page, nextCursor=next_cursor)
+            # Definitions are prebuilt, validated models; skip re-validating them per request.
+            return types.ListToolsResult.model_construct(tools=page, nextCursor=next_cursor)
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> types.CallToolResult:
         with context_scope():
             spec = self._tool_specs.get(name)
-            if not spec or name not in self._tool_defs:
+            if not spec or name not in self._attached_names:
                 return types.CallToolResult(
                     content=[types.TextContent(type="text", text=f'Tool "{name}" is not available')], isError=True
                 )
@@ -135,9 +173,7 @@ class ToolsService:
                 result = await maybe_await_with_args(spec.fn, **call_kwargs)
             except ToolError as exc:
                 error_text = f"[{exc.code}] {exc}"
-                return types.CallToolResult(
-                    content=[types.TextContent(type="text", text=error_text)], isError=True
-                )
+                return types.CallToolResult(content=[types.TextContent(type="text", text=error_text)], isError=True)
             except TypeError as exc:  # argument mismatch
                 return types.CallToolResult(
                     content=[types.TextContent(type="text", text=f"Invalid arguments: {exc}")], isError=True
@@ -161,37 +197,44 @@ class ToolsService:
         for name in list(self._attached_names):
             self._detach(name)
         self._attached_names.clear()
+        self._sorted_names = None
         self._tool_defs.clear()
 
         for spec in self._tool_specs.values():
             if not self._is_tool_enabled(spec):
                 continue
 
-            annotations_payload: dict[str, Any] = (
-                spec.annotations.model_dump(exclude_none=True) if spec.annotations else {}
-            )
-            if spec.tags:
-                existing = annotations_payload.get("tags", [])
-                combined = {*(existing if isinstance(existing, (list, tuple, set)) else [existing]), *spec.tags}
-                annotations_payload["tags"] = sorted(str(tag) for tag in combined if tag not in (None, ""))
-            if spec.title is not None and "title" not in annotations_payload:
-                annotations_payload = {**annotations_payload, "title": spec.title}
-            annotations = types.ToolAnnotations.model_validate(annotations_payload) if annotations_payload else None
-
-            icons = spec.icons
-
-            tool_def = types.Tool(
-                name=spec.name,
-                description=spec.description or None,
-                inputSchema=spec.input_schema or self._build_input_schema(spec.fn),
-                outputSchema=spec.output_schema or self._build_output_schema(spec.fn),
-                annotations=annotations,
-                icons=icons,
-            )
-            self._tool_defs[spec.name] = tool_def
+            self._tool_defs[spec.name] = self._tool_def(spec)
             self._attach(spec.name, spec.fn)
             self._attached_names.add(spec.name)
 
+    def _tool_def(self, spec: ToolSpec) -> types.Tool:
+        built = self._built_defs.get(spec.name)
+        if built is not None and built[0] is spec:
+            return built[1]
+        tool_def = self._build_tool_def(spec)
+        self._built_defs[spec.name] = (spec, tool_def)
+        return tool_def
+
+    def _build_tool_def(self, spec: ToolSpec) -> types.Tool:
+        annotations_payload: dict[str, Any] = spec.annotations.model_dump(exclude_none=True) if spec.annotations else {}
+        if spec.tags:
+            existing = annotations_payload.get("tags", [])
+            combined = {*(existing if isinstance(existing, (list, tuple, set)) else [existing]), *spec.tags}
+            annotations_payload["tags"] = sorted(str(tag) for tag in combined if tag not in (None, ""))
+        if spec.title is not None and "title" not in annotations_payload:
+            annotations_payload = {**annotations_payload, "title": spec.title}
+        annotations = types.ToolAnnotations.model_validate(annotations_payload) if annotations_payload else None
+
+        return types.Tool(
+            name=spec.name,
+            description=spec.description or None,
+            inputSchema=spec.input_schema or self._build_input_schema(spec.fn),
+            outputSchema=spec.output_schema or self._build_output_schema(spec.fn),
+            annotations=annotations,
+            icons=spec.icons,
+        )
+
     def _is_tool_enabled(self, spec: ToolSpec) -> bool:
         if self._allow is not None and spec.name not in self._allow:
             return False
@@ -259,39 +302,47 @@ class ToolsService:
 
     async def _build_call_kwargs(self, spec: ToolSpec, arguments: dict[str, Any]) -> dict[str, Any]:
         kwargs = dict(arguments)
-        signature = inspect.signature(spec.fn)
 
-        for name, param in signature.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
+        for name, kind, value in self._call_plan(spec):
             if name in kwargs:
                 continue
 
-            dependency = None
-
-            if isinstance(param.default, Depends):
-                dependency = param.default
-            elif isinstance(param.annotation, Depends):
-                dependency = param.annotation  # type: ignore[assignment]
-
-            if dependency is not None:
-                kwargs[name] = await resolve_dependency(dependency)
-                continue
-
-            if self._annotation_requires_context(param.annotation):
+            if kind == "depends":
+                kwargs[name] = await resolve_dependency(value)
+            elif kind == "context":
                 try:
                     kwargs[name] = get_context()
                 except LookupError:
                     raise TypeError(f"Cannot inject context for parameter '{name}' outside of an MCP request") from None
-                continue
+            elif kind == "default":
+                kwargs[name] = value
+            else:
+                raise TypeError(f"Missing required argument '{name}' for tool '{spec.name}'")
 
-            if param.default is not inspect.Parameter.empty:
-                kwargs[name] = param.default
-                continue
+        return kwargs
 
-            raise TypeError(f"Missing required argument '{name}' for tool '{spec.name}'")
+    def _call_plan(self, spec: ToolSpec) -> tuple[_ParamPlan, ...]:
+        cached = self._call_plans.get(spec.name)
+        if cached is not None and cached[0] is spec:
+            return cached[1]
 
-        return kwargs
+        hints = _resolve_type_hints(spec.fn, self._logger)
+        plan: list[_ParamPlan] = []
+        for name, param in inspect.signature(spec.fn).parameters.items():
+            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                continue
+            dependency = _param_dependency(param)
+            if dependency is not None:
+                plan.append((name, "depends", dependency))
+            elif self._annotation_requires_context(hints.get(name, param.annotation)):
+                plan.append((name, "context", None))
+            elif param.default is not inspect.Parameter.empty:
+                plan.append((name, "default", param.default))
+            else:
+                plan.append((name, "required", None))
+
+        self._call_plans[spec.name] = (spec, tuple(plan))
+        return self._call_plans[spec.name][1]
 
     @staticmethod
     def _annotation_requires_context(annotation: Any) -> bool:
@@ -306,6 +357,7 @@ class ToolsService:
 
     def _build_input_schema(self, fn: Callable[..., Any]) -> dict[str, Any]:
         signature = inspect.signature(fn)
+        hints = _resolve_type_hints(fn, self._logger)
         annotations: dict[str, Any] = {}
         default_values: dict[str, Any] = {}
 
@@ -316,7 +368,12 @@ class ToolsService:
             if param.kind not in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
                 return {"type": "object"}
 
-            annotation = param.annotation if param.annotation is not inspect.Parameter.empty else Any
+            annotation = hints.get(name, param.annotation)
+            # Injected parameters are supplied by the server, not the client
+            if _param_dependency(param) is not None or self._annotation_requires_context(annotation):
+                continue
+            if annotation is inspect.Parameter.empty:
+                annotation = Any
 
             if param.default is inspect.Parameter.empty:
                 annotations[name] = annotation
@@ -365,22 +422,7 @@ class ToolsService:
         if annotation in (inspect.Signature.empty, Any, None):
             return None
 
-        try:
-            closure_ns: dict[str, Any] = {}
-            if fn.__closure__:
-                for cell in fn.__closure__:
-                    try:
-                        value = cell.cell_contents
-                    except ValueError:
-                        continue
-                    name = getattr(value, "__name__", None)
-                    if isinstance(name, str):
-                        closure_ns.setdefault(name, value)
-
-            resolved = get_type_hints(fn, include_extras=True, localns=closure_ns)
-            annotation = resolved.get("return", annotation)
-        except (NameError, TypeError) as exc:
-            self._logger.debug("Failed to resolve return annotation for %s: %s", fn.__name__, exc)
+        annotation = _resolve_type_hints(fn, self._logger).get("return", annotation)
 
         if annotation in (Any, None, types.CallToolResult, types.ServerResult):
             return None
@@ -399,6 +441,41 @@ class ToolsService:
         return schema
 
 
+_ParamPlan = tuple[str, str, Any]  # (name, "depends" | "context" | "default" | "required", value)
+
+
+def _param_dependency(param: inspect.Parameter) -> Depends | None:
+    if isinstance(param.default, Depends):
+        return param.default
+    if isinstance(param.annotation, Depends):
+        return param.annotation
+    return None
+
+
+def _resolve_type_hints(fn: Callable[..., Any], logger: Logger) -> dict[str, Any]:
+    """Evaluate *fn*'s annotations, including string ones from ``from __future__ import annotations``.
+
+    Names captured in the function's closure are visible too. Returns ``{}`` if
+    any annotation cannot be resolved; callers then fall back to the raw ones.
+    """
+    closure_ns: dict[str, Any] = {}
+    if fn.__closure__:
+        for cell in fn.__closure__:
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                continue
+            name = getattr(value, "__name__", None)
+            if isinstance(name, str):
+                closure_ns.setdefault(name, value)
+
+    try:
+        return get_type_hints(fn, include_extras=True, localns=closure_ns)
+    except (NameError, TypeError) as exc:
+        logger.debug("Failed to resolve annotations for %s: %s", fn.__name__, exc)
+        return {}
+
+
 def _annotation_contains(annotation: object, targets: tuple[type[Any], ...]) -> bool:
     origin = get_origin(annotation)
     if origin is None:
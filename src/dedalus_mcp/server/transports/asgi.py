@@ -115,6 +115,12 @@ class ASGITransportBase(BaseTransport, ABC):
         """Return ``True`` when incoming requests should be treated statelessly."""
         return self._config.stateless
 
+    @property
+    def started(self) -> bool:
+        """Return ``True`` once uvicorn has bound its socket and finished lifespan startup."""
+        server_instance = self._server_instance
+        return server_instance is not None and server_instance.started
+
     async def run(self, *, config: ASGIRunConfig | None = None, **legacy_kwargs: Any) -> None:
         resolved = self._resolve_run_config(config=config, legacy_kwargs=legacy_kwargs)
         await self._serve(resolved)
@@ -6,8 +6,16 @@
 from __future__ import annotations
 
 from .coro import maybe_await, maybe_await_with_args, noop_coroutine
-from .logger import get_logger, setup_logger
+from .logger import get_logger, quiet_third_party, setup_logger
 from .serializer import to_json
 
 
-__all__ = ["setup_logger", "get_logger", "noop_coroutine", "maybe_await", "maybe_await_with_args", "to_json"]
+__all__ = [
+    "setup_logger",
+    "get_logger",
+    "quiet_third_party",
+    "noop_coroutine",
+    "maybe_await",
+    "maybe_await_with_args",
+    "to_json",
+]
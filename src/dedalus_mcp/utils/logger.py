@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 import json
 import logging
 import os
@@ -34,6 +34,7 @@ ENV_LOG_JSON: Final[str] = "DEDALUS_MCP_LOG_JSON"
 ENV_NO_COLOR: Final[str] = "NO_COLOR"  # Standard env var for disabling colors
 DEFAULT_FORMAT: Final[str] = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
 DEFAULT_DATEFMT: Final[str] = "%Y-%m-%d %H:%M:%S"
+THIRD_PARTY_LOGGERS: Final[tuple[str, ...]] = ("mcp", "httpx", "uvicorn", "uvicorn.access", "uvicorn.error")
 
 JsonSerializer = Callable[[dict[str, Any]], str]
 PayloadTransformer = Callable[[dict[str, Any]], dict[str, Any]]
@@ -310,12 +311,29 @@ def get_logger(name: str | None = None) -> logging.Logger:
     return logging.getLogger(name or DEFAULT_LOGGER_NAME)
 
 
+def quiet_third_party(level: int | str = logging.WARNING, names: Iterable[str] = THIRD_PARTY_LOGGERS) -> None:
+    """Raise dependency loggers (``mcp``, ``httpx``, ``uvicorn``) to *level*.
+
+    Meant for scripts and examples that want Dedalus MCP output without
+    transport chatter. Safe to call repeatedly; each call re-applies *level*.
+
+    Args:
+        level: Minimum level to let through. Accepts names like ``"ERROR"``.
+        names: Logger names to adjust. Defaults to ``THIRD_PARTY_LOGGERS``.
+    """
+    resolved = _resolve_level(level)
+    for name in names:
+        logging.getLogger(name).setLevel(resolved)
+
+
 __all__ = [
     "DEFAULT_LOGGER_NAME",
+    "THIRD_PARTY_LOGGERS",
     "ColoredFormatter",
     "DedalusMCPHandler",
     "PlainFormatter",
     "StructuredJSONFormatter",
     "get_logger",
+    "quiet_third_party",
     "setup_logger",
 ]
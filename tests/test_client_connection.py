@@ -10,7 +10,7 @@ import httpx
 import pytest
 
 from dedalus_mcp import MCPServer, tool
-from dedalus_mcp.client import MCPClient, open_connection
+from dedalus_mcp.client import MCPClient, create_http_client, open_connection
 from dedalus_mcp.types.messages import ClientRequest
 from dedalus_mcp.types.server.tools import CallToolRequest, CallToolRequestParams, CallToolResult
 from dedalus_mcp.versioning import V_2024_11_05
@@ -286,3 +286,66 @@ async def test_mcpclient_connect_unknown_transport() -> None:
     """MCPClient.connect() should raise for unknown transport."""
     with pytest.raises(ValueError, match="Unsupported transport"):
         await MCPClient.connect("http://localhost:8000/mcp", transport="bogus")
+
+
+@pytest.mark.anyio
+async def test_mcpclient_connect_reuses_caller_http_client(unused_tcp_port: int) -> None:
+    """A caller-owned http_client survives close() and serves later connects."""
+    server = MCPServer("shared-client-test")
+
+    with server.binding():
+
+        @tool()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+    host = "127.0.0.1"
+    port = unused_tcp_port
+
+    async def run_server() -> None:
+        await server.serve(transport="streamable-http", host=host, port=port)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(run_server)
+        await _wait_for_port(host, port)
+
+        try:
+            async with create_http_client() as http_client:
+                for _ in range(2):
+                    client = await MCPClient.connect(f"http://{host}:{port}/mcp", http_client=http_client)
+                    try:
+                        result = await client.call_tool("add", {"a": 2, "b": 3})
+                        assert result.content[0].text == "5"
+                    finally:
+                        await client.close()
+
+                    assert not http_client.is_closed
+        finally:
+            await server.shutdown()
+
+
+@pytest.mark.anyio
+async def test_mcpclient_connect_rejects_auth_with_http_client() -> None:
+    """Headers and auth must live on the supplied http_client, not alongside it."""
+    async with httpx.AsyncClient() as http_client:
+        with pytest.raises(ValueError, match="http_client"):
+            await MCPClient.connect("http://localhost:8000/mcp", http_client=http_client, headers={"X-Test": "1"})
+
+
+@pytest.mark.anyio
+async def test_mcpclient_connect_rejects_timeouts_with_http_client() -> None:
+    """Timeouts would be silently ignored on a supplied http_client, so they are rejected."""
+    async with httpx.AsyncClient() as http_client:
+        with pytest.raises(ValueError, match="timeouts"):
+            await MCPClient.connect("http://localhost:8000/mcp", http_client=http_client, timeout=5)
+        with pytest.raises(ValueError, match="timeouts"):
+            await MCPClient.connect("http://localhost:8000/mcp", http_client=http_client, sse_read_timeout=60)
+
+
+@pytest.mark.anyio
+async def test_create_http_client_applies_mcp_defaults() -> None:
+    """The shared-pool helper sends the protocol version header and the SDK's timeouts."""
+    async with create_http_client(headers={"X-Test": "1"}) as http_client:
+        assert http_client.headers["mcp-protocol-version"]
+        assert http_client.headers["x-test"] == "1"
+        assert http_client.timeout == httpx.Timeout(30, read=300)
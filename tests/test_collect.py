@@ -89,6 +89,46 @@ class TestCollect:
         with pytest.raises(ValueError, match="has no Dedalus MCP metadata"):
             server.collect(not_decorated)
 
+    def test_collect_rejects_all_when_one_is_undecorated(self) -> None:
+        @tool(description="Add")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        def not_decorated() -> str:
+            return "plain function"
+
+        server = MCPServer("test")
+
+        with pytest.raises(ValueError, match="has no Dedalus MCP metadata"):
+            server.collect(add, not_decorated)
+
+        assert server.tool_names == []
+
+    def test_collect_refreshes_tools_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        fns = []
+        for i in range(5):
+
+            @tool(name=f"t{i}")
+            def fn() -> int:
+                return 0
+
+            fns.append(fn)
+
+        server = MCPServer("test")
+        refreshes = 0
+        original = server.tools._refresh_tools
+
+        def counting_refresh() -> None:
+            nonlocal refreshes
+            refreshes += 1
+            original()
+
+        monkeypatch.setattr(server.tools, "_refresh_tools", counting_refresh)
+        server.collect(*fns)
+
+        assert refreshes == 1
+        assert server.tool_names == ["t0", "t1", "t2", "t3", "t4"]
+
     def test_collect_same_function_multiple_servers(self) -> None:
         @tool(description="Shared")
         def shared() -> str:
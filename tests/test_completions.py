@@ -13,7 +13,12 @@ import pytest
 
 from dedalus_mcp import MCPServer, completion
 from dedalus_mcp.completion import CompletionResult
-from dedalus_mcp.types.server.completions import CompletionArgument, CompletionContext, ResourceTemplateReference
+from dedalus_mcp.types.server.completions import (
+    Completion,
+    CompletionArgument,
+    CompletionContext,
+    ResourceTemplateReference,
+)
 from dedalus_mcp.types.server.prompts import PromptReference
 
 
@@ -62,6 +67,46 @@ async def test_resource_completion_limit_enforced() -> None:
     assert result.hasMore is True
 
 
+@pytest.mark.anyio
+async def test_completion_stops_consuming_past_limit() -> None:
+    """Providers may yield lazily; values beyond the limit are never pulled."""
+    server = MCPServer("comp-lazy")
+    pulled: list[int] = []
+
+    def candidates():
+        for i in range(10_000):
+            pulled.append(i)
+            yield f"item-{i}"
+
+    with server.binding():
+
+        @completion(resource="file:///{path}")
+        def path_completion(argument: CompletionArgument, context: CompletionContext | None):
+            return candidates()
+
+    ref = ResourceTemplateReference(type="ref/resource", uri="file:///{path}")
+    result = await server.invoke_completion(ref, CompletionArgument(name="path", value=""))
+    assert result is not None
+    assert len(result.values) == 100
+    assert result.hasMore is True
+    assert len(pulled) == 101
+
+
+@pytest.mark.anyio
+async def test_completion_model_within_limit_returned_as_is() -> None:
+    server = MCPServer("comp-model")
+    prebuilt = Completion(values=["a", "b"], total=2, hasMore=False)
+
+    with server.binding():
+
+        @completion(prompt="fixed")
+        def fixed(argument: CompletionArgument, context: CompletionContext | None):
+            return prebuilt
+
+    ref = PromptReference(type="ref/prompt", name="fixed")
+    assert await server.invoke_completion(ref, CompletionArgument(name="x", value="")) is prebuilt
+
+
 @pytest.mark.anyio
 async def test_missing_completion_returns_empty() -> None:
     """Unknown completions resolve to empty arrays as per spec tolerance."""
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import logging
+
 import pytest
 
 from dedalus_mcp import MCPServer, get_context, prompt, resource, tool
+from dedalus_mcp.context import RUNTIME_CONTEXT_KEY
 from dedalus_mcp.types.shared.base import RequestParams
 from tests.helpers import RecordingSession, run_with_context
 
@@ -44,6 +47,27 @@ async def test_tool_context_emits_logs_and_progress() -> None:
     assert session.progress_events[-1]["progress"] == pytest.approx(2)
 
 
+@pytest.mark.anyio
+async def test_tool_context_logs_respect_session_level() -> None:
+    server = MCPServer("ctx-tool-levels")
+
+    with server.binding():
+
+        @tool(description="logs at two levels")
+        async def sample() -> str:
+            ctx = get_context()
+            await ctx.debug("dropped", data={"big": "payload"})
+            await ctx.warning("kept")
+            return "ok"
+
+    session = RecordingSession("ctx-tool-levels")
+    lifespan = {RUNTIME_CONTEXT_KEY: {"server": server}}
+    server.logging_service._session_levels[session] = logging.WARNING  # type: ignore[attr-defined]
+    await run_with_context(session, server.tools.call_tool, "sample", {}, lifespan_context=lifespan)
+
+    assert [(level, data["msg"]) for level, data, _ in session.log_messages] == [("warning", "kept")]
+
+
 @pytest.mark.anyio
 async def test_tool_context_no_progress_token_is_noop() -> None:
     server = MCPServer("ctx-tool-no-progress")
@@ -95,6 +95,31 @@ class TestContextDispatch:
 
         assert result.success is True
 
+    @pytest.mark.asyncio
+    async def test_dispatch_many_preserves_request_order(self, context_with_backend, respx_mock):
+        """dispatch_many should return one response per request, in request order."""
+        import httpx
+
+        respx_mock.get("https://example.com/user").mock(return_value=httpx.Response(200, json={"login": "octo"}))
+        respx_mock.get("https://example.com/user/repos").mock(return_value=httpx.Response(200, json=[]))
+
+        user, repos = await context_with_backend.dispatch_many(
+            [HttpRequest(method=HttpMethod.GET, path="/user"), HttpRequest(method=HttpMethod.GET, path="/user/repos")],
+            target="github",
+        )
+
+        assert user.response.body == {"login": "octo"}
+        assert repos.response.body == []
+
+    @pytest.mark.asyncio
+    async def test_dispatch_many_unknown_target_raises_resolution_error(self, context_with_backend):
+        """An unresolvable target should raise ConnectionResolutionError, not an ExceptionGroup."""
+        with pytest.raises(ConnectionResolutionError):
+            await context_with_backend.dispatch_many(
+                [HttpRequest(method=HttpMethod.GET, path="/user"), HttpRequest(method=HttpMethod.GET, path="/orgs")],
+                target="gitlab",
+            )
+
     @pytest.mark.asyncio
     async def test_dispatch_invalid_handle_format_rejected(self, backend, auth_context):
         """Dispatch with invalid handle format should be rejected."""
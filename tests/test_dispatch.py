@@ -143,6 +143,180 @@ class TestDirectDispatchBackend:
         assert result.response.status == 200
         assert result.response.body == {"login": "testuser"}
 
+    @pytest.mark.asyncio
+    async def test_direct_dispatch_reuses_pooled_client(self, respx_mock):
+        """Consecutive dispatches should share one HTTP client until aclose()."""
+        import httpx
+
+        from dedalus_mcp.dispatch import DirectDispatchBackend, DispatchWireRequest, HttpMethod, HttpRequest
+
+        respx_mock.get("https://api.github.com/user").mock(return_value=httpx.Response(200, json={"login": "testuser"}))
+        backend = DirectDispatchBackend(
+            credential_resolver=lambda _handle: ("https://api.github.com", "Authorization", "Bearer test_token")
+        )
+        wire = DispatchWireRequest(
+            connection_handle="ddls:conn:github", request=HttpRequest(method=HttpMethod.GET, path="/user")
+        )
+
+        await backend.dispatch(wire)
+        client = backend._client
+        await backend.dispatch(wire)
+
+        assert client is not None
+        assert backend._client is client
+
+        await backend.aclose()
+        assert client.is_closed
+        assert backend._client is None
+
+    @pytest.mark.asyncio
+    async def test_direct_dispatch_pooled_client_keeps_no_cookies(self, respx_mock):
+        """Set-Cookie from one downstream response must not ride along on later requests."""
+        import httpx
+
+        from dedalus_mcp.dispatch import DirectDispatchBackend, DispatchWireRequest, HttpMethod, HttpRequest
+
+        route = respx_mock.get("https://api.github.com/user").mock(
+            return_value=httpx.Response(200, json={}, headers={"set-cookie": "session=alice; Path=/"})
+        )
+        backend = DirectDispatchBackend(
+            credential_resolver=lambda _handle: ("https://api.github.com", "Authorization", "Bearer test_token")
+        )
+        wire = DispatchWireRequest(
+            connection_handle="ddls:conn:github", request=HttpRequest(method=HttpMethod.GET, path="/user")
+        )
+
+        await backend.dispatch(wire)
+        await backend.dispatch(wire)
+        await backend.aclose()
+
+        assert "cookie" not in route.calls.last.request.headers
+
+    @pytest.mark.asyncio
+    async def test_direct_dispatch_uses_injected_client(self, respx_mock, monkeypatch):
+        """A caller-supplied client is used for requests and left open on aclose()."""
+        import httpx
+
+        from dedalus_mcp import Connection, MCPServer, SecretKeys
+        from dedalus_mcp.dispatch import DispatchWireRequest, HttpMethod, HttpRequest
+
+        monkeypatch.delenv("DEDALUS_DISPATCH_URL", raising=False)
+        respx_mock.get("https://api.github.com/user").mock(return_value=httpx.Response(200, json={"login": "testuser"}))
+
+        async with httpx.AsyncClient() as shared:
+            github = Connection("github", secrets=SecretKeys(token="GITHUB_TOKEN"))
+            server = MCPServer("pooled", connections=[github], http_client=shared)
+            server._build_runtime_payload()
+            backend = server._dispatch_backend
+            backend._resolver = lambda _handle: ("https://api.github.com", "Authorization", "Bearer test_token")
+
+            result = await backend.dispatch(
+                DispatchWireRequest(
+                    connection_handle="ddls:conn:github", request=HttpRequest(method=HttpMethod.GET, path="/user")
+                )
+            )
+            await backend.aclose()
+
+            assert result.success
+            assert backend._client is shared
+            assert not shared.is_closed
+
+    @pytest.mark.asyncio
+    async def test_direct_dispatch_injected_client_keeps_no_cookies(self, respx_mock):
+        """An injected client's jar is left in place, but nothing in it is sent, since it is shared across callers."""
+        import httpx
+
+        from dedalus_mcp.dispatch import DirectDispatchBackend, DispatchWireRequest, HttpMethod, HttpRequest
+
+        route = respx_mock.get("https://api.github.com/user").mock(
+            return_value=httpx.Response(200, json={}, headers={"set-cookie": "session=alice; Path=/"})
+        )
+        async with httpx.AsyncClient(cookies={"owner": "caller"}) as shared:
+            jar = shared.cookies.jar
+            backend = DirectDispatchBackend(
+                credential_resolver=lambda _handle: ("https://api.github.com", "Authorization", "Bearer test_token"),
+                http_client=shared,
+            )
+            wire = DispatchWireRequest(
+                connection_handle="ddls:conn:github", request=HttpRequest(method=HttpMethod.GET, path="/user")
+            )
+            await backend.dispatch(wire)
+            await backend.dispatch(wire)
+
+            assert shared.cookies.jar is jar
+            assert shared.cookies.get("owner") == "caller"
+        assert "cookie" not in route.calls.last.request.headers
+
+    @pytest.mark.asyncio
+    async def test_direct_dispatch_keeps_explicit_cookie_header(self, respx_mock):
+        """A Cookie header the tool sets itself is sent as given."""
+        import httpx
+
+        from dedalus_mcp.dispatch import DirectDispatchBackend, DispatchWireRequest, HttpMethod, HttpRequest
+
+        route = respx_mock.get("https://api.github.com/user").mock(return_value=httpx.Response(200, json={}))
+        async with httpx.AsyncClient(cookies={"owner": "caller"}) as shared:
+            backend = DirectDispatchBackend(
+                credential_resolver=lambda _handle: ("https://api.github.com", "Authorization", "Bearer test_token"),
+                http_client=shared,
+            )
+            await backend.dispatch(
+                DispatchWireRequest(
+                    connection_handle="ddls:conn:github",
+                    request=HttpRequest(method=HttpMethod.GET, path="/user", headers={"Cookie": "tool=1"}),
+                )
+            )
+
+        assert route.calls.last.request.headers["cookie"] == "tool=1"
+
+    @pytest.mark.asyncio
+    async def test_server_warmup_opens_connection_base_urls(self, respx_mock, monkeypatch):
+        """Startup warm-up pings each connection's base URL and tolerates failures."""
+        import httpx
+
+        from dedalus_mcp import Connection, MCPServer, SecretKeys
+
+        monkeypatch.delenv("DEDALUS_DISPATCH_URL", raising=False)
+        github = respx_mock.head("https://api.github.com").mock(return_value=httpx.Response(200))
+        down = respx_mock.head("https://down.example.com").mock(side_effect=httpx.ConnectError("refused"))
+
+        server = MCPServer(
+            "warm",
+            connections=[
+                Connection("github", secrets=SecretKeys(token="GITHUB_TOKEN"), base_url="https://api.github.com"),
+                Connection("down", secrets=SecretKeys(token="DOWN_TOKEN"), base_url="https://down.example.com"),
+            ],
+        )
+        await server._warmup()
+        await server._dispatch_backend.aclose()
+
+        assert github.called
+        assert down.called
+
+    @pytest.mark.asyncio
+    async def test_server_skips_warmup_unless_enabled(self, respx_mock, monkeypatch):
+        """Serving sends no warm-up requests unless warm_connections=True."""
+        import httpx
+
+        from dedalus_mcp import Connection, MCPServer, SecretKeys
+
+        monkeypatch.delenv("DEDALUS_DISPATCH_URL", raising=False)
+        github = respx_mock.head("https://api.github.com").mock(return_value=httpx.Response(200))
+
+        class _NoopTransport:
+            async def run(self, **_kwargs):
+                return None
+
+        server = MCPServer(
+            "cold",
+            connections=[
+                Connection("github", secrets=SecretKeys(token="GITHUB_TOKEN"), base_url="https://api.github.com")
+            ],
+        )
+        await server._run_transport(_NoopTransport())  # type: ignore[arg-type]
+
+        assert not github.called
+
     @pytest.mark.asyncio
     async def test_direct_dispatch_no_resolver(self):
         """Dispatch without credential resolver should fail."""
@@ -214,6 +388,31 @@ class TestEnclaveDispatchBackend:
         assert result.response.status == 201
         assert result.response.body == {"created": True}
 
+    @pytest.mark.asyncio
+    async def test_enclave_dispatch_pooled_client_keeps_no_cookies(self, respx_mock):
+        """The gateway's pooled client is shared across tenants, so it must not replay Set-Cookie."""
+        import httpx
+
+        from dedalus_mcp.dispatch import DispatchWireRequest, EnclaveDispatchBackend, HttpMethod, HttpRequest
+
+        route = respx_mock.post("https://enclave.example.com/dispatch").mock(
+            return_value=httpx.Response(
+                200,
+                json={"success": True, "response": {"status": 200, "headers": {}, "body": None}},
+                headers={"set-cookie": "gw=tenant-a; Path=/"},
+            )
+        )
+        backend = EnclaveDispatchBackend(enclave_url="https://enclave.example.com", access_token="test_token")
+        wire = DispatchWireRequest(
+            connection_handle="ddls:conn:01ABC-github", request=HttpRequest(method=HttpMethod.GET, path="/user")
+        )
+
+        await backend.dispatch(wire)
+        await backend.dispatch(wire)
+        await backend.aclose()
+
+        assert "cookie" not in route.calls.last.request.headers
+
     @pytest.mark.asyncio
     async def test_enclave_dispatch_includes_dpop_header(self, respx_mock):
         """Enclave dispatch should include DPoP proof header when key provided."""
@@ -515,6 +714,74 @@ class TestDirectDispatchBackendHTTPErrors:
         assert captured is not None
         assert captured.content == b"raw text payload"
 
+    @pytest.mark.asyncio
+    async def test_dispatch_with_json_body(self, respx_mock):
+        """Dict bodies are sent as compact JSON with a JSON content type."""
+        import json
+
+        import httpx
+
+        from dedalus_mcp.dispatch import DirectDispatchBackend, DispatchWireRequest, HttpMethod, HttpRequest
+
+        captured = None
+
+        def capture(request):
+            nonlocal captured
+            captured = request
+            return httpx.Response(200, json={"ok": True})
+
+        respx_mock.post("https://api.example.com/issues").mock(side_effect=capture)
+
+        def resolver(handle: str) -> tuple[str, str, str]:
+            return ("https://api.example.com", "Authorization", "Bearer token")
+
+        backend = DirectDispatchBackend(credential_resolver=resolver)
+        result = await backend.dispatch(
+            DispatchWireRequest(
+                connection_handle="ddls:conn:api",
+                request=HttpRequest(method=HttpMethod.POST, path="/issues", body={"title": "Bug", "labels": ["ü"]}),
+            )
+        )
+
+        assert captured is not None
+        assert captured.headers["Content-Type"] == "application/json"
+        assert json.loads(captured.content) == {"title": "Bug", "labels": ["ü"]}
+        assert result.success
+        assert result.response.body == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_dispatch_json_body_with_wide_integer(self, respx_mock):
+        """Integers orjson can't encode still go out as JSON via the stdlib fallback."""
+        import json
+
+        import httpx
+
+        from dedalus_mcp.dispatch import DirectDispatchBackend, DispatchWireRequest, HttpMethod, HttpRequest
+
+        captured = None
+
+        def capture(request):
+            nonlocal captured
+            captured = request
+            return httpx.Response(200, json={"ok": True})
+
+        respx_mock.post("https://api.example.com/big").mock(side_effect=capture)
+
+        def resolver(handle: str) -> tuple[str, str, str]:
+            return ("https://api.example.com", "Authorization", "Bearer token")
+
+        backend = DirectDispatchBackend(credential_resolver=resolver)
+        result = await backend.dispatch(
+            DispatchWireRequest(
+                connection_handle="ddls:conn:api",
+                request=HttpRequest(method=HttpMethod.POST, path="/big", body={"id": 2**70}),
+            )
+        )
+
+        assert result.success
+        assert captured is not None
+        assert json.loads(captured.content) == {"id": 2**70}
+
     @pytest.mark.asyncio
     async def test_dispatch_malformed_json_response(self, respx_mock):
         """Malformed JSON should fallback to text."""
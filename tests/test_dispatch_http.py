@@ -96,6 +96,19 @@ class TestHttpRequest:
 
         assert req.path == "/search?q=foo&limit=10"
 
+    def test_path_query_escapes_not_double_encoded(self):
+        """Already percent-encoded queries pass through; bare spaces and % are encoded."""
+        from urllib.parse import quote, urlencode
+
+        from dedalus_mcp.dispatch import HttpMethod, HttpRequest
+
+        query = urlencode({"name": "eq.A&B Co", "select": "id,name"}, quote_via=quote, safe=",")
+        req = HttpRequest(method=HttpMethod.GET, path=f"/rest/v1/orgs?{query}")
+        assert req.path == "/rest/v1/orgs?name=eq.A%26B%20Co&select=id,name"
+
+        req = HttpRequest(method=HttpMethod.GET, path="/search?q=100% off")
+        assert req.path == "/search?q=100%25%20off"
+
     def test_authorization_header_forbidden(self):
         """Cannot override Authorization header."""
         from dedalus_mcp.dispatch import HttpMethod, HttpRequest
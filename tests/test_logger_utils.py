@@ -10,7 +10,14 @@ from typing import Any
 
 import pytest
 
-from dedalus_mcp.utils.logger import ColoredFormatter, PlainFormatter, StructuredJSONFormatter, get_logger, setup_logger
+from dedalus_mcp.utils.logger import (
+    ColoredFormatter,
+    PlainFormatter,
+    StructuredJSONFormatter,
+    get_logger,
+    quiet_third_party,
+    setup_logger,
+)
 
 
 def _capture_logging(level: int, *, use_json: bool, **kwargs: Any) -> list[str]:
@@ -98,3 +105,18 @@ def test_colored_formatter_appends_duration_suffix() -> None:
     rendered = formatter.format(record)
 
     assert "[7.00 ms]" in rendered
+
+
+def test_quiet_third_party_sets_levels() -> None:
+    names = ("dedalus_mcp.test.vendor_a", "dedalus_mcp.test.vendor_b")
+
+    quiet_third_party(names=names)
+    assert all(logging.getLogger(name).level == logging.WARNING for name in names)
+
+    quiet_third_party("error", names=names)
+    assert all(logging.getLogger(name).level == logging.ERROR for name in names)
+
+    # A level changed elsewhere in between is restored by the next call
+    logging.getLogger(names[0]).setLevel(logging.DEBUG)
+    quiet_third_party("error", names=names)
+    assert logging.getLogger(names[0]).level == logging.ERROR
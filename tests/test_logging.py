@@ -114,3 +114,22 @@ async def test_logging_manual_emit_overrides() -> None:
     assert note.params.level == "warning"
     assert note.params.logger == "demo"
     assert note.params.data == {"message": "explicit"}
+
+
+@pytest.mark.anyio
+async def test_logging_records_skip_dispatch_without_subscribers() -> None:
+    server = MCPServer("logging-idle")
+    calls: list[logging.LogRecord] = []
+
+    async def wrapper(record: logging.LogRecord) -> None:
+        calls.append(record)
+
+    original = server.logging_service.handle_log_record
+    server.logging_service.handle_log_record = wrapper  # type: ignore[assignment]
+    try:
+        server._logger.error("nobody listening")
+        await anyio.sleep(0.05)
+    finally:
+        server.logging_service.handle_log_record = original  # type: ignore[assignment]
+
+    assert calls == []
@@ -15,6 +15,7 @@ import pytest
 
 from dedalus_mcp import MCPServer, prompt
 from dedalus_mcp.server import NotificationFlags
+from dedalus_mcp.types import GetPromptResult, PromptMessage, TextContent
 from dedalus_mcp.types.server.prompts import ListPromptsRequest
 from dedalus_mcp.types.shared.base import INVALID_PARAMS, PaginatedRequestParams
 from tests.helpers import DummySession, run_with_context
@@ -85,6 +86,31 @@ async def test_prompt_custom_mapping_result() -> None:
     assert result.messages[0].role == "assistant"
 
 
+@pytest.mark.anyio
+async def test_prompt_prebuilt_result_reused() -> None:
+    server = MCPServer("prompts-prebuilt")
+    prebuilt = GetPromptResult(
+        description="Fixed", messages=[PromptMessage(role="user", content=TextContent(type="text", text="hi"))]
+    )
+    untitled = GetPromptResult(messages=prebuilt.messages)
+
+    with server.binding():
+
+        @prompt("fixed")
+        def _fixed(arguments: dict[str, str]):
+            return prebuilt
+
+        @prompt("untitled", description="From spec")
+        def _untitled(arguments: dict[str, str]):
+            return untitled
+
+    assert await server.invoke_prompt("fixed") is prebuilt
+
+    filled = await server.invoke_prompt("untitled")
+    assert filled.description == "From spec"
+    assert untitled.description is None
+
+
 @pytest.mark.anyio
 async def test_prompt_none_result_produces_empty_messages() -> None:
     server = MCPServer("prompts-none")
@@ -187,6 +187,25 @@ async def test_resource_subscription_duplicate_registration():
     assert len(subscribers) == 1
 
 
+@pytest.mark.anyio
+async def test_resource_subscription_batched_updates_dedupe_uris():
+    server = MCPServer("resources-batch")
+    session = DummySession("batch")
+    failing = FailingSession()
+
+    await run_with_context(session, server.resources.subscribe_current, "resource://demo/a")
+    await run_with_context(session, server.resources.subscribe_current, "resource://demo/b")
+    await run_with_context(failing, server.resources.subscribe_current, "resource://demo/a")
+    await run_with_context(failing, server.resources.subscribe_current, "resource://demo/b")
+
+    await server.notify_resources_updated(["resource://demo/a", "resource://demo/b", "resource://demo/a"])
+
+    assert [str(note.root.params.uri) for note in session.notifications] == ["resource://demo/a", "resource://demo/b"]
+    assert failing.failures == 1
+    _, by_session = await server.resources.subscriptions.snapshot()
+    assert failing not in by_session
+
+
 @pytest.mark.anyio
 async def test_resource_subscription_garbage_collection_cleanup():
     server = MCPServer("resources-gc")
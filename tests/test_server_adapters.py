@@ -7,7 +7,7 @@ import base64
 from dataclasses import dataclass
 import json
 
-from dedalus_mcp.server.result_normalizers import normalize_resource_payload, normalize_tool_result
+from dedalus_mcp.server.result_normalizers import _stdlib_dumps, normalize_resource_payload, normalize_tool_result
 from dedalus_mcp.types.server.resources import ReadResourceResult
 from dedalus_mcp.types.server.tools import CallToolResult
 from dedalus_mcp.types.shared.content import BlobResourceContents, TextContent, TextResourceContents
@@ -72,7 +72,7 @@ def test_normalize_tool_result_dataclass() -> None:
 
     output = normalize_tool_result(Result(total=5))
     assert output.structuredContent == {"total": 5}
-    assert output.content[0].text == json.dumps({"total": 5})
+    assert output.content[0].text == '{"total":5}'
 
 
 def test_normalize_tool_result_scalar() -> None:
@@ -81,10 +81,37 @@ def test_normalize_tool_result_scalar() -> None:
     assert result.content[0].text == "42"
 
 
+def test_normalize_tool_result_nested_mixed_values() -> None:
+    @dataclass
+    class Point:
+        x: int
+        y: float
+
+    payload = {"points": [Point(x=1, y=2.5)], "flags": [True, None], "label": "origin"}
+    result = normalize_tool_result(payload)
+    assert json.loads(result.content[0].text) == {
+        "points": [{"x": 1, "y": 2.5}],
+        "flags": [True, None],
+        "label": "origin",
+    }
+
+
 def test_normalize_resource_payload_dataclass() -> None:
     @dataclass
     class Resource:
         message: str
 
     out = normalize_resource_payload("resource://demo/dataclass", None, Resource(message="hi"))
-    assert out.contents[0].text == json.dumps({"message": "hi"})
+    assert out.contents[0].text == '{"message":"hi"}'
+
+
+def test_normalize_tool_result_text_handles_wide_integers() -> None:
+    result = normalize_tool_result({"big": 2**70, "name": "café"})
+    assert result.content[0].text == f'{{"big":{2**70},"name":"café"}}'
+
+
+def test_normalize_tool_result_text_is_backend_independent() -> None:
+    payload = {"tiny": 1e-7, "huge": 1e16, "nan": float("nan"), "inf": [float("-inf")], "n": 3}
+    text = normalize_tool_result(payload).content[0].text
+    assert text == _stdlib_dumps(payload)
+    assert text == '{"tiny":1e-07,"huge":1e+16,"nan":null,"inf":[null],"n":3}'
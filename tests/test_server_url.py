@@ -35,7 +35,7 @@ class TestMCPServerURL:
         server.collect(dummy_tool)
 
         serve_task = asyncio.create_task(server.serve(host="127.0.0.1", port=18765, verbose=False))
-        await asyncio.sleep(0.3)
+        await server.wait_until_ready()
 
         try:
             assert server.url == "http://127.0.0.1:18765/mcp"
@@ -54,7 +54,7 @@ class TestMCPServerURL:
         server.collect(dummy_tool)
 
         serve_task = asyncio.create_task(server.serve(host="127.0.0.1", port=18766, verbose=False))
-        await asyncio.sleep(0.3)
+        await server.wait_until_ready()
         assert server.url is not None
 
         await server.shutdown()
@@ -67,6 +67,13 @@ class TestMCPServerURL:
         await asyncio.sleep(0.1)
         assert server.url is None
 
+    @pytest.mark.asyncio
+    async def test_wait_until_ready_times_out_when_not_serving(self) -> None:
+        """Readiness wait gives up instead of hanging when nothing was started."""
+        server = MCPServer("test-server")
+        with pytest.raises(TimeoutError):
+            await server.wait_until_ready(timeout=0.05)
+
     def test_url_reflects_custom_port(self) -> None:
         """Custom port appears in URL."""
         server = MCPServer("test-server")
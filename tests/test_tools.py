@@ -9,6 +9,7 @@ from typing import Any, Literal
 from mcp.shared.exceptions import McpError
 import pytest
 
+from dedalus_mcp.context import Context  # resolved at runtime for injection
 from dedalus_mcp.server import MCPServer, NotificationFlags
 from dedalus_mcp.tool import tool
 from dedalus_mcp.types.server.tools import ListToolsRequest
@@ -88,6 +89,112 @@ async def test_registering_outside_binding():
     assert result.structuredContent == {"result": 12}
 
 
+def test_tool_names_cached_until_tools_change():
+    server = MCPServer("names")
+
+    with server.binding():
+
+        @tool()
+        def beta() -> str:
+            return "b"
+
+        @tool()
+        def alpha() -> str:
+            return "a"
+
+    names = server.tool_names
+    assert names == ["alpha", "beta"]
+    names.append("mutated")
+    assert server.tool_names == ["alpha", "beta"]
+
+    server.tools.allow_tools(["beta"])
+    assert server.tool_names == ["beta"]
+
+
+@pytest.mark.asyncio
+async def test_remove_tool_unregisters_only_that_tool():
+    server = MCPServer("remove")
+
+    with server.binding():
+
+        @tool()
+        def keep() -> str:
+            return "kept"
+
+        @tool()
+        def drop() -> str:
+            return "dropped"
+
+    assert server.remove_tool("drop") is True
+    assert server.remove_tool("drop") is False
+    assert server.tool_names == ["keep"]
+    assert "drop" not in server.tools.definitions
+    assert not hasattr(server, "drop")
+
+    result = await server.invoke_tool("drop")
+    assert result.isError
+
+    @tool()
+    def later() -> str:
+        return "later"
+
+    server.register_tool(later)
+    assert server.tool_names == ["keep", "later"]
+
+
+def test_tool_definitions_reused_across_refresh():
+    server = MCPServer("demo")
+
+    @tool()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @tool()
+    def multiply(a: int, b: int) -> int:
+        return a * b
+
+    server.collect(add)
+    first = server.tools.definitions["add"]
+
+    server.collect(multiply)
+    server.allow_tools(["add"])
+    assert server.tools.definitions["add"] is first
+
+    server.allow_tools(None)
+
+    @tool(description="Adds, redefined")
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    server.collect(add)
+    assert server.tools.definitions["add"] is not first
+    assert server.tools.definitions["add"].description == "Adds, redefined"
+
+
+class Weird:
+    """A parameter type pydantic cannot build a schema for."""
+
+
+def test_unschematizable_tool_fails_at_registration():
+    from pydantic.errors import PydanticSchemaGenerationError
+
+    server = MCPServer("weird")
+
+    @tool()
+    def ok() -> str:
+        return "ok"
+
+    @tool()
+    def odd(value: Weird) -> str:
+        return "odd"
+
+    server.collect(ok)
+    with pytest.raises(PydanticSchemaGenerationError):
+        server.collect(odd)
+    assert server.tool_names == ["ok"]
+    assert list(server.tools.definitions) == ["ok"]
+
+
 @pytest.mark.asyncio
 async def test_serve_dispatch(monkeypatch):
     http_server = MCPServer("demo-http")
@@ -143,6 +250,27 @@ async def test_serve_dispatch(monkeypatch):
         await http_server.serve(transport="unknown")
 
 
+@pytest.mark.asyncio
+async def test_context_parameter_injected_and_hidden_from_schema():
+    """``ctx: Context`` is filled by the server and never appears in the input schema."""
+    server = MCPServer("context-injection")
+
+    with server.binding():
+
+        @tool()
+        async def whoami(name: str, ctx: Context) -> str:
+            return f"{name}:{ctx.request_id}"
+
+    schema = server.tools.definitions["whoami"].inputSchema
+    assert set(schema["properties"]) == {"name"}
+    assert schema["required"] == ["name"]
+
+    session = DummySession("context-injection")
+    result = await run_with_context(session, server.tools.call_tool, "whoami", {"name": "ada"})
+    assert not result.isError
+    assert result.content[0].text.startswith("ada:")
+
+
 def test_type_adapter_schema():
     server = MCPServer("schema")
 
@@ -275,10 +403,7 @@ async def test_tools_metadata_with_typed_annotations():
 
     with server.binding():
 
-        @tool(
-            description="A read-only tool",
-            annotations=ToolAnnotations(readOnlyHint=True, destructiveHint=False),
-        )
+        @tool(description="A read-only tool", annotations=ToolAnnotations(readOnlyHint=True, destructiveHint=False))
         def read_only_op() -> str:
             return "data"
 
@@ -299,10 +424,7 @@ async def test_tools_metadata_with_typed_icons():
 
         @tool(
             description="Tool with icons",
-            icons=[
-                Icon(src="file:///primary.png", mimeType="image/png"),
-                Icon(src="file:///secondary.svg"),
-            ],
+            icons=[Icon(src="file:///primary.png", mimeType="image/png"), Icon(src="file:///secondary.svg")],
         )
         def iconified() -> str:
             return "ok"
@@ -325,10 +447,7 @@ async def test_tools_metadata_annotations_from_dict():
 
     with server.binding():
 
-        @tool(
-            description="Dict-style annotations",
-            annotations={"idempotentHint": True},
-        )
+        @tool(description="Dict-style annotations", annotations={"idempotentHint": True})
         def dict_style() -> str:
             return "ok"
 
@@ -346,10 +465,7 @@ async def test_tools_metadata_icons_from_dict():
 
     with server.binding():
 
-        @tool(
-            description="Dict-style icons",
-            icons=[{"src": "file:///icon.png", "mimeType": "image/png"}],
-        )
+        @tool(description="Dict-style icons", icons=[{"src": "file:///icon.png", "mimeType": "image/png"}])
         def dict_icons() -> str:
             return "ok"
 
@@ -580,13 +696,7 @@ async def test_tool_with_required_scopes_allowed():
     auth = MockAuthContext(subject="user", scopes=["read:data", "write:data"], claims={})
     scope = {"dedalus_mcp.auth": auth}
 
-    result = await run_with_context(
-        session,
-        server.tools.call_tool,
-        "read_data",
-        {},
-        request_scope=scope,
-    )
+    result = await run_with_context(session, server.tools.call_tool, "read_data", {}, request_scope=scope)
 
     assert not result.isError
     assert result.content[0].text == "secret"
@@ -607,13 +717,7 @@ async def test_tool_with_required_scopes_denied():
     auth = MockAuthContext(subject="user", scopes=["read:data"], claims={})
     scope = {"dedalus_mcp.auth": auth}
 
-    result = await run_with_context(
-        session,
-        server.tools.call_tool,
-        "delete_everything",
-        {},
-        request_scope=scope,
-    )
+    result = await run_with_context(session, server.tools.call_tool, "delete_everything", {}, request_scope=scope)
 
     assert result.isError
     assert "admin:delete" in result.content[0].text
@@ -636,13 +740,7 @@ async def test_tool_with_multiple_required_scopes():
     auth = MockAuthContext(subject="user", scopes=["scope:a", "scope:b"], claims={})
     scope = {"dedalus_mcp.auth": auth}
 
-    result = await run_with_context(
-        session,
-        server.tools.call_tool,
-        "multi_scope_tool",
-        {},
-        request_scope=scope,
-    )
+    result = await run_with_context(session, server.tools.call_tool, "multi_scope_tool", {}, request_scope=scope)
 
     assert result.isError
     assert "scope:c" in result.content[0].text
@@ -664,13 +762,7 @@ async def test_tool_without_required_scopes_ignores_auth():
     auth = MockAuthContext(subject="user", scopes=[], claims={})
     scope = {"dedalus_mcp.auth": auth}
 
-    result = await run_with_context(
-        session,
-        server.tools.call_tool,
-        "public_tool",
-        {},
-        request_scope=scope,
-    )
+    result = await run_with_context(session, server.tools.call_tool, "public_tool", {}, request_scope=scope)
 
     assert not result.isError
     assert result.content[0].text == "public"